@@ -0,0 +1,43 @@
+"""
+Benchmark of the curvature engines: coordinate (Christoffel) route vs Cartan's structure equations in an orthonormal frame.
+
+    python -m benchmarks.bench_cartan
+"""
+
+# Standard Library
+from timeit import default_timer
+
+# This Module
+from relativisticpy.core import Metric, MetricIndices, Idx
+from relativisticpy.gr.curvature import Curvature
+from relativisticpy.symengine import Symbol, Function, SymbolArray, sin
+
+
+def schwarzschild() -> Metric:
+    t, r, theta, phi, M = Symbol("t"), Symbol("r"), Symbol("theta"), Symbol("phi"), Symbol("M")
+    components = SymbolArray([[-(1 - 2*M/r), 0, 0, 0], [0, 1/(1 - 2*M/r), 0, 0], [0, 0, r**2, 0], [0, 0, 0, r**2*sin(theta)**2]])
+    return Metric(MetricIndices(Idx('a'), Idx('b')), components, SymbolArray([t, r, theta, phi]))
+
+
+def spherically_symmetric() -> Metric:
+    """ General time dependent spherically symmetric metric: diagonal, three free functions of (t, r). """
+    t, r, theta, phi = Symbol("t"), Symbol("r"), Symbol("theta"), Symbol("phi")
+    A, B, C = [Function(name)(t, r) for name in ("A", "B", "C")]
+    components = SymbolArray([[-A, 0, 0, 0], [0, B, 0, 0], [0, 0, C, 0], [0, 0, 0, C*sin(theta)**2]])
+    return Metric(MetricIndices(Idx('a'), Idx('b')), components, SymbolArray([t, r, theta, phi]))
+
+
+def main():
+    for name, metric in (("Schwarzschild", schwarzschild), ("A, B, C(t, r)", spherically_symmetric)):
+        for engine in Curvature.ENGINES:
+            curvature = Curvature.of(metric(), engine=engine)
+            start = default_timer()
+            curvature.ricci
+            ricci = default_timer() - start
+            curvature.einstein
+            einstein = default_timer() - start
+            print(f"{name:<14} {engine:<11} {ricci:6.2f} s to Ricci   {einstein:6.2f} s to the Einstein tensor")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Benchmark of common subexpression elimination: size of the compact curvature stages (operation count) and time to the viewed Einstein tensor.
+
+    python -m benchmarks.bench_cse
+"""
+
+# Standard Library
+from timeit import default_timer
+
+# This Module
+from relativisticpy.core import Metric, MetricIndices, Indices, Idx
+from relativisticpy.core.simplification import Simplifier, using
+from relativisticpy.gr import EinsteinTensor
+from relativisticpy.gr.curvature import Curvature
+from relativisticpy.symengine import Symbol, Function, SymbolArray, count_ops, sin
+
+
+def spherically_symmetric() -> Metric:
+    """ General time dependent spherically symmetric metric: three free functions of (t, r). """
+    t, r, theta, phi = Symbol("t"), Symbol("r"), Symbol("theta"), Symbol("phi")
+    A, B, C = [Function(name)(t, r) for name in ("A", "B", "C")]
+    components = SymbolArray([[-A, 0, 0, 0], [0, B, 0, 0], [0, 0, C, 0], [0, 0, 0, C*sin(theta)**2]])
+    return Metric(MetricIndices(Idx('a'), Idx('b')), components, SymbolArray([t, r, theta, phi]))
+
+
+def main():
+    for cse in (False, True):
+        with using(Simplifier(cse=cse)):
+            metric = spherically_symmetric()
+            start = default_timer()
+            curvature = Curvature.of(metric)
+            sizes = [sum([count_ops(value) for value in getattr(curvature, stage).values.values()]) for stage in ('connection', 'riemann0000', 'ricci', 'einstein')]
+            EinsteinTensor(Indices(-Idx('a'), -Idx('b')), metric).components
+            elapsed = default_timer() - start
+            print(f"cse={str(cse):<5}  ops connection {sizes[0]:4d}  riemann {sizes[1]:4d}  ricci {sizes[2]:4d}  einstein {sizes[3]:4d}   ({elapsed:.2f} s to the viewed Einstein tensor)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark of the free-symbol dependency index: diff calls requested by the curvature kernels vs diff calls actually made.
+
+    python -m benchmarks.bench_dependency
+"""
+
+# Standard Library
+from timeit import default_timer
+
+# This Module
+from relativisticpy.core import Metric, MetricIndices, Idx, dependency, jet
+from relativisticpy.gr.curvature import Curvature
+from relativisticpy.symengine import Symbol, Function, SymbolArray, sin
+
+
+class Counter:
+    def __init__(self, function):
+        self.function = function
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        return self.function(*args)
+
+
+def schwarzschild() -> Metric:
+    t, r, theta, phi, M = Symbol("t"), Symbol("r"), Symbol("theta"), Symbol("phi"), Symbol("M")
+    components = SymbolArray([[-(1 - 2*M/r), 0, 0, 0], [0, 1/(1 - 2*M/r), 0, 0], [0, 0, r**2, 0], [0, 0, 0, r**2*sin(theta)**2]])
+    return Metric(MetricIndices(Idx('a'), Idx('b')), components, SymbolArray([t, r, theta, phi]))
+
+
+def flrw() -> Metric:
+    t, x, y, z = Symbol("t"), Symbol("x"), Symbol("y"), Symbol("z")
+    a = Function("a")(t)
+    return Metric(MetricIndices(Idx('a'), Idx('b')), SymbolArray([[-1, 0, 0, 0], [0, a**2, 0, 0], [0, 0, a**2, 0], [0, 0, 0, a**2]]), SymbolArray([t, x, y, z]))
+
+
+def main():
+    requested, made = Counter(jet.derivative), Counter(dependency.diff)
+    jet.derivative, dependency.diff = requested, made
+    try:
+        for name, metric in (("Schwarzschild", schwarzschild()), ("FLRW", flrw())):
+            requested.calls = made.calls = 0
+            start = default_timer()
+            Curvature.of(metric).einstein
+            elapsed = default_timer() - start
+            print(f"{name:<14} derivatives requested {requested.calls:4d}   diff calls {made.calls:4d}   ({elapsed:.2f} s to the Einstein tensor)")
+    finally:
+        jet.derivative, dependency.diff = requested.function, made.function
+
+
+if __name__ == "__main__":
+    main()
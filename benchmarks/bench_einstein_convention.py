@@ -0,0 +1,54 @@
+"""
+Benchmarks of the einstein convention additive and self-summed operations: compiled plans vs the Indices generators.
+
+    python -m benchmarks.bench_einstein_convention
+"""
+
+# Standard Library
+from timeit import timeit
+
+# This Module
+from relativisticpy.core import EinsteinArray, Indices, Idx
+from relativisticpy.symengine import Symbol, SymbolArray
+
+
+def tensor(indices, dimention: int, name: str) -> EinsteinArray:
+    basis = SymbolArray([Symbol(f"x{i}") for i in range(dimention)])
+    components = SymbolArray([Symbol(f"{name}{i}") for i in range(dimention ** len(indices))], (dimention,) * len(indices))
+    return EinsteinArray(Indices(*indices), components, basis)
+
+
+def additive_with_generator(A: EinsteinArray, B: EinsteinArray):
+    indices = A.indices.additive_product(B.indices)
+    zeros = indices.zeros_array()
+    for i in indices:
+        zeros[i] = sum([A.components[a] + B.components[b] for a, b in indices.generator(i)])
+    return zeros
+
+
+def selfsum_with_generator(T: EinsteinArray, indices: Indices):
+    result = indices.self_product()
+    zeros = result.zeros_array()
+    for i in result:
+        zeros[i] = sum([T.components[position] for position in result.generator(i)])
+    return zeros
+
+
+def main(dimention: int = 4, number: int = 3):
+    aligned = tensor((Idx("a"), Idx("b"), -Idx("c")), dimention, "a"), tensor((Idx("a"), Idx("b"), -Idx("c")), dimention, "b")
+    permuted = aligned[0], tensor((-Idx("c"), Idx("a"), Idx("b")), dimention, "b")
+    for name, (A, B) in (("aligned add", aligned), ("permuted add", permuted)):
+        generator = timeit(lambda: additive_with_generator(A, B), number=number) / number
+        plan = timeit(lambda: A + B, number=number) / number
+        print(f"{name:<16} generator {generator * 1e3:9.2f} ms   plan {plan * 1e3:9.2f} ms   x{generator / plan:.0f}")
+
+    T = tensor((Idx("a"), Idx("b"), Idx("c"), Idx("d")), dimention, "t")
+    traced = Indices(Idx("a"), -Idx("a"), Idx("c"), Idx("d"))
+    traced.basis = T.basis
+    generator = timeit(lambda: selfsum_with_generator(T, traced), number=number) / number
+    plan = timeit(lambda: EinsteinArray(Indices(Idx("a"), -Idx("a"), Idx("c"), Idx("d")), T.components, T.basis), number=number) / number
+    print(f"{'self trace':<16} generator {generator * 1e3:9.2f} ms   plan {plan * 1e3:9.2f} ms   x{generator / plan:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark of the numerical geodesic integrator: throughput, in geodesic-steps per second, of bound Schwarzschild orbits integrated as one batch
+versus one geodesic at a time, and the drift of the normalization constraint of each method.
+
+    python -m benchmarks.bench_geodesics
+"""
+
+# Standard Library
+from timeit import default_timer
+from typing import Tuple
+
+# External Modules
+import numpy as np
+
+# This Module
+from relativisticpy.core import Metric, MetricIndices, Idx
+from relativisticpy.gr.geodesics import GeodesicIntegrator, horizon
+from relativisticpy.symengine import Symbol, SymbolArray, sin
+
+
+def schwarzschild() -> Tuple[Metric, Symbol]:
+    t, r, theta, phi, M = Symbol("t"), Symbol("r"), Symbol("theta"), Symbol("phi"), Symbol("M")
+    f = 1 - 2 * M / r
+    components = SymbolArray([[-f, 0, 0, 0], [0, 1 / f, 0, 0], [0, 0, r**2, 0], [0, 0, 0, r**2 * sin(theta)**2]])
+    return Metric(MetricIndices(Idx('a'), Idx('b')), components, SymbolArray([t, r, theta, phi])), M
+
+
+def orbits(integrator: GeodesicIntegrator, n: int):
+    """ Eccentric orbits starting at their apoapsis r in [12, 20] M, with 95% of the angular velocity of the circular orbit. """
+    x = np.tile([0., 0., np.pi / 2, 0.], (n, 1))
+    x[:, 1] = np.linspace(12, 20, n)
+    spatial = np.zeros((n, 3))
+    spatial[:, 2] = 0.95 * np.sqrt(1 / x[:, 1]**3) / np.sqrt(1 - 3 / x[:, 1])
+    return integrator.state(x, spatial)
+
+
+def main(n: int = 10000, single: int = 20, tau: float = 200.):
+    metric, M = schwarzschild()
+    start = default_timer()
+    integrator = GeodesicIntegrator(metric, {M: 1})
+    print(f"compiled in {default_timer() - start:.2f} s, {len(integrator.kernel.nonzero)} non-zero Christoffel symbols")
+
+    states = orbits(integrator, n)
+    for method, step in (('rk45', None), ('rk4', 0.5), ('midpoint', 0.5)):
+        batch = integrator.integrate(states, tau, method=method, step=step, events=[horizon(2.)], record=False)
+        alone = [integrator.integrate(states[k], tau, method=method, step=step, events=[horizon(2.)], record=False) for k in range(0, n, n // single)]
+        steps, elapsed = sum([solution.steps.sum() for solution in alone]), sum([solution.elapsed for solution in alone])
+        print(f"{method:<9} batch of {n}: {batch.steps_per_second:10.3g} steps/s   one at a time: {steps / elapsed:10.3g} steps/s   "
+              f"max constraint drift {batch.drift.max():.1e}")
+
+
+if __name__ == "__main__":
+    main()
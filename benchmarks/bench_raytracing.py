@@ -0,0 +1,51 @@
+"""
+Benchmark of the ray tracer: shadow images of Schwarzschild and Kerr (a = 0.9 M) black holes, in rays and geodesic-steps per second,
+traced in process and across a process pool.
+
+    python -m benchmarks.bench_raytracing
+"""
+
+# Standard Library
+import os
+from timeit import default_timer
+
+# External Modules
+import numpy as np
+
+# This Module
+from relativisticpy.core import Metric, MetricIndices, Idx
+from relativisticpy.core.simplification import Simplifier, using
+from relativisticpy.gr.raytracing import RayTracer, Camera
+from relativisticpy.symengine import Symbol, SymbolArray, sin, cos
+
+
+def kerr(spin: Symbol) -> Metric:
+    """ Kerr metric in Boyer-Lindquist coordinates, M = 1. """
+    t, r, theta, phi = Symbol("t"), Symbol("r"), Symbol("theta"), Symbol("phi")
+    sigma, delta = r**2 + spin**2 * cos(theta)**2, r**2 - 2 * r + spin**2
+    g_tphi = -2 * spin * r * sin(theta)**2 / sigma
+    components = SymbolArray([
+        [-(1 - 2 * r / sigma), 0, 0, g_tphi],
+        [0, sigma / delta, 0, 0],
+        [0, 0, sigma, 0],
+        [g_tphi, 0, 0, (r**2 + spin**2 + 2 * spin**2 * r * sin(theta)**2 / sigma) * sin(theta)**2],
+    ])
+    return Metric(MetricIndices(Idx('a'), Idx('b')), components, SymbolArray([t, r, theta, phi]))
+
+
+def main(resolution: int = 128):
+    a = Symbol("a")
+    camera = Camera([0., 30., np.pi / 2 - 0.1, 0.], resolution=(resolution, resolution), field_of_view=0.8)
+    for name, spin in (("schwarzschild", 0.), ("kerr a=0.9", 0.9)):
+        start = default_timer()
+        with using(Simplifier('none')): # Compiled numerically: the Christoffel symbols need not be simplified.
+            tracer = RayTracer(kerr(a), {a: spin}, horizon=1 + np.sqrt(1 - spin**2), escape=60.)
+        compiled = default_timer() - start
+        for processes in sorted({1, os.cpu_count() or 1}):
+            image = tracer.trace(camera, processes=processes)
+            print(f"{name:<14} compiled in {compiled:5.2f} s   processes {processes:2d}: {image.rays_per_second:9.3g} rays/s "
+                  f"{image.steps_per_second:9.3g} steps/s   shadow {image.shadow.mean():.1%} of the image")
+
+
+if __name__ == "__main__":
+    main()
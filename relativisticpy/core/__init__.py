@@ -5,6 +5,9 @@ The core module currently contains the core logic of algebra rules for the einst
 
 from relativisticpy.core.einsum_convention import einstein_convention
 from relativisticpy.core.einsteinarray import EinsteinArray
-from relativisticpy.core.indices import Idx, Indices
+from relativisticpy.core.indices import Idx, Indices, IndexSignature
 from relativisticpy.core.metric import Metric, MetricIndices
+from relativisticpy.core.contraction import contract, contraction_path
+from relativisticpy.core.numeric import NumericEinsteinArray
+from relativisticpy.core.simplification import Simplifier
 from relativisticpy.core.tensor_equality_types import TensorEqualityType
@@ -0,0 +1,95 @@
+"""
+Flat, stride-indexed component buffers for the kernels.
+
+Reading C[a, b, c] from a sympy array validates and converts the key on every access, which dominates the innermost loops of the
+curvature kernels. FlatComponents stores the components as one flat (row-major) list with precomputed strides: the kernels address
+components by integer offset (or by position, without validation) and iterate the non-zero ones in bulk.
+Conversion from and to SymbolArray only happens at the API boundaries (FlatComponents.of and to_array).
+"""
+
+# Standard Library
+from itertools import product
+from typing import Iterator, List, Tuple
+
+# External Modules
+from relativisticpy.symengine import SymbolArray
+
+# This Module
+from relativisticpy.core.plans import strides, flatten_components
+from relativisticpy.core.symmetry import SymmetricComponents
+from relativisticpy.core import sparse
+
+Position = Tuple[int, ...]
+
+
+class FlatComponents:
+    """
+    Attributes:
+        flat (List): The components in row-major order.
+        shape (Tuple[int, ...]): Shape of the array.
+        strides (Tuple[int, ...]): offset = sum(i * s for i, s in zip(position, strides)).
+    """
+
+    __slots__ = ('flat', 'shape', 'strides')
+
+    def __init__(self, flat: List, shape: Tuple[int, ...]):
+        self.flat = flat
+        self.shape = tuple(shape)
+        self.strides = strides(self.shape)
+
+    @classmethod
+    def of(cls, components) -> 'FlatComponents':
+        """ Flat buffer of dense, sparse or symmetric (compact) components. """
+        if isinstance(components, FlatComponents):
+            return components
+        if isinstance(components, SymmetricComponents):
+            buffer = cls.zeros(components.shape)
+            for position, (canonical, sign) in components._table.items():
+                if sign != 0:
+                    buffer.flat[buffer.offset(position)] = sign * components.values.get(canonical, 0)
+            return buffer
+        components = sparse.to_dense(components)
+        return cls(list(flatten_components(components)), tuple(components.shape))
+
+    @classmethod
+    def zeros(cls, shape: Tuple[int, ...]) -> 'FlatComponents':
+        size = 1
+        for dim in shape:
+            size *= dim
+        return cls([0] * size, shape)
+
+    @property
+    def rank(self) -> int: return len(self.shape)
+
+    def offset(self, position: Position) -> int: return sum([i * s for i, s in zip(position, self.strides)])
+
+    def position(self, offset: int) -> Position:
+        return tuple([(offset // s) % dim for s, dim in zip(self.strides, self.shape)])
+
+    def positions(self) -> Iterator[Position]:
+        """ Every position, in the order of the flat buffer. """
+        return product(*[range(dim) for dim in self.shape])
+
+    def nonzero(self) -> List[Tuple[int, object]]:
+        """ (offset, value) of the non-zero components. """
+        return [(offset, value) for offset, value in enumerate(self.flat) if value != 0]
+
+    def nonzero_items(self) -> List[Tuple[Position, object]]:
+        """ (position, value) of the non-zero components. """
+        return [(self.position(offset), value) for offset, value in self.nonzero()]
+
+    def to_array(self, sparse_output: bool = False):
+        array = SymbolArray(self.flat, self.shape) if len(self.shape) > 0 else SymbolArray(self.flat[0])
+        return sparse.to_sparse(array) if sparse_output else array
+
+    def __getitem__(self, key):
+        """ buffer[offset] or buffer[position]: neither is validated. """
+        if isinstance(key, int):
+            return self.flat[key]
+        return self.flat[sum([i * s for i, s in zip(key, self.strides)])]
+
+    def __setitem__(self, key, value) -> None:
+        self.flat[key if isinstance(key, int) else sum([i * s for i, s in zip(key, self.strides)])] = value
+
+    def __len__(self) -> int: return len(self.flat)
+    def __repr__(self) -> str: return f"FlatComponents(shape={self.shape})"
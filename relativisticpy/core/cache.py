@@ -0,0 +1,213 @@
+"""
+Persistent on-disk cache of the components of metric dependent tensors.
+
+Batch jobs recompute the Christoffel symbols, the Riemann, Ricci and Einstein tensors (and the scalars) of the same metrics in every process.
+Once a cache is set, GeometricObject and Connection look their components up before running any kernel, so a warm run is a file read:
+
+    with caching(DiskCache('~/.cache/relativisticpy')):
+        Ricci(indices, metric)
+
+or for every process of a job: export RELATIVISTICPY_CACHE_DIR=~/.cache/relativisticpy
+
+Entries are keyed by a canonical hash of the metric components, the coordinate basis and the computation options (simplification policy,
+curvature engine). Custom pipeline stages are keyed by a hash of their code, constants, defaults and closure: the tensors simplified by a
+stage that cannot be described stably (i.e. a closure over an object without a stable repr) are computed, never cached. Expressions are
+stored as srepr strings in JSON files (undefined functions, i.e. A(r), are not picklable), written atomically, stamped with CACHE_VERSION
+and evicted least recently used first once the directory exceeds max_bytes.
+"""
+
+# Standard Library
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Optional
+
+# External Modules
+from relativisticpy.symengine import NDimArray, SymbolArray, srepr, sympify
+
+# This Module
+from relativisticpy.core.plans import flatten_components
+from relativisticpy.core.simplification import current
+from relativisticpy.core.symmetry import IndexSymmetries, Symmetry, SymmetricComponents
+from relativisticpy.core import sparse
+
+if TYPE_CHECKING:
+    from relativisticpy.core.metric import Metric
+
+CACHE_VERSION = 1 # Bumped whenever the kernels or the entry format change: older entries are then misses.
+ENVIRONMENT_VARIABLE = 'RELATIVISTICPY_CACHE_DIR'
+
+
+class DiskCache:
+    """
+    Attributes:
+        directory (str): Directory of the entries, created if missing.
+        max_bytes (int): Size of the directory above which the least recently used entries are evicted.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024**2):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, name: str, metric: 'Metric', engine: str = 'coordinate') -> Optional[str]:
+        """ Canonical hash of the tensor name, the metric components, its basis and the computation options. None if they cannot be hashed stably. """
+        simplifier = current()
+        stages = [_stage_name(stage) for stage in simplifier.pipeline]
+        if None in stages:
+            return None
+        description = {
+            'version': CACHE_VERSION,
+            'tensor': name,
+            'rank': list(metric.rank),
+            'shape': list(metric.components.shape),
+            'metric': [srepr(component) for component in flatten_components(metric.components)],
+            'basis': [srepr(x) for x in metric.basis],
+            'simplification': stages + [repr(simplifier.timeout), repr(simplifier.cse)],
+            'engine': engine,
+        }
+        return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str):
+        """ The components stored under key, None on a miss. """
+        path = self.__path(key)
+        try:
+            with open(path) as file:
+                entry = json.load(file)
+            os.utime(path) # Most recently used.
+        except (OSError, ValueError):
+            return None
+        if entry.get('version') != CACHE_VERSION:
+            return None
+        return _decode(entry['components'])
+
+    def put(self, key: str, components) -> None:
+        """ Stores components under key: written to a temporary file then renamed, readers never see a partial entry. """
+        entry = json.dumps({'version': CACHE_VERSION, 'key': key, 'components': _encode(components)})
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'w') as file:
+                file.write(entry)
+            os.replace(temporary, self.__path(key))
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """ Removes the least recently used entries until the directory fits in max_bytes. """
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum([size for _, size, _ in entries])
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass # Evicted by another process.
+            total -= size
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                os.remove(os.path.join(self.directory, name))
+
+    def __repr__(self) -> str: return f"DiskCache('{self.directory}', max_bytes={self.max_bytes})"
+
+    # Privates
+    def __path(self, key: str) -> str: return os.path.join(self.directory, f"{key}.json")
+
+
+_current: Optional[DiskCache] = DiskCache(os.environ[ENVIRONMENT_VARIABLE]) if os.environ.get(ENVIRONMENT_VARIABLE) else None
+
+
+def current_cache() -> Optional[DiskCache]:
+    """ The cache the metric dependent tensors are looked up in, None if caching is off (default). """
+    return _current
+
+
+def set_cache(cache: Optional[DiskCache]) -> None:
+    global _current
+    _current = cache
+
+
+@contextmanager
+def caching(cache: Optional[DiskCache]):
+    """ Temporarily sets the cache. """
+    previous = current_cache()
+    set_cache(cache)
+    try:
+        yield cache
+    finally:
+        set_cache(previous)
+
+
+def cached_components(name: str, metric: 'Metric', compute: Callable, engine: str = 'coordinate'):
+    """ The components of the tensor name of metric, computed by the curvature engine: read from the current cache if any, else computed (and stored). """
+    cache = current_cache()
+    key = cache.key(name, metric, engine) if cache is not None else None
+    if key is None:
+        return compute()
+    components = cache.get(key)
+    if components is None:
+        components = compute()
+        cache.put(key, components)
+    return components
+
+
+# Privates
+def _stage_name(stage) -> Optional[str]:
+    """ Stable description of a pipeline stage, None if there is none: two lambdas share their qualified name, not their code. """
+    if isinstance(stage, str):
+        return stage
+    name = f"{getattr(stage, '__module__', None)}.{getattr(stage, '__qualname__', type(stage).__qualname__)}"
+    code = getattr(stage, '__code__', None)
+    if code is None: # i.e. builtins, named by their module.
+        return name if hasattr(stage, '__qualname__') else None
+    state = [_code_fingerprint(code), repr(getattr(stage, '__defaults__', None)), repr(getattr(stage, '__kwdefaults__', None))]
+    state += [repr(cell.cell_contents) for cell in (getattr(stage, '__closure__', None) or ())]
+    if any([' at 0x' in item for item in state[1:]]): # Object ids change between processes.
+        return None
+    return f"{name}:{hashlib.sha256(json.dumps(state).encode()).hexdigest()}"
+
+
+def _code_fingerprint(code) -> list:
+    constants = [_code_fingerprint(constant) if hasattr(constant, 'co_code') else repr(constant) for constant in code.co_consts]
+    return [code.co_code.hex(), list(code.co_names), constants]
+
+
+def _encode(components) -> dict:
+    if isinstance(components, SymmetricComponents):
+        # The stored values are the ones the user views: common subexpressions (see core.cse) do not survive srepr.
+        view = components.view if components.view is not None else (lambda value: value)
+        return {
+            'type': 'symmetric',
+            'symmetries': [[list(map(list, generator.permutation)), generator.sign] for generator in components.symmetries.generators],
+            'shape': list(components.shape),
+            'sparse': components.sparse,
+            'values': [[list(position), srepr(view(value))] for position, value in components.values.items()],
+        }
+    if isinstance(components, NDimArray):
+        return {'type': 'array', 'shape': list(components.shape), 'sparse': sparse.is_sparse(components), 'values': [srepr(value) for value in flatten_components(components)]}
+    return {'type': 'scalar', 'value': srepr(components)}
+
+
+def _decode(entry: dict):
+    if entry['type'] == 'symmetric':
+        symmetries = IndexSymmetries(*[Symmetry(dict(map(tuple, permutation)), sign) for permutation, sign in entry['symmetries']])
+        values = {tuple(position): sympify(value) for position, value in entry['values']}
+        return SymmetricComponents(symmetries, tuple(entry['shape']), values, entry['sparse'])
+    if entry['type'] == 'array':
+        array = SymbolArray([sympify(value) for value in entry['values']], tuple(entry['shape']))
+        return sparse.to_sparse(array) if entry['sparse'] else array
+    return sympify(entry['value'])
@@ -0,0 +1,175 @@
+"""
+Contraction order of multi-tensor products.
+
+A_{a}_{b} * B^{b}^{c} * C_{c}_{d} * D^{d}^{e} evaluated left to right may build far larger intermediates than needed.
+contract(*tensors) picks the cheapest pairwise contraction order, in the style of opt_einsum: the cost of a pairwise product is the number
+of index combinations it visits (the product of the dimentions of all the indices involved), scaled by the density of sparse operands.
+Small chains are searched exhaustively (dynamic programming over subsets), larger ones greedily.
+The resulting indices are then reordered to match the left to right evaluation, so the order is purely an optimization.
+"""
+
+# Standard Library
+from functools import reduce
+from itertools import combinations
+from typing import Dict, FrozenSet, List, Tuple, Union
+
+# This Module
+from relativisticpy.core.einsteinarray import EinsteinArray
+from relativisticpy.core.indices import Indices
+from relativisticpy.core import sparse
+
+# A contraction tree: an operand position, or a pair of sub-trees contracted together.
+Path = Union[int, Tuple['Path', 'Path']]
+
+OPTIMAL_MAX_OPERANDS = 8
+
+
+def contract(*tensors: EinsteinArray):
+    """
+    Multiplies a chain of tensors (einstein summation convention) in the cheapest pairwise order.
+
+    Args:
+        tensors (EinsteinArray): The factors, in the order they are written.
+
+    Returns:
+        Union[EinsteinArray, Basic]: Same result as tensors[0] * tensors[1] * ... evaluated left to right.
+    """
+    if len(tensors) < 3 or not _is_valid_chain(tensors):
+        return reduce(lambda a, b: a * b, tensors)
+
+    # Free indices in the order left to right evaluation would have produced. Products of indices are cheap: plans compile lazily.
+    expected = reduce(lambda a, b: a * b, [tensor.indices for tensor in tensors])
+
+    # Any path leaves the indices which appear once free: if left to right evaluation leaves others (i.e. metric outer products), keep its exact semantics.
+    indices = [(idx.symbol, idx.covariant) for tensor in tensors for idx in tensor.indices.indices]
+    free = [index for index in indices if [symbol for symbol, _ in indices].count(index[0]) == 1]
+    if sorted([(idx.symbol, idx.covariant) for idx in expected.indices]) != sorted(free):
+        return reduce(lambda a, b: a * b, tensors)
+
+    path, _ = contraction_path(*tensors)
+    result = _execute(path, [_as_einstein_array(tensor) for tensor in tensors])
+    if not isinstance(result, EinsteinArray):
+        return result
+    if str(expected) == str(result.indices):
+        return result
+    return result.reshape_tensor_components(expected)
+
+
+def contraction_path(*tensors: EinsteinArray) -> Tuple[Path, int]:
+    """
+    Cheapest pairwise contraction order of a chain of tensors.
+
+    Returns:
+        Tuple[Path, int]: The contraction tree, i.e. ((0, 1), (2, 3)), and its estimated cost.
+    """
+    dims = {idx.symbol: dim for tensor in tensors for idx, dim in zip(tensor.indices.indices, tensor.components.shape)}
+    operands = [(frozenset([idx.symbol for idx in tensor.indices.indices]), _density(tensor)) for tensor in tensors]
+
+    if len(tensors) <= OPTIMAL_MAX_OPERANDS:
+        return _optimal(operands, dims)
+    return _greedy(operands, dims)
+
+
+def left_to_right_cost(*tensors: EinsteinArray) -> int:
+    """ Estimated cost of evaluating the chain strictly left to right. """
+    dims = {idx.symbol: dim for tensor in tensors for idx, dim in zip(tensor.indices.indices, tensor.components.shape)}
+    operands = [(frozenset([idx.symbol for idx in tensor.indices.indices]), _density(tensor)) for tensor in tensors]
+    total, (symbols, density) = 0, operands[0]
+    for other in operands[1:]:
+        cost, symbols, density = _pair(symbols, density, *other, dims)
+        total += cost
+    return total
+
+
+# Privates
+def _as_einstein_array(tensor: EinsteinArray) -> EinsteinArray:
+    """ Intermediate products follow the plain einsum convention (i.e. not the metric index substitution): the result is reordered at the end anyway. """
+    return tensor if type(tensor.indices) == Indices else EinsteinArray(Indices(*tensor.indices.indices), tensor.components, tensor.basis)
+
+
+def _is_valid_chain(tensors) -> bool:
+    """
+    Every index symbol appears once (free) or twice with opposite covariance (summed): anything else keeps the left to right evaluation.
+    So do the chains holding an operator (i.e. d_{c}, D_{c}, L_X): it applies to the factor next to it, d_{c} A B == (d_{c} A) B,
+    which a reordered path would turn into d_{c} (A B).
+    """
+    if not all([isinstance(tensor, EinsteinArray) and not tensor.scalar and not _is_operator(tensor) for tensor in tensors]):
+        return False
+    occurences: Dict[str, List[bool]] = {}
+    for tensor in tensors:
+        for idx in tensor.indices.indices:
+            occurences.setdefault(idx.symbol, []).append(idx.covariant)
+    return all([len(covariances) == 1 or (len(covariances) == 2 and covariances[0] != covariances[1]) for covariances in occurences.values()])
+
+
+def _is_operator(tensor: EinsteinArray) -> bool:
+    """ Operators are applied by their own multiplication, and the components of a partial derivative are only known once applied. """
+    return tensor.components is None or type(tensor).__mul__ is not EinsteinArray.__mul__
+
+
+def _density(tensor: EinsteinArray) -> float:
+    if not tensor.sparse:
+        return 1.0
+    return max(len(sparse.nonzero(tensor.components)), 1) / max(len(tensor.components), 1)
+
+
+def _size(symbols: FrozenSet[str], dims: Dict[str, int]) -> int: return reduce(lambda x, y: x * y, [dims[symbol] for symbol in symbols], 1)
+
+
+def _pair(symbols_a: FrozenSet[str], density_a: float, symbols_b: FrozenSet[str], density_b: float, dims: Dict[str, int]) -> Tuple[int, FrozenSet[str], float]:
+    """ (cost, free symbols, density) of the pairwise product A * B. """
+    summed = symbols_a & symbols_b
+    cost = _size(symbols_a | symbols_b, dims) * density_a * density_b
+    density = min(1.0, density_a * density_b * _size(summed, dims))
+    return max(int(cost), 1), symbols_a ^ symbols_b, density
+
+
+def _optimal(operands, dims: Dict[str, int]) -> Tuple[Path, int]:
+    """ Dynamic programming over the subsets of operands. """
+    best: Dict[FrozenSet[int], Tuple[int, Path, FrozenSet[str], float]] = {
+        frozenset([i]): (0, i, symbols, density) for i, (symbols, density) in enumerate(operands)
+    }
+    everything = list(range(len(operands)))
+    for size in range(2, len(operands) + 1):
+        for subset in combinations(everything, size):
+            subset = frozenset(subset)
+            first = min(subset) # Fix the side of the first operand => each split is visited once.
+            rest = sorted(subset - {first})
+            for k in range(0, len(rest)):
+                for others in combinations(rest, k):
+                    left = frozenset((first,) + others)
+                    right = subset - left
+                    cost_l, path_l, symbols_l, density_l = best[left]
+                    cost_r, path_r, symbols_r, density_r = best[right]
+                    cost, symbols, density = _pair(symbols_l, density_l, symbols_r, density_r, dims)
+                    cost += cost_l + cost_r
+                    if subset not in best or cost < best[subset][0]:
+                        best[subset] = (cost, (path_l, path_r), symbols, density)
+    cost, path, _, _ = best[frozenset(everything)]
+    return path, cost
+
+
+def _greedy(operands, dims: Dict[str, int]) -> Tuple[Path, int]:
+    """ Repeatedly contracts the cheapest pair. """
+    remaining = [(i, symbols, density) for i, (symbols, density) in enumerate(operands)]
+    total = 0
+    while len(remaining) > 1:
+        (a, b), (cost, symbols, density) = min(
+            [((a, b), _pair(remaining[a][1], remaining[a][2], remaining[b][1], remaining[b][2], dims)) for a, b in combinations(range(len(remaining)), 2)],
+            key=lambda item: (item[1][0], _size(item[1][1], dims)),
+        )
+        total += cost
+        merged = ((remaining[a][0], remaining[b][0]), symbols, density)
+        remaining = [operand for i, operand in enumerate(remaining) if i not in (a, b)] + [merged]
+    return remaining[0][0], total
+
+
+def _execute(path: Path, tensors):
+    if isinstance(path, int):
+        return tensors[path]
+    left, right = _execute(path[0], tensors), _execute(path[1], tensors)
+    # Keep the written order of the factors within each pairwise product.
+    return left * right if _first(path[0]) < _first(path[1]) else right * left
+
+
+def _first(path: Path) -> int: return path if isinstance(path, int) else min(_first(path[0]), _first(path[1]))
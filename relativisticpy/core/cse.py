@@ -0,0 +1,69 @@
+"""
+Common subexpression elimination across the components of a tensor.
+
+The components of a geometric tensor share large subexpressions, i.e. (1 - 2 G M / r), sin(theta)**2 or the derivatives of the same metric function.
+eliminate extracts them into a pool of subexpressions: each one becomes an atom xi_n(r, theta, ...) applied to the symbols it depends on, so the
+kernels keep differentiating and contracting the reduced components correctly (d_r xi_n(r) stays a derivative of the atom), and carries its
+definition, so any expression holding atoms is expanded back with expand_subexpressions, wherever it was built.
+
+Enabled with Simplifier(cse=True): each subexpression is then simplified once for the whole tensor, the compact components (SymmetricComponents)
+hold the reduced forms, and they are expanded only when the full array is materialized, i.e. when the user views the components.
+"""
+
+# Standard Library
+from itertools import count
+from typing import Callable, List, Tuple
+
+# External Modules
+from relativisticpy.symengine import Basic, Derivative, Function, cse, numbered_symbols, sympify
+
+_names = count()
+
+
+def is_subexpression(expr) -> bool:
+    """ True for the atoms xi_n(...) of a pool. """
+    return isinstance(expr, Basic) and hasattr(type(expr), 'definition')
+
+
+def subexpressions(expr) -> set:
+    """ The pooled subexpression atoms expr holds. """
+    if not isinstance(expr, Basic):
+        return set()
+    return set([atom for atom in expr.atoms(Function) if is_subexpression(atom)])
+
+
+def eliminate(expressions: List, transform: Callable = None) -> Tuple[List, List]:
+    """
+    Extracts the subexpressions shared by the expressions.
+
+    Args:
+        expressions (List): Components of a tensor.
+        transform (Callable, optional): Applied once to the definition of each subexpression, i.e. simplify.
+
+    Returns:
+        Tuple[List, List]: The new subexpression atoms and the reduced expressions.
+    """
+    replacements, reduced = cse([sympify(expr) for expr in expressions], symbols=numbered_symbols('_cse'), order='none')
+    atoms, mapping = [], {}
+    for symbol, definition in replacements:
+        definition = definition.xreplace(mapping)
+        if transform is not None:
+            definition = transform(definition)
+        arguments = sorted(definition.free_symbols, key=str)
+        if len(arguments) == 0:
+            mapping[symbol] = definition # Constants are not worth an atom.
+            continue
+        atom = Function(f'xi_{next(_names)}', definition=definition)(*arguments)
+        atoms.append(atom)
+        mapping[symbol] = atom
+    return atoms, [expr.xreplace(mapping) for expr in reduced]
+
+
+def expand_subexpressions(expr):
+    """ Substitutes the pooled subexpressions of expr back (recursively), and evaluates the derivatives taken of them. """
+    atoms = subexpressions(expr)
+    if len(atoms) == 0:
+        return expr
+    expanded = expr.xreplace({atom: expand_subexpressions(type(atom).definition) for atom in atoms})
+    derivatives = expanded.atoms(Derivative)
+    return expanded.xreplace({d: d.doit() for d in derivatives}) if len(derivatives) > 0 else expanded
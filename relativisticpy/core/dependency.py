@@ -0,0 +1,66 @@
+"""
+Free-symbol dependency index of components.
+
+Most metrics only depend on one or two coordinates (Schwarzschild on r and theta, FLRW on t), hence most of the derivatives and products
+built by the kernels vanish structurally. DependencyIndex lists, per component, the coordinates it depends on and whether it is identically zero,
+so the kernels skip these derivatives and products before building any sympy expression.
+"""
+
+# Standard Library
+from functools import lru_cache
+from typing import FrozenSet, List, Tuple
+
+# External Modules
+from relativisticpy.symengine import Basic, diff
+
+# This Module
+from relativisticpy.core.buffer import FlatComponents
+
+
+@lru_cache(maxsize=4096)
+def coordinates(expr, basis: Tuple) -> FrozenSet[int]:
+    """ Positions in basis of the coordinates expr depends on. """
+    if not isinstance(expr, Basic):
+        return frozenset()
+    free = expr.free_symbols
+    return frozenset([k for k, x in enumerate(basis) if x in free])
+
+
+def derivative(expr, basis: Tuple, k: int):
+    """ d_k expr, without calling diff when expr does not depend on the coordinate k. """
+    return diff(expr, basis[k]) if k in coordinates(expr, basis) else 0
+
+
+def product(a, b):
+    """ a * b, without building a sympy product when a factor is zero. """
+    return 0 if a == 0 or b == 0 else a * b
+
+
+class DependencyIndex:
+    """
+    Attributes:
+        basis (Tuple): The coordinates.
+        dependencies (Tuple[FrozenSet[int], ...]): Per flat offset, positions in basis of the coordinates the component depends on.
+        zeros (Tuple[bool, ...]): Per flat offset, True if the component is identically zero.
+    """
+
+    def __init__(self, flat: List, basis):
+        self.basis = tuple(basis)
+        self.zeros = tuple([value == 0 for value in flat])
+        self.dependencies = tuple([frozenset() if zero else coordinates(value, self.basis) for value, zero in zip(flat, self.zeros)])
+
+    @classmethod
+    def of(cls, components, basis) -> 'DependencyIndex': return cls(FlatComponents.of(components).flat, basis)
+
+    def zero(self, offset: int) -> bool: return self.zeros[offset]
+
+    def depends(self, offset: int, k: int) -> bool:
+        """ False if d_k of the component at offset vanishes structurally. """
+        return k in self.dependencies[offset]
+
+    @property
+    def coordinates(self) -> FrozenSet[int]:
+        """ All the coordinates the components depend on. """
+        return frozenset().union(*self.dependencies)
+
+    def __repr__(self) -> str: return f"DependencyIndex({len(self.zeros) - sum(self.zeros)} non-zero of {len(self.zeros)}, depends on {[self.basis[k] for k in sorted(self.coordinates)]})"
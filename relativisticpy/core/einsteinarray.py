@@ -1,6 +1,5 @@
 # Standard Library
 from typing import List, Callable
-from itertools import product
 
 # External Modules
 from relativisticpy.utils import tensor_trace_product
@@ -9,6 +8,8 @@ from relativisticpy.symengine import SymbolArray, Basic
 # This Module
 from relativisticpy.core.indices import Indices, Idx
 from relativisticpy.core.einsum_convention import einstein_convention
+from relativisticpy.core.symmetry import IndexSymmetries, SymmetricComponents
+from relativisticpy.core import sparse, views
 
 
 @einstein_convention
@@ -21,6 +22,7 @@ class EinsteinArray:
     Attributes:
         indices (Indices): The indices of the tensor.
         components (SymbolArray): The tensor's components.
+        symmetries (IndexSymmetries): Class attribute declaring the index symmetries of the components. None by default.
         basis (SymbolArray): The basis vectors for the tensor space.
         subcomponents (SymbolArray): The subcomponents derived from the tensor components.
 
@@ -32,6 +34,8 @@ class EinsteinArray:
 
     """
 
+    symmetries: IndexSymmetries = None
+
     def __init__(
         self,
         indices: Indices,
@@ -43,7 +47,7 @@ class EinsteinArray:
 
         Args:
             indices (Indices): The indices of the tensor.
-            components (SymbolArray, optional): The tensor's components. Defaults to None.
+            components (SymbolArray, optional): The tensor's components, or the compact SymmetricComponents computed by a kernel. Defaults to None.
             basis (SymbolArray, optional): The basis vectors for the tensor space. Defaults to None.
         """
         self.components = components
@@ -52,12 +56,12 @@ class EinsteinArray:
         self.indices = indices
 
         if self.indices.basis == None: # Need a better solution (EinArray should not know indices implementation.)
-            self.indices.basis = basis
+            self.indices = indices = self.indices.with_basis(basis)
 
         # I think this is trying to first remove an array 
         if indices.anyrunnig: # Need a better solution (EinArray should not know indices implementation.)
             if basis != None:
-                indices.basis = basis
+                indices = indices.with_basis(basis)
                 self._subcomponents = self.get_subcomponents(indices)
                 self.indices = indices.get_non_running()
             else:
@@ -99,6 +103,63 @@ class EinsteinArray:
         else:
             return self.components
 
+    @property
+    def components(self):
+        """
+        Property to get the tensor components. Compact (symmetric) components are materialized into a full array on first access.
+
+        Returns:
+            SymbolArray: The tensor's components.
+        """
+        if self._components is None and self._compact is not None:
+            self._components = self._compact.to_array()
+        return self._components
+
+    @components.setter
+    def components(self, value) -> None:
+        """
+        Setter for the components property. Any new full array replaces the compact components, and drops the values derived from the old ones.
+
+        Args:
+            value (Union[SymbolArray, SymmetricComponents]): The tensor's components.
+        """
+        if isinstance(value, SymmetricComponents):
+            self._compact, self._components = value, None
+        else:
+            self._compact, self._components = None, value
+        self._derived = {}
+
+    @property
+    def derived(self) -> dict:
+        """
+        Property to get the values derived from the components and memoized on the tensor (i.e. the curvature pipeline of a metric).
+        Emptied whenever the components are set.
+
+        Returns:
+            dict: name => derived value.
+        """
+        return self._derived
+
+    @property
+    def compact(self) -> SymmetricComponents:
+        """
+        Property to get the compact components: only the independent components w.r.t. the index symmetries, as computed by the kernels.
+
+        Returns:
+            SymmetricComponents: The independent components, None if the components were not computed compactly.
+        """
+        return self._compact
+
+    @property
+    def sparse(self) -> bool:
+        """
+        Property indicating if the tensor components are stored sparsely (only the non-zero components).
+
+        Returns:
+            bool: True if the components are a SparseSymbolArray, False otherwise.
+        """
+        return self._compact.sparse if self._compact is not None else sparse.is_sparse(self._components)
+
     @property
     def shape(self):
         """
@@ -177,13 +238,14 @@ class EinsteinArray:
             EinsteinArray: The reshaped tensor.
         """
         reshape_tuple_order = self.indices.get_reshape(indices)
-        indices.basis = self.basis
+        indices = indices.with_basis(self.basis)
         new_components = self.rearrange_components(reshape_tuple_order)
         return type(self)(indices, new_components, indices.basis)
     
     def rearrange_components(self, new_order: List[int]):
         """
         Rearranges the components of the tensor based on the given order.
+        Returns a zero-copy permuted view of the components, which only materializes once mutated.
 
         Args:
             new_order (List[int]): The new order of the components.
@@ -191,20 +253,27 @@ class EinsteinArray:
         Returns:
             SymbolArray: The tensor components with rearranged order.
         """
-        # Determine the shape of the new array
-        new_shape = [self.components.shape[i] for i in new_order]
+        return views.permute(self.components, new_order)
+
+    def to_sparse(self):
+        """
+        Switches the tensor components to sparse storage. All subsequent operations run over the non-zero components only.
 
-        # Create a new array with the same data but new shape
-        new_array = SymbolArray.zeros(*new_shape)
+        Returns:
+            EinsteinArray: The tensor with sparse components.
+        """
+        self.components = sparse.to_sparse(self.components)
+        return self
 
-        # Iterate over each possible index in the new array
-        for new_index in product(*[range(s) for s in new_shape]):
-            # Map the new index to the corresponding index in the original array
-            original_index = tuple(new_index[new_order.index(i)] for i in range(len(new_order)))
-            # Assign the value from the original array to the new index in the new array
-            new_array[new_index] = self.components[original_index]
+    def to_dense(self):
+        """
+        Switches the tensor components back to dense storage.
 
-        return new_array
+        Returns:
+            EinsteinArray: The tensor with dense components.
+        """
+        self.components = sparse.to_dense(self.components)
+        return self
 
     def components_operation(self, operation: Callable):
         """
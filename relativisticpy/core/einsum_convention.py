@@ -12,6 +12,8 @@ from relativisticpy.symengine import SymbolArray
 
 # This Module
 from relativisticpy.core.indices import Indices
+from relativisticpy.core.plans import additive_plan, selfsum_plan, flatten_components
+from relativisticpy.core import sparse
 
 
 @dataclass
@@ -29,16 +31,19 @@ def einstein_convention(cls: MultiIndexArrayType):
         A = self.components
         B = tensor.components
         resulting_indices = self.indices.additive_product(tensor.indices)
+        if sparse.is_sparse(A) or sparse.is_sparse(B):
+            components = sparse.additive(A, B, self.indices._get_all_repeated_locations(tensor.indices), self.indices._ranges(), operation)
+            return _tensorproduct(components=components, indices=resulting_indices)
+
+        plan = additive_plan(self.indices._ranges(), tensor.indices._ranges(), tuple(self.indices._get_all_repeated_locations(tensor.indices)), tuple(A.shape), tuple(B.shape))
+        flat_a, flat_b = flatten_components(A), flatten_components(B)
+        if plan == None: # Aligned operands => elementwise combine of the flat buffers.
+            return _tensorproduct(components=SymbolArray([operation(a, b) for a, b in zip(flat_a, flat_b)], A.shape), indices=resulting_indices)
+
         zeros = resulting_indices.zeros_array()
-        for i in resulting_indices:
-            # Vectorizing the result dynamically.
-            # We build a read from the resulting indices.generate function which is monkey patched into this.
-            zeros[i] = sum(
-                [
-                    operation(A[idx_A], B[idx_B])
-                    for idx_A, idx_B in resulting_indices.generator(i)
-                ]
-            )
+        flat_res = flatten_components(zeros)
+        for a, b in plan:
+            flat_res[a] = operation(flat_a[a], flat_b[b])
         return _tensorproduct(components=zeros, indices=resulting_indices)
 
     def einsum_operation(
@@ -47,23 +52,21 @@ def einstein_convention(cls: MultiIndexArrayType):
         A = self.components
         B = tensor.components
         resulting_indices = self.indices.einsum_product(tensor.indices)
-        zeros = resulting_indices.zeros_array()
-        for i in resulting_indices:
-            zeros[i] = sum(
-                [
-                    operation(A[idx_A], B[idx_B])
-                    for idx_A, idx_B in resulting_indices.generator(i)
-                ]
-            ) # Vectorization for speedup.
-        return _tensorproduct(components=zeros, indices=resulting_indices)
+        # The compiled plan maps each resulting component straight to the flat offsets of A and B to sum over.
+        components = resulting_indices.plan.execute(A, B, operation)
+        return _tensorproduct(components=components, indices=resulting_indices)
 
     def selfsum_operation(self: MultiIndexArrayType) -> _tensorproduct:
         resulting_indices = self.indices.self_product()
+        if sparse.is_sparse(self.components):
+            components = sparse.selfsum(self.components, self.indices._get_self_summed_locations(), self.indices._ranges())
+            return _tensorproduct(components=components, indices=resulting_indices)
+
+        flat = flatten_components(self.components)
         zeros = resulting_indices.zeros_array()
-        for i in resulting_indices:
-            zeros[i] = sum(
-                [self.components[Indices] for Indices in resulting_indices.generator(i)]
-            )
+        flat_res = flatten_components(zeros)
+        for res, offsets in selfsum_plan(self.indices._ranges(), tuple(self.indices._get_self_summed_locations()), tuple(self.components.shape)):
+            flat_res[res] = sum([flat[offset] for offset in offsets])
         return _tensorproduct(components=zeros, indices=resulting_indices)
 
     def setitem(
@@ -81,11 +84,7 @@ def einstein_convention(cls: MultiIndexArrayType):
                 if itemgetter(*summed_index_locations[0])(IndexA)
                 == itemgetter(*summed_index_locations[1])(IndexB)
             ]
-            comp = (
-                SymbolArray(self.components)
-                if not isinstance(self.components, SymbolArray)
-                else self.components
-            )
+            comp = SymbolArray(sparse.to_dense(self.components)) # Copy: permuted views of the components must not observe the writes.
             for idxa, idxb in all:
                 comp[idxa] = other_expr.components[idxb]
             self.components = comp
@@ -95,11 +94,7 @@ def einstein_convention(cls: MultiIndexArrayType):
             isinstance(other_expr, SymbolArray)
             and other_expr.shape == self.components.shape
         ):
-            comp = (
-                SymbolArray(self.components)
-                if not isinstance(self.components, SymbolArray)
-                else self.components
-            )
+            comp = SymbolArray(sparse.to_dense(self.components)) # Copy: permuted views of the components must not observe the writes.
             for idxa in self.indices:
                 comp[idxa] = other_expr[idxa]
             self.components = comp
@@ -3,13 +3,18 @@ import re
 from operator import itemgetter
 from itertools import product, combinations
 from itertools import product
-from typing import Tuple, List, Union, Optional, Any
+from typing import Dict, Tuple, List, Union, Optional, Any
+from functools import lru_cache
+from weakref import WeakValueDictionary
 from relativisticpy.core.tensor_equality_types import TensorEqualityType
 
 # External Modules
 from relativisticpy.utils import transpose_list
 from relativisticpy.symengine import SymbolArray
 
+# This Module
+from relativisticpy.core.plans import ContractionPlan, einsum_plan
+
 class Idx:
     """
         IMPORTANT: This class is not for instantiation for use. The Indices class auto-initiates this class and sets all relevant properties.
@@ -89,13 +94,27 @@ class Indices:
         self.indices: Union[List[Idx], Tuple[Idx]] = tuple([index.set_order(order) for order, index in enumerate([*args])])
         self.generator = lambda: None # mokey patch product implementations of index depending on mul or add products
         self.generator_implementor = None # Curretly only used for unit tests => for use to know which implementation the generator is in currently.
+        self._plan = None # Compiled contraction plan of the product which resulted in these indices.
+        self._plan_compiler = None
+        self._signature = None
         self._basis = None
+        self._shared = False # Built once per signature and handed to every caller (see IndexSignature.indices): copied instead of mutated.
 
     # Properties
     @property 
     def basis(self) -> SymbolArray: return self._basis
     @property
-    def anyrunnig(self) -> bool: return any([not idx.running for idx in self.indices])
+    def plan(self) -> Optional[ContractionPlan]:
+        if self._plan == None and self._plan_compiler != None:
+            self._plan = self._plan_compiler()
+        return self._plan
+    @property
+    def signature(self) -> 'IndexSignature':
+        if self._signature == None:
+            self._signature = IndexSignature.of(self.indices)
+        return self._signature
+    @property
+    def anyrunnig(self) -> bool: return self.signature.anyrunning
     @property
     def dimention(self) -> int: return len(self.basis)
     @property
@@ -103,12 +122,14 @@ class Indices:
     @property
     def shape(self) -> Tuple[int, ...]: return tuple([i.dimention for i in self.indices])
     @property
-    def rank(self) -> Tuple[int, ...]: return tuple([len([i for i in self.indices if not i.covariant]), len([i for i in self.indices if i.covariant])])
+    def rank(self) -> Tuple[int, ...]: return self.signature.rank
     @property
-    def self_summed(self) -> bool: return len([[i.order, j.order] for i, j in combinations(self.indices, r=2) if i.is_contracted_with(j)]) > 0
+    def self_summed(self) -> bool: return len(self.signature.self_summed_locations) > 0
 
     @basis.setter
     def basis(self, value: SymbolArray) -> None:
+        if self._shared and not _same_basis(self._basis, value):
+            raise AttributeError(f"The indices {self} are shared: use with_basis(), which copies them.")
         self._basis = value
         for idx in self.indices:
             idx.basis = value
@@ -143,9 +164,27 @@ class Indices:
     def get_reshape(self, other: 'Indices') -> Union[Tuple, None]: return tuple([self[index][0].order for index in other.indices if index in self.indices]) if self.symbol_and_symbol_rank_eq(other) else None
     def find(self, key: Idx) -> int: return [idx.order for idx in self.indices if idx.symbol == key.symbol and idx.covariant == key.covariant][0] if len([idx for idx in self.indices if idx.symbol == key.symbol and idx.covariant == key.covariant]) > 0 else None
     def covariance_delta(self, other: 'Indices') -> List[Tuple[int, str]]: return [tuple(['rs', i.order]) if i.covariant else tuple(['lw', i.order]) for i, j in product(self.indices, other.indices) if i.order == j.order and i.covariant != j.covariant]
+    def copy(self) -> 'Indices':
+        """ Unshared copy: fresh Idx objects, the same signature and basis. """
+        indices = type(self)(*[Idx(symbol=idx.symbol, values=idx.values, covariant=idx.covariant) for idx in self.indices])
+        indices._signature = self._signature
+        indices.basis = self._basis
+        return indices
+
+    def with_basis(self, basis: SymbolArray) -> 'Indices':
+        """ These indices on basis: set in place, or on a copy if they are shared. """
+        if _same_basis(self._basis, basis):
+            return self
+        indices = self.copy() if self._shared else self
+        indices.basis = basis
+        return indices
+
     def get_non_running(self) -> 'Indices':
+        if self._shared:
+            return self.copy().get_non_running()
         for index in self.indices:
             index.values = None
+        self._signature = None
         return self
 
 
@@ -167,38 +206,45 @@ class Indices:
         }
         return equality_map[equality_type] if equality_type in equality_map else None
 
-    def einsum_product(self, other: 'Indices') -> 'Indices':
-        summed_index_locations = transpose_list(self._get_all_summed_locations(other))
-        all = [(IndexA, IndexB) for (IndexA, IndexB) in list(product(self, other)) if itemgetter(*summed_index_locations[0])(IndexA) == itemgetter(*summed_index_locations[1])(IndexB)] if len(summed_index_locations) > 0 else [(IndexA, IndexB) for (IndexA, IndexB) in list(product(self, other))]
-        res = self._get_einsum_result(other)
+    def einsum_product(self, other: 'Indices') -> 'Indices': return self._compile_einsum_product(other, self._get_einsum_result(other))
+
+    def _compile_einsum_product(self, other: 'Indices', res: 'Indices') -> 'Indices':
+        """ Attaches to the resulting indices the (cached) contraction plan of self * other. The plan is only compiled once it is first needed. """
+        res.basis = self.basis
         result_indices_in_A = [i[0] for i in res._get_all_repeated_location(self) if len(i) > 0]
         result_indices_in_B = [i[0] for i in res._get_all_repeated_location(other) if len(i) > 0]
         A_indices_not_summed = [i[0] for i in self._get_all_repeated_location(res) if len(i) > 0]
         B_indices_not_summed = [i[0] for i in other._get_all_repeated_location(res) if len(i) > 0]
-        
-        def generator(idx): # Possible Abstraction => create a method attribute which takes in the function and its arguments as input and structures the if statements in list compr in acordance with what is not an empty array --> apply itemgetter.
-            if not res.scalar and idx != None:
-                if len(A_indices_not_summed) != 0 and len(B_indices_not_summed) != 0: # e.g. A_{i}_{j}_{s} * B^{i}^{j}_{k} : No exausted indices
-                    return [(IndicesA, IndicesB) for (IndicesA, IndicesB) in all if itemgetter(*A_indices_not_summed)(IndicesA) == itemgetter(*result_indices_in_A)(idx) and itemgetter(*B_indices_not_summed)(IndicesB) == itemgetter(*result_indices_in_B)(idx)]
-                elif len(A_indices_not_summed) == 0 and len(B_indices_not_summed) != 0: # e.g. A_{i}_{j} * B^{i}^{j}_{k} : self.indices exausted -> all summed
-                    return [(IndicesA, IndicesB) for (IndicesA, IndicesB) in all if itemgetter(*B_indices_not_summed)(IndicesB) == itemgetter(*result_indices_in_B)(idx)]
-                elif len(B_indices_not_summed) == 0 and len(A_indices_not_summed) != 0: # e.g. A_{i}_{j}_{k} * B^{i}^{j} : other.indices exausted -> all summed
-                    return [(IndicesA, IndicesB) for (IndicesA, IndicesB) in all if itemgetter(*A_indices_not_summed)(IndicesA) == itemgetter(*result_indices_in_A)(idx)]
-            else:
-                return all
+        summed = tuple([tuple(i) for i in self._get_all_summed_locations(other)])
 
-        res.generator = generator
+        res._plan_compiler = lambda: einsum_plan(
+            self._ranges(),
+            other._ranges(),
+            summed,
+            tuple(zip(result_indices_in_A, A_indices_not_summed)),
+            tuple(zip(result_indices_in_B, B_indices_not_summed)),
+            self.shape,
+            other.shape,
+            res.shape
+        )
+        res.generator = lambda idx = None: res.plan.generator(idx)
         res.generator_implementor = self.EINSUM_GENERATOR
-        res.basis = self.basis
         return res
 
     def additive_product(self, other: 'Indices') -> 'Indices':
-        repeated_index_locations = transpose_list(self._get_all_repeated_locations(other))
-        all_ = [(IndexA, IndexB) for (IndexA, IndexB) in list(product(self, other)) if itemgetter(*repeated_index_locations[0])(IndexA) == itemgetter(*repeated_index_locations[1])(IndexB)]
         res = self._get_additive_result()
-        result_in_old = [i[0] for i in res._get_all_repeated_location(self) if len(i) > 0]
+        cache = []
+
+        def all_products():
+            # Only built once the generator is used: the einstein convention executes additions from compiled plans (see plans.additive_plan).
+            if len(cache) == 0:
+                repeated_index_locations = transpose_list(self._get_all_repeated_locations(other))
+                cache.append([(IndexA, IndexB) for (IndexA, IndexB) in list(product(self, other)) if itemgetter(*repeated_index_locations[0])(IndexA) == itemgetter(*repeated_index_locations[1])(IndexB)])
+                cache.append([i[0] for i in res._get_all_repeated_location(self) if len(i) > 0])
+            return cache
 
         def generator(idx):
+            all_, result_in_old = all_products()
             lst = []
             if not res.scalar and idx != None:
                 for (IndicesA, IndicesB) in all_:
@@ -220,13 +266,19 @@ class Indices:
         return res
 
     def self_product(self):
-        ne = [[i.order, j.order] for i, j in combinations(self.indices, r=2) if i.is_contracted_with(j)]
-        repeated_index_locations = transpose_list(ne)
-        all_ = [indices for indices in list(self) if itemgetter(*repeated_index_locations[0])(indices) == itemgetter(*repeated_index_locations[1])(indices)]
         res = self._get_selfsum_result()
-        old_indices_not_self_summed = [i[0] for i in self._get_all_repeated_location(res) if len(i) > 0]
+        cache = []
+
+        def all_products():
+            # Only built once the generator is used: the einstein convention executes traces from compiled plans (see plans.selfsum_plan).
+            if len(cache) == 0:
+                repeated_index_locations = transpose_list(self._get_self_summed_locations())
+                cache.append([indices for indices in list(self) if itemgetter(*repeated_index_locations[0])(indices) == itemgetter(*repeated_index_locations[1])(indices)])
+                cache.append([i[0] for i in self._get_all_repeated_location(res) if len(i) > 0])
+            return cache
 
         def generator(idx = None):
+            all_, old_indices_not_self_summed = all_products()
             if res.scalar or idx == None:
                 return all_
         
@@ -248,10 +300,102 @@ class Indices:
 
     # Privates
     def _indices_iterator(self): return list(product(*[x for x in self.indices]))
+    def _get_self_summed_locations(self) -> List[Tuple[int, int]]: return list(self.signature.self_summed_locations)
+    def _ranges(self) -> Tuple[Tuple[int, ...], ...]: return tuple([tuple(idx) for idx in self.indices])
     def _is_all_summed_with(self, other: 'Indices') -> 'Indices': return all([idx.is_summed_wrt_indices(other.indices) for idx in self.indices])
     def _get_einsum_result(self, other: 'Indices') -> 'Indices': lst = [idx for idx in self.indices if not idx.is_summed_wrt_indices(other.indices)] + [idx for idx in other.indices if not idx.is_summed_wrt_indices(self.indices)]; return Indices(*lst)
     def _get_selfsum_result(self) -> 'Indices': return Indices(*[idx for idx in self.indices if not idx.is_summed_wrt_indices(self.indices)])
     def _get_additive_result(self) -> 'Indices': return Indices(*[idx for idx in self.indices]) # Need to add commutation & anti-commutation rules
-    def _get_all_summed_locations(self, other: 'Indices') -> List[Tuple[int, int]]: return [index.get_summed_locations(other.indices)[0] for index in self.indices if len(index.get_summed_locations(other.indices)) > 0]
-    def _get_all_repeated_locations(self, other: 'Indices') -> List[Tuple[int, int]]: return [index.get_repeated_locations(other.indices)[0] for index in self.indices if len(index.get_repeated_locations(other.indices)) > 0 ]
+    def _get_all_summed_locations(self, other: 'Indices') -> List[Tuple[int, int]]: return list(self.signature.summed_locations(other.signature))
+    def _get_all_repeated_locations(self, other: 'Indices') -> List[Tuple[int, int]]: return list(self.signature.repeated_locations(other.signature))
     def _get_all_repeated_location(self, other: 'Indices') -> List[Tuple[int, int]]: return [index.get_repeated_location(other.indices) for index in self.indices if len(index.get_repeated_location(other.indices)) > 0 ]
+
+
+class IndexSignature:
+    """
+    Immutable, hashable description of indices: the (symbol, covariant, fixed value) of each position, i.e. _{a}^{b} or _{a}^{b:0}.
+    Signatures are interned by their string form, hence identical indices share one object which can serve as a cache key (plans, tensor lookups).
+    The intern table only holds the signatures in use (weak references). The derived properties (rank, self summed locations, ...) are computed
+    once, on creation, and so are the Indices built from the signature (per class and basis).
+    """
+
+    __slots__ = ('entries', 'key', 'symbols', 'rank', 'anyrunning', 'self_summed_locations', 'built', '__weakref__')
+    _interned: 'WeakValueDictionary[str, IndexSignature]' = WeakValueDictionary()
+    MAX_BUILT = 8 # Indices kept per signature: one per class and basis in use.
+
+    def __new__(cls, entries: Tuple[Tuple[str, bool, Optional[int]], ...]):
+        entries = tuple([(str(symbol), bool(covariant), value if isinstance(value, int) else None) for symbol, covariant, value in entries])
+        key = "".join([f"{'_' if covariant else '^'}{{{symbol}{'' if value == None else f':{value}'}}}" for symbol, covariant, value in entries])
+        interned = cls._interned.get(key)
+        if interned is not None:
+            return interned
+
+        self = object.__new__(cls)
+        for name, value in (
+            ('entries', entries),
+            ('key', key),
+            ('symbols', tuple([symbol for symbol, _, _ in entries])),
+            ('rank', (len([e for e in entries if not e[1]]), len([e for e in entries if e[1]]))),
+            ('anyrunning', any([value != None for _, _, value in entries])),
+            ('self_summed_locations', tuple([(i, j) for (i, a), (j, b) in combinations(enumerate(entries), r=2) if a[0] == b[0] and a[1] != b[1]])),
+            ('built', {}),
+        ):
+            object.__setattr__(self, name, value)
+        cls._interned[key] = self
+        return self
+
+    @classmethod
+    def of(cls, indices: Union[List[Idx], Tuple[Idx, ...]]) -> 'IndexSignature': return cls(tuple([(idx.symbol, idx.covariant, idx.values) for idx in indices]))
+
+    def summed_locations(self, other: 'IndexSignature') -> Tuple[Tuple[int, int], ...]:
+        """ (position, other position) of the indices contracted with other. Cached per pair of signatures. """
+        return _summed_locations(self, other)
+
+    def repeated_locations(self, other: 'IndexSignature') -> Tuple[Tuple[int, int], ...]:
+        """ (position, other position) of the indices repeated (same symbol and covariance) in other. Cached per pair of signatures. """
+        return _repeated_locations(self, other)
+
+    def indices(self, cls: type = Indices, basis: SymbolArray = None) -> Indices:
+        """
+        The Indices of this signature on basis, with the signature and its derived properties attached. Built once per class and basis, then
+        shared by every caller: with_basis() and get_non_running() return copies of shared indices instead of mutating them.
+        """
+        key = (cls, tuple(basis) if basis is not None else None)
+        indices = self.built.get(key)
+        if indices is None:
+            indices = cls(*[Idx(symbol=symbol, values=value, covariant=covariant) for symbol, covariant, value in self.entries])
+            indices._signature = self
+            indices.basis = basis
+            indices._shared = True
+            if len(self.built) >= self.MAX_BUILT:
+                self.built.pop(next(iter(self.built)))
+            self.built[key] = indices
+        return indices
+
+    def __setattr__(self, name, value): raise AttributeError(f"{type(self).__name__} is immutable.")
+    def __eq__(self, other: 'IndexSignature') -> bool: return isinstance(other, IndexSignature) and self.key == other.key
+    def __hash__(self) -> int: return hash(self.key)
+    def __len__(self) -> int: return len(self.entries)
+    def __str__(self) -> str: return self.key
+    def __repr__(self) -> str: return f"IndexSignature('{self.key}')"
+
+
+@lru_cache(maxsize=1024)
+def _summed_locations(a: IndexSignature, b: IndexSignature) -> Tuple[Tuple[int, int], ...]:
+    return tuple([
+        next((i, j) for j, (symbol_b, covariant_b, _) in enumerate(b.entries) if symbol_a == symbol_b and covariant_a != covariant_b)
+        for i, (symbol_a, covariant_a, _) in enumerate(a.entries)
+        if any([symbol_a == symbol_b and covariant_a != covariant_b for symbol_b, covariant_b, _ in b.entries])
+    ])
+
+
+@lru_cache(maxsize=1024)
+def _repeated_locations(a: IndexSignature, b: IndexSignature) -> Tuple[Tuple[int, int], ...]:
+    return tuple([
+        next((i, j) for j, (symbol_b, covariant_b, _) in enumerate(b.entries) if symbol_a == symbol_b and covariant_a == covariant_b)
+        for i, (symbol_a, covariant_a, _) in enumerate(a.entries)
+        if any([symbol_a == symbol_b and covariant_a == covariant_b for symbol_b, covariant_b, _ in b.entries])
+    ])
+
+
+def _same_basis(a, b) -> bool: return a is b or (a is not None and b is not None and list(a) == list(b))
@@ -0,0 +1,56 @@
+"""
+Jet of a metric: its first and second partial derivatives.
+
+The curvature kernels need d_k g_{i}_{j} and d_k d_l g_{i}_{j} over and over, i.e. the Christoffel symbols evaluate 3 derivatives per term.
+MetricJet differentiates each distinct derivative exactly once (g symmetric in i, j and partial derivatives commuting in k, l),
+and the kernels read them by index from flat buffers. Metric.jet memoizes the jet of a metric until its components change.
+"""
+
+# Standard Library
+from typing import TYPE_CHECKING
+
+# External Modules
+from relativisticpy.symengine import SymbolArray
+
+# This Module
+from relativisticpy.core.buffer import FlatComponents
+from relativisticpy.core.dependency import DependencyIndex, derivative
+from relativisticpy.core.symmetry import IndexSymmetries, Symmetric
+
+if TYPE_CHECKING:
+    from relativisticpy.core.metric import Metric
+
+FIRST_DERIVATIVE_SYMMETRIES = IndexSymmetries(Symmetric(0, 1)) # d_k g_{i}_{j}
+SECOND_DERIVATIVE_SYMMETRIES = IndexSymmetries(Symmetric(0, 1), Symmetric(2, 3)) # d_k d_l g_{i}_{j}
+
+
+class MetricJet:
+    """
+    Attributes:
+        g (FlatComponents): g_{i}_{j}, the metric with lower indices.
+        dependencies (DependencyIndex): Coordinates each g_{i}_{j} depends on => the derivatives which vanish structurally are never taken.
+        first (FlatComponents): first[i, j, k] = d_k g_{i}_{j}
+        second (FlatComponents): second[i, j, k, l] = d_k d_l g_{i}_{j}, only differentiated once first accessed.
+    """
+
+    def __init__(self, components, basis: SymbolArray):
+        self.g = FlatComponents.of(components)
+        self.basis = basis
+        self.dimention = len(basis)
+        self.dependencies = DependencyIndex(self.g.flat, basis)
+        N, wrt, g = self.dimention, self.dependencies.basis, self.g
+        self.first = FlatComponents.of(FIRST_DERIVATIVE_SYMMETRIES.compute((N, N, N), lambda i, j, k: derivative(g[i, j], wrt, k)))
+        self._second = None
+
+    @classmethod
+    def of(cls, metric: 'Metric') -> 'MetricJet': return cls(metric._.components, metric.basis)
+
+    @property
+    def second(self) -> FlatComponents:
+        if self._second is None:
+            N, wrt, first = self.dimention, self.dependencies.basis, self.first
+            # d_k d_l g_{i}_{j} = d_l (d_k g_{i}_{j}): differentiates the first derivatives once more.
+            self._second = FlatComponents.of(SECOND_DERIVATIVE_SYMMETRIES.compute((N, N, N, N), lambda i, j, k, l: derivative(first[i, j, k], wrt, l)))
+        return self._second
+
+    def __repr__(self) -> str: return f"MetricJet(dimention={self.dimention}, second={'computed' if self._second is not None else 'lazy'})"
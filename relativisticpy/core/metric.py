@@ -1,12 +1,12 @@
 # Standard Library
 from typing import Union
-from itertools import product
-from operator import itemgetter
 
 # External Modules
-from relativisticpy.core import EinsteinArray, Indices, Idx
-from relativisticpy.symengine import SymbolArray, diff, simplify, tensorproduct, Symbol
-from relativisticpy.utils import tensor_trace_product, transpose_list
+from relativisticpy.core import EinsteinArray, Indices, Idx, sparse
+from relativisticpy.core.jet import MetricJet
+from relativisticpy.core.simplification import simplified
+from relativisticpy.symengine import SymbolArray, diff, simplify, tensorproduct, Symbol, sqrt, Abs
+from relativisticpy.utils import tensor_trace_product
 
 
 class MetricIndices(Indices):
@@ -35,71 +35,7 @@ class MetricIndices(Indices):
         return Indices(*other_indices)
 
     def einsum_product(self, other: "Indices") -> "Indices":
-        summed_index_locations = transpose_list(self._get_all_summed_locations(other))
-        all = (
-            [
-                (IndexA, IndexB)
-                for (IndexA, IndexB) in list(product(self, other))
-                if itemgetter(*summed_index_locations[0])(IndexA)
-                == itemgetter(*summed_index_locations[1])(IndexB)
-            ]
-            if len(summed_index_locations) > 0
-            else [(IndexA, IndexB) for (IndexA, IndexB) in list(product(self, other))]
-        )
-        res = self._get_einsum_metric_result(other)
-        result_indices_in_A = [
-            i[0] for i in res._get_all_repeated_location(self) if len(i) > 0
-        ]
-        result_indices_in_B = [
-            i[0] for i in res._get_all_repeated_location(other) if len(i) > 0
-        ]
-        A_indices_not_summed = [
-            i[0] for i in self._get_all_repeated_location(res) if len(i) > 0
-        ]
-        B_indices_not_summed = [
-            i[0] for i in other._get_all_repeated_location(res) if len(i) > 0
-        ]
-
-        def generator(
-            idx,
-        ):  # Possible Abstraction => create a method attribute which takes in the function and its arguments as input and structures the if statements in list compr in acordance with what is not an empty array --> apply itemgetter.
-            if not res.scalar and idx != None:
-                if (
-                    len(A_indices_not_summed) != 0 and len(B_indices_not_summed) != 0
-                ):  # e.g. A_{i}_{j}_{s} * B^{i}^{j}_{k}
-                    return [
-                        (IndicesA, IndicesB)
-                        for (IndicesA, IndicesB) in all
-                        if itemgetter(*A_indices_not_summed)(IndicesA)
-                        == itemgetter(*result_indices_in_A)(idx)
-                        and itemgetter(*B_indices_not_summed)(IndicesB)
-                        == itemgetter(*result_indices_in_B)(idx)
-                    ]
-                elif (
-                    len(A_indices_not_summed) == 0 and len(B_indices_not_summed) != 0
-                ):  # e.g. A_{i}_{j} * B^{i}^{j}_{k}
-                    return [
-                        (IndicesA, IndicesB)
-                        for (IndicesA, IndicesB) in all
-                        if itemgetter(*B_indices_not_summed)(IndicesB)
-                        == itemgetter(*result_indices_in_B)(idx)
-                    ]
-                elif (
-                    len(B_indices_not_summed) == 0 and len(A_indices_not_summed) != 0
-                ):  # e.g. A_{i}_{j}_{k} * B^{i}^{j}
-                    return [
-                        (IndicesA, IndicesB)
-                        for (IndicesA, IndicesB) in all
-                        if itemgetter(*A_indices_not_summed)(IndicesA)
-                        == itemgetter(*result_indices_in_A)(idx)
-                    ]
-            else:
-                return all
-
-        res.generator = generator
-        res.generator_implementor = self.EINSUM_GENERATOR
-        res.basis = self.basis
-        return res
+        return self._compile_einsum_product(other, self._get_einsum_metric_result(other))
 
 
 class Metric(EinsteinArray):
@@ -114,27 +50,39 @@ class Metric(EinsteinArray):
 
     @property
     def _(self):
-        if self.rank == Metric.contravariant:
-            comp = self.components
-            ind = self.indices
-            ind.basis = self.basis
-        else:
-            comp = SymbolArray(self.components.tomatrix().inv())
-            ind = MetricIndices(*[-j for j in self.indices.indices])
-            ind.basis = self.basis
-        return Metric(indices=ind, components=comp, basis=self.basis)
+        """ The metric with lower indices g_{a}_{b}. Built once, until the components change. """
+        if '_' not in self.derived:
+            self.derived['_'] = self if self.rank == Metric.contravariant else self.__inverse_metric()
+        return self.derived['_']
 
     @property
     def inv(self):
-        if self.rank == Metric.covariant:
-            comp = self.components
-            ind = self.indices
-            ind.basis = self.basis
-        else:
-            comp = SymbolArray(self.components.tomatrix().inv())
-            ind = MetricIndices(*[-j for j in self.indices.indices])
-            ind.basis = self.basis
-        return Metric(indices=ind, components=comp, basis=self.basis)
+        """ The metric with upper indices g^{a}^{b}. Built once, until the components change. """
+        if 'inv' not in self.derived:
+            self.derived['inv'] = self if self.rank == Metric.covariant else self.__inverse_metric()
+        return self.derived['inv']
+
+    @property
+    def jet(self) -> MetricJet:
+        """ First and second partial derivatives of g_{a}_{b}, each differentiated once. Kept until the components change. """
+        if 'jet' not in self.derived:
+            self.derived['jet'] = MetricJet.of(self)
+        return self.derived['jet']
+
+    @property
+    def determinant(self):
+        """ det(g_{a}_{b}), computed once until the components change. """
+        if 'determinant' not in self.derived:
+            det = self.components.tomatrix().det()
+            self.derived['determinant'] = simplified(det if self.rank == Metric.contravariant else 1 / det)
+        return self.derived['determinant']
+
+    @property
+    def sqrt_abs_determinant(self):
+        """ sqrt(|det(g_{a}_{b})|): the volume element of the metric. """
+        if 'sqrt_abs_determinant' not in self.derived:
+            self.derived['sqrt_abs_determinant'] = sqrt(Abs(self.determinant))
+        return self.derived['sqrt_abs_determinant']
 
     def __pow__(self, other):
         if other == -1:
@@ -145,10 +93,30 @@ class Metric(EinsteinArray):
             )
 
     def rs(self, other, idx):
-        return tensor_trace_product(self.inv.components, other, [[0, idx]])
+        return self.__trace_product(self.inv.components, other, [[0, idx]])
 
     def lw(self, other, idx):
-        return tensor_trace_product(self._.components, other, [[0, idx]])
+        return self.__trace_product(self._.components, other, [[0, idx]])
+
+    def __inverse_components(self):
+        if 'inverse_components' not in self.derived:
+            inverse = SymbolArray(self.components.tomatrix().inv())
+            self.derived['inverse_components'] = sparse.to_sparse(inverse) if self.sparse else inverse
+        return self.derived['inverse_components']
+
+    def __inverse_metric(self) -> 'Metric':
+        """ The metric with the opposite variance. Its own inverse is this metric, hence is never recomputed on the way back. """
+        ind = MetricIndices(*[-j for j in self.indices.indices])
+        ind.basis = self.basis
+        inverse = Metric(indices=ind, components=self.__inverse_components(), basis=self.basis)
+        inverse.derived['inverse_components'] = self.components
+        inverse.derived['_' if self.rank == Metric.contravariant else 'inv'] = self
+        return inverse
+
+    def __trace_product(self, a, b, trace):
+        if sparse.is_sparse(a) or sparse.is_sparse(b):
+            return sparse.trace_product(a, b, trace)
+        return tensor_trace_product(a, b, trace)
 
     def get_transformed_metric(self, transformation):
         ############ STEP ONE: #################
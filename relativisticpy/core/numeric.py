@@ -0,0 +1,193 @@
+"""
+Numeric einstein arrays.
+
+NumericEinsteinArray is the numeric sibling of EinsteinArray: same Indices semantics for add, multiply and self-trace,
+but the components are float64 numpy arrays and the operations are executed by np.einsum.
+The components may carry a leading batch axis (one entry per spacetime point), so a single expression in index notation is evaluated on many points at once.
+
+Numpy is an optional dependency (pip install relativisticpy[numeric]), only imported once a numeric array is used.
+"""
+
+# Standard Library
+from collections import Counter
+from string import ascii_letters
+from typing import Callable, Dict, Union
+
+# External Modules
+from relativisticpy.symengine import SymbolArray, Basic, Symbol, lambdify
+
+# This Module
+from relativisticpy.core.indices import Indices
+from relativisticpy.core.plans import flatten_components
+from relativisticpy.core import sparse
+
+
+def numpy():
+    """ Lazy import of the optional numpy dependency. """
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("NumericEinsteinArray requires numpy: pip install relativisticpy[numeric]") from error
+    return numpy
+
+
+class NumericEinsteinArray:
+    """
+    A class representing numeric arrays that operate under the Einstein summation convention.
+
+    Attributes:
+        indices (Indices): The indices of the tensor.
+        components (numpy.ndarray): float64 components of shape indices.shape, or (points, *indices.shape) when batched.
+        basis (SymbolArray): The basis (coordinates) of the tensor space.
+    """
+
+    def __init__(self, indices: Indices, components, basis: SymbolArray = None):
+        """
+        Initializes an instance of the NumericEinsteinArray class.
+
+        Args:
+            indices (Indices): The indices of the tensor. Indices with fixed values are not supported, slice the components instead.
+            components (numpy.ndarray): The tensor's components, with an optional leading batch axis.
+            basis (SymbolArray, optional): The basis vectors for the tensor space. Defaults to None.
+        """
+        np = numpy()
+        self.indices = indices
+        self.components = np.asarray(components, dtype=np.float64)
+        self.basis = basis
+
+        if self.indices.basis == None:
+            self.indices = indices = self.indices.with_basis(basis)
+
+        if indices.anyrunnig:
+            raise ValueError(f"{type(self).__name__} does not support indices with fixed values: {indices}.")
+
+        if self.components.ndim not in (len(indices), len(indices) + 1):
+            raise ValueError(f"Components of shape {self.components.shape} do not match the indices {indices}.")
+
+        if self.indices.self_summed:
+            self.__set_self_summed()
+
+    @classmethod
+    def from_einstein_array(cls, tensor, points, substitutions: Dict[Symbol, float] = None) -> 'NumericEinsteinArray':
+        """
+        Evaluates a symbolic EinsteinArray on a point set.
+
+        Args:
+            tensor (EinsteinArray): The symbolic tensor.
+            points (array_like): Coordinates of the points, shape (points, dimention) in the order of tensor.basis, or (dimention,) for a single point.
+            substitutions (Dict[Symbol, float], optional): Values of the symbols which are not coordinates, i.e. {M: 1}. Defaults to None.
+
+        Returns:
+            NumericEinsteinArray: The tensor evaluated on the points, batched if points is two dimentional.
+        """
+        np = numpy()
+        points = np.asarray(points, dtype=np.float64)
+        batched = points.ndim == 2
+        points = points if batched else points[None, :]
+        basis = list(tensor.basis)
+
+        components = sparse.to_dense(tensor.components)
+        flat = list(flatten_components(components))
+        if substitutions:
+            flat = [expr.subs(substitutions) if isinstance(expr, Basic) else expr for expr in flat]
+        free = set().union(*[getattr(expr, 'free_symbols', set()) for expr in flat]) - set(basis)
+        if len(free) > 0:
+            raise ValueError(f"Symbols {free} must be given values via substitutions to evaluate {tensor} numerically.")
+
+        function = lambdify(basis, flat, modules="numpy")
+        values = [np.broadcast_to(np.asarray(value, dtype=np.float64), (points.shape[0],)) for value in function(*points.T)]
+        result = np.stack(values, axis=-1).reshape((points.shape[0],) + tuple(components.shape))
+        return cls(indices=tensor.indices, components=result if batched else result[0], basis=tensor.basis)
+
+    @property
+    def rank(self): return self.indices.rank
+
+    @property
+    def scalar(self) -> bool: return self.rank == (0, 0)
+
+    @property
+    def batched(self) -> bool:
+        """ True if the components carry a leading batch (points) axis. """
+        return self.components.ndim == len(self.indices) + 1
+
+    @property
+    def shape(self): return self.indices.shape
+
+    @property
+    def dimention(self): return len(self.basis)
+
+    @property
+    def scalar_comp_value(self):
+        """ The scalar value (one per point when batched) of a scalar tensor, the components otherwise. """
+        return self.components if not self.scalar or self.batched else float(self.components)
+
+    # Dunders
+    def __neg__(self) -> 'NumericEinsteinArray': return NumericEinsteinArray(self.indices, -self.components, self.basis)
+
+    def __add__(self, other: 'NumericEinsteinArray') -> 'NumericEinsteinArray': return self.__additive_operation(other, lambda a, b: a + b)
+
+    def __sub__(self, other: 'NumericEinsteinArray') -> 'NumericEinsteinArray': return self.__additive_operation(other, lambda a, b: a - b)
+
+    def __mul__(self, other: Union['NumericEinsteinArray', float, int]) -> Union['NumericEinsteinArray', float]:
+        if isinstance(other, (float, int, Basic)):
+            return NumericEinsteinArray(self.indices, float(other) * self.components, self.basis)
+
+        if not isinstance(other, NumericEinsteinArray):
+            raise TypeError(f"Unsupported operand type(s) for *: '{type(self).__name__}' and '{type(other).__name__}'")
+
+        np = numpy()
+        resulting_indices = self.indices.einsum_product(other.indices)
+        repeated = [symbol for symbol, count in Counter([idx.symbol for idx in resulting_indices.indices]).items() if count > 1]
+        if len(repeated) > 0:
+            raise ValueError(f"Index '{repeated[0]}' is repeated with the same variance in {self.indices} * {other.indices}: one must be upper and the other lower to be summed.")
+        letters = _letters(self.indices, other.indices)
+        subscripts = f"...{_subscripts(self.indices, letters)},...{_subscripts(other.indices, letters)}->...{_subscripts(resulting_indices, letters)}"
+        result = NumericEinsteinArray(resulting_indices, np.einsum(subscripts, self.components, other.components, optimize=True), self.basis)
+        return result.scalar_comp_value if result.scalar else result
+
+    def __rmul__(self, other: Union[float, int]) -> 'NumericEinsteinArray': return self * other
+
+    def __truediv__(self, other: Union[float, int]) -> 'NumericEinsteinArray':
+        if not isinstance(other, (float, int, Basic)):
+            raise TypeError(f"unsupported operand type(s) for / or __truediv__(): '{type(self).__name__}' and {type(other).__name__}")
+        elif other == 0:
+            raise ZeroDivisionError("division by zero")
+        return NumericEinsteinArray(self.indices, self.components / float(other), self.basis)
+
+    def __repr__(self) -> str: return f"NumericEinsteinArray({self.indices}, shape={self.components.shape})"
+
+    # Privates
+    def __additive_operation(self, other: 'NumericEinsteinArray', operation: Callable) -> 'NumericEinsteinArray':
+        if not isinstance(other, NumericEinsteinArray):
+            raise TypeError(f"Unsupported operand type(s): '{type(self).__name__}' and '{type(other).__name__}'")
+        if not self.indices.symbol_and_symbol_rank_eq(other.indices) or len(self.indices) != len(other.indices):
+            raise ValueError(f"Cannot add or subtract tensors with indices {self.indices} and {other.indices}.")
+
+        np = numpy()
+        resulting_indices = self.indices._get_additive_result() # Shape only: the generators of additive_product are not needed.
+        resulting_indices.basis = self.indices.basis
+        letters = _letters(self.indices)
+        # Align the axes of B onto the axes of A, i.e. A_{a}_{b} + B_{b}_{a}.
+        aligned = np.einsum(f"...{_subscripts(other.indices, letters)}->...{_subscripts(self.indices, letters)}", other.components)
+        return NumericEinsteinArray(resulting_indices, operation(self.components, aligned), self.basis)
+
+    def __set_self_summed(self) -> None:
+        """ Traces the components over the contracted indices, i.e. T^{a}_{a}_{b}. """
+        np = numpy()
+        resulting_indices = self.indices._get_selfsum_result()
+        resulting_indices.basis = self.indices.basis
+        letters = _letters(self.indices)
+        self.components = np.einsum(f"...{_subscripts(self.indices, letters)}->...{_subscripts(resulting_indices, letters)}", self.components)
+        self.indices = resulting_indices
+
+
+# Privates
+def _letters(*indices: Indices) -> Dict[str, str]:
+    """ One einsum subscript letter per index symbol: contracted indices share their symbol, hence their letter. """
+    symbols = list(dict.fromkeys([idx.symbol for ind in indices for idx in ind.indices]))
+    if len(symbols) > len(ascii_letters):
+        raise ValueError(f"Too many distinct indices ({len(symbols)}) for a numeric contraction.")
+    return {symbol: letter for symbol, letter in zip(symbols, ascii_letters)}
+
+
+def _subscripts(indices: Indices, letters: Dict[str, str]) -> str: return "".join([letters[idx.symbol] for idx in indices.indices])
@@ -0,0 +1,241 @@
+# Standard Library
+from functools import lru_cache
+from itertools import product
+from typing import Dict, List, Tuple
+
+# External Modules
+from relativisticpy.symengine import SymbolArray
+
+# This Module
+from relativisticpy.core import sparse
+
+# Component positions are tuples of ints i.e. (0, 2, 1) for T_{a:0}_{b:2}_{c:1}
+Position = Tuple[int, ...]
+
+
+def strides(shape: Tuple[int, ...]) -> Tuple[int, ...]:
+    """ Row-major strides of an array of given shape: flat_offset = sum(i * s for i, s in zip(position, strides)). """
+    result, step = [], 1
+    for dim in reversed(shape):
+        result.append(step)
+        step *= dim
+    return tuple(reversed(result))
+
+
+def flat_offset(position: Position, strides: Tuple[int, ...]) -> int: return sum([i * s for i, s in zip(position, strides)])
+
+
+def flatten_components(components) -> List:
+    """ Returns the components of an array as a flat (row-major) list, without going through the tuple-key __getitem__ of sympy arrays. """
+    if hasattr(components, '_array'):
+        return components._array
+    if isinstance(components, (list, tuple)):
+        return [j for i in components for j in flatten_components(i)] if any([isinstance(i, (list, tuple)) for i in components]) else list(components)
+    if hasattr(components, 'shape'):
+        return [components[i] for i in product(*[range(dim) for dim in components.shape])]
+    return [components]
+
+
+class ContractionPlan:
+    """
+    Compiled summation plan of the einstein summation convention between two indices signatures A and B.
+    Maps every resulting position to the exact list of (A, B) positions which are multiplied and summed into it.
+
+    The plan only depends on the positional structure of the product (which positions are summed, where the free ones land in the result
+    and the values each position iterates over), not on the symbols used. Hence g^{a}^{b} * R_{a}_{c}_{b}_{d} and g^{m}^{n} * R_{m}_{c}_{n}_{d} share a plan.
+    """
+
+    def __init__(self, terms: Dict[Position, List[Tuple[Position, Position]]], shape_a: Tuple[int, ...], shape_b: Tuple[int, ...], shape_res: Tuple[int, ...]):
+        self.terms = terms
+        self.shape = shape_res
+        strides_a, strides_b, strides_res = strides(shape_a), strides(shape_b), strides(shape_res)
+        self.offsets: Tuple[Tuple[int, Tuple[Tuple[int, int], ...]], ...] = tuple(
+            (flat_offset(res, strides_res), tuple([(flat_offset(a, strides_a), flat_offset(b, strides_b)) for a, b in pairs]))
+            for res, pairs in terms.items()
+        )
+
+        self._by_a = None
+        self._by_b = None
+
+    @property
+    def all(self) -> List[Tuple[Position, Position]]: return [pair for pairs in self.terms.values() for pair in pairs]
+
+    def generator(self, idx: Position = None) -> List[Tuple[Position, Position]]:
+        """ Same contract as the Indices.generator: all (A, B) position pairs summed into result position idx. """
+        if idx == None or len(self.shape) == 0:
+            return self.all
+        return list(self.terms.get(tuple(idx), []))
+
+    @property
+    def by_a(self) -> Dict[int, List[Tuple[int, int]]]:
+        """ A offset => [(B offset, result offset)]. Index used to walk the plan from the non-zero components of a sparse A. """
+        if self._by_a == None:
+            self._by_a = {}
+            for res, pairs in self.offsets:
+                for a, b in pairs:
+                    self._by_a.setdefault(a, []).append((b, res))
+        return self._by_a
+
+    @property
+    def by_b(self) -> Dict[int, List[Tuple[int, int]]]:
+        """ B offset => [(A offset, result offset)]. """
+        if self._by_b == None:
+            self._by_b = {}
+            for res, pairs in self.offsets:
+                for a, b in pairs:
+                    self._by_b.setdefault(b, []).append((a, res))
+        return self._by_b
+
+    def execute(self, A, B, operation) -> SymbolArray:
+        """ Executes the plan on the components of A and B: result[res] = sum(operation(A[a], B[b]) for a, b in plan[res]). """
+        if sparse.is_sparse(A) or sparse.is_sparse(B):
+            return sparse.einsum(self, A, B, operation)
+        flat_a, flat_b = flatten_components(A), flatten_components(B)
+        result = SymbolArray.zeros(*self.shape)
+        flat_res = flatten_components(result)
+        for res, pairs in self.offsets:
+            flat_res[res] = sum([operation(flat_a[a], flat_b[b]) for a, b in pairs])
+        return result
+
+
+@lru_cache(maxsize=512)
+def einsum_plan(
+    ranges_a: Tuple[Tuple[int, ...], ...],
+    ranges_b: Tuple[Tuple[int, ...], ...],
+    summed: Tuple[Tuple[int, int], ...],
+    free_a: Tuple[Tuple[int, int], ...],
+    free_b: Tuple[Tuple[int, int], ...],
+    shape_a: Tuple[int, ...],
+    shape_b: Tuple[int, ...],
+    shape_res: Tuple[int, ...],
+) -> ContractionPlan:
+    """
+    Compiles (once, then served from the LRU cache) the contraction plan of A * B.
+
+    Args:
+        ranges_a, ranges_b: Values iterated by each position of A and B.
+        summed: (A position, B position) pairs which are summed over.
+        free_a, free_b: (result position, A or B position) pairs of the free indices.
+        shape_a, shape_b, shape_res: Shapes of the component arrays.
+    """
+    # Bucket B positions on the values of their summed positions => we only ever visit pairs which contribute.
+    buckets: Dict[Position, List[Position]] = {}
+    for idx_b in product(*ranges_b):
+        buckets.setdefault(tuple([idx_b[j] for _, j in summed]), []).append(idx_b)
+
+    terms: Dict[Position, List[Tuple[Position, Position]]] = {}
+    for idx_a in product(*ranges_a):
+        for idx_b in buckets.get(tuple([idx_a[i] for i, _ in summed]), []):
+            res = [None] * len(shape_res)
+            for position, i in free_a:
+                res[position] = idx_a[i]
+            if any([res[position] not in (None, idx_b[j]) for position, j in free_b]):
+                continue
+            for position, j in free_b:
+                res[position] = idx_b[j]
+            terms.setdefault(tuple(res), []).append((idx_a, idx_b))
+
+    return ContractionPlan(terms, shape_a, shape_b, shape_res)
+
+
+@lru_cache(maxsize=512)
+def additive_plan(
+    ranges_a: Tuple[Tuple[int, ...], ...],
+    ranges_b: Tuple[Tuple[int, ...], ...],
+    repeated: Tuple[Tuple[int, int], ...],
+    shape_a: Tuple[int, ...],
+    shape_b: Tuple[int, ...],
+) -> Tuple[Tuple[int, int], ...]:
+    """
+    Compiles the (A offset, B offset) pairs combined by A + B, the result having the layout of A.
+
+    Args:
+        ranges_a, ranges_b: Values iterated by each position of A and B.
+        repeated: (A position, B position) pairs of the repeated indices, i.e. A_{a}_{b} + B_{b}_{a} => ((0, 1), (1, 0)).
+        shape_a, shape_b: Shapes of the component arrays.
+
+    Returns:
+        None if A and B are aligned (same layout, every value iterated) => a plain elementwise combine of the flat buffers.
+    """
+    if shape_a == shape_b and all([i == j for i, j in repeated]) and len(repeated) == len(shape_a) and all([r == tuple(range(dim)) for r, dim in zip(ranges_a + ranges_b, shape_a + shape_b)]):
+        return None
+    strides_a, strides_b = strides(shape_a), strides(shape_b)
+    to_b = [i for i, _ in sorted(repeated, key=lambda location: location[1])]
+    return tuple([
+        (flat_offset(idx_a, strides_a), flat_offset(idx_b, strides_b))
+        for idx_a in product(*ranges_a)
+        for idx_b in [tuple([idx_a[i] for i in to_b])]
+        if all([v in r for v, r in zip(idx_b, ranges_b)])
+    ])
+
+
+@lru_cache(maxsize=512)
+def selfsum_plan(
+    ranges: Tuple[Tuple[int, ...], ...],
+    summed: Tuple[Tuple[int, int], ...],
+    shape: Tuple[int, ...],
+) -> Tuple[Tuple[int, Tuple[int, ...]], ...]:
+    """
+    Compiles the trace of A over the summed (position, position) pairs, i.e. T^{a}_{a}_{b} => ((0, 1),).
+    Walks the diagonal with strides: each result offset maps to the flat offsets of A summed into it.
+    """
+    strides_a = strides(shape)
+    contracted = set([i for pair in summed for i in pair])
+    free = [i for i in range(len(shape)) if i not in contracted]
+    strides_res = strides(tuple([shape[i] for i in free]))
+    # A diagonal step moves along both positions of a summed pair at once.
+    diagonals = [([v for v in ranges[i] if v in ranges[j]], strides_a[i] + strides_a[j]) for i, j in summed]
+    diagonal_offsets = [sum([v * step for v, (_, step) in zip(values, diagonals)]) for values in product(*[values for values, _ in diagonals])]
+    return tuple([
+        (flat_offset(idx, strides_res), tuple([flat_offset(idx, [strides_a[i] for i in free]) + offset for offset in diagonal_offsets]))
+        for idx in product(*[ranges[i] for i in free])
+    ])
+
+
+@lru_cache(maxsize=512)
+def covariant_plan(variance: Tuple[bool, ...], dimension: int) -> Tuple[Tuple[int, Tuple[Tuple[int, int, int], ...]], ...]:
+    """
+    Compiles the connection terms of the covariant derivative D_{a} T, for T of given index variance (True for a lower index):
+    + C^{t}_{a}_{e} T^{..e..} per upper index t and - C^{e}_{a}_{t} T_{..e..} per lower index t.
+
+    Returns:
+        Per flat offset of the result (layout a, t_1, ..., t_k): the ((sign, C offset, T offset), ...) terms summed into it, over the flat
+        components of the connection C^{i}_{j}_{k} and of T.
+    """
+    rank = len(variance)
+    strides_t, strides_c = strides((dimension,) * rank), strides((dimension,) * 3)
+    size = dimension ** rank
+    plan = []
+    for a in range(dimension):
+        for idx in product(range(dimension), repeat=rank):
+            terms = []
+            for position, covariant in enumerate(variance):
+                for e in range(dimension):
+                    contracted = idx[:position] + (e,) + idx[position + 1:]
+                    connection = (e, a, idx[position]) if covariant else (idx[position], a, e)
+                    terms.append((-1 if covariant else 1, flat_offset(connection, strides_c), flat_offset(contracted, strides_t)))
+            plan.append((a * size + flat_offset(idx, strides_t), tuple(terms)))
+    return tuple(plan)
+
+
+@lru_cache(maxsize=512)
+def lie_plan(variance: Tuple[bool, ...], dimension: int) -> Tuple[Tuple[int, Tuple[Tuple[int, int, int], ...]], ...]:
+    """
+    Compiles the terms of the Lie derivative L_X T which differentiate X, for T of given index variance (True for a lower index):
+    - d_e X^{t} T^{..e..} per upper index t and + d_t X^{e} T_{..e..} per lower index t.
+
+    Returns:
+        Per flat offset of T: the ((sign, J offset, T offset), ...) terms summed into it, over the flat jacobian J[i, j] = d_j X^{i}.
+    """
+    rank = len(variance)
+    strides_t, strides_j = strides((dimension,) * rank), strides((dimension,) * 2)
+    plan = []
+    for idx in product(range(dimension), repeat=rank):
+        terms = []
+        for position, covariant in enumerate(variance):
+            for e in range(dimension):
+                contracted = idx[:position] + (e,) + idx[position + 1:]
+                jacobian = (e, idx[position]) if covariant else (idx[position], e)
+                terms.append((1 if covariant else -1, flat_offset(jacobian, strides_j), flat_offset(contracted, strides_t)))
+        plan.append((flat_offset(idx, strides_t), tuple(terms)))
+    return tuple(plan)
@@ -0,0 +1,209 @@
+"""
+Simplification scheduler.
+
+Simplifying the components is by far the largest wall-clock cost of the kernels, and a full simplify can hang on Kerr-like metrics.
+Every kernel hands its (independent) components to the current Simplifier, which decides:
+    - the strategy: 'none', 'cancel', 'together', 'trigsimp', 'simplify' (default) or a custom pipeline of these and/or callables,
+    - a time budget per component: once exceeded the best form so far (the result of the last completed stage) is kept,
+    - the number of processes the components are simplified across,
+    - whether the subexpressions shared by the components of a tensor are eliminated (cse): each is then simplified once,
+      and the compact components hold the reduced forms until viewed (see core.cse).
+
+    with using(Simplifier('cancel', timeout=2)):
+        Riemann(indices, metric)
+
+A Workbook session sets its own policy: Workbook(simplification=Simplifier(('cancel', 'trigsimp'), processes=4)).
+"""
+
+# Standard Library
+import atexit
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from time import monotonic
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+# External Modules
+from relativisticpy.symengine import Basic, NDimArray, SymbolArray, cancel, together, trigsimp, simplify, sympify, srepr
+
+# This Module
+from relativisticpy.core.cse import eliminate, expand_subexpressions, subexpressions
+from relativisticpy.core.plans import flatten_components
+from relativisticpy.core.symmetry import SymmetricComponents
+from relativisticpy.core import sparse
+
+STRATEGIES = {
+    'none': lambda expr: expr,
+    'cancel': cancel,
+    'together': together,
+    'trigsimp': trigsimp,
+    'simplify': simplify,
+}
+
+Stage = Union[str, Callable]
+
+
+class SimplificationTimeout(Exception):
+    """ Raised within a stage once the time budget of the component is spent. """
+
+
+@dataclass(frozen=True)
+class Simplifier:
+    """
+    Attributes:
+        strategy (Union[str, Tuple[Stage, ...]]): Name of a strategy, or a pipeline of names and callables (expr -> expr) applied in order.
+        timeout (float, optional): Time budget per component, in seconds. None for no budget.
+        processes (int, optional): Number of processes the components are simplified across. None (or 1) simplifies in process.
+            Callables of custom pipelines must then be picklable, i.e. module level functions. The pool is started on first use and kept
+            until exit.
+        cse (bool): Eliminates the subexpressions shared by the independent components of a tensor. The components keep the reduced forms
+            (for the kernels downstream) and are expanded and simplified once materialized, i.e. when the user views them.
+    """
+
+    strategy: Union[str, Tuple[Stage, ...]] = 'simplify'
+    timeout: Optional[float] = None
+    processes: Optional[int] = None
+    cse: bool = False
+
+    def __post_init__(self):
+        if not isinstance(self.strategy, str):
+            object.__setattr__(self, 'strategy', tuple(self.strategy))
+        unknown = [stage for stage in self.pipeline if isinstance(stage, str) and stage not in STRATEGIES]
+        if len(unknown) > 0:
+            raise ValueError(f"Unknown simplification strategies {unknown}, expected callables or one of {list(STRATEGIES)}.")
+
+    @property
+    def pipeline(self) -> Tuple[Stage, ...]: return (self.strategy,) if isinstance(self.strategy, str) else self.strategy
+
+    def expression(self, expr):
+        """ Simplifies one component within the time budget. """
+        if self.strategy == 'none':
+            return expr
+        expr = sympify(expr)
+        best, deadline = expr, None if self.timeout == None else monotonic() + self.timeout
+        for stage in self.pipeline:
+            function = STRATEGIES[stage] if isinstance(stage, str) else stage
+            remaining = None if deadline == None else deadline - monotonic()
+            if remaining != None and remaining <= 0:
+                break
+            try:
+                with _budget(remaining):
+                    best = function(best)
+            except SimplificationTimeout:
+                break
+        return best
+
+    def map(self, expressions: List) -> List:
+        """ Simplifies every expression, across the process pool if any. """
+        # The subexpression atoms carry their definitions, which do not survive the transfer: expressions holding any are simplified in process.
+        work = [i for i, expr in enumerate(expressions) if isinstance(expr, Basic) and not expr.is_number and len(subexpressions(expr)) == 0]
+        if self.processes == None or self.processes <= 1 or len(work) <= 1:
+            return [self.expression(expr) for expr in expressions]
+
+        # Expressions travel as srepr strings: undefined functions (i.e. f(r)) are not picklable.
+        results = list(_pool(self.processes).map(_simplify_srepr, [(self, srepr(expressions[i])) for i in work]))
+        pending = set(work)
+        simplified = [expr if i in pending else self.expression(expr) for i, expr in enumerate(expressions)]
+        for i, result in zip(work, results):
+            simplified[i] = sympify(result)
+        return simplified
+
+    def view(self, expr):
+        """ A reduced component as viewed by the user: its subexpressions expanded, then simplified. """
+        return replace(self, cse=False).expression(expand_subexpressions(expr))
+
+    def __call__(self, components):
+        """ Simplifies SymmetricComponents (independent components only), dense or sparse arrays and scalars. """
+        if isinstance(components, SymmetricComponents):
+            positions = list(components.values)
+            values = [components.values[position] for position in positions]
+            if self.cse:
+                # Each shared subexpression is simplified once, then the (far smaller) reduced components.
+                _, reduced = eliminate(values, self.expression)
+                return SymmetricComponents(components.symmetries, components.shape, dict(zip(positions, self.map(reduced))), components.sparse, self.view)
+            return SymmetricComponents(components.symmetries, components.shape, dict(zip(positions, self.map(values))), components.sparse)
+        if self.cse:
+            # Arrays and scalars are results the user views.
+            components = components.applyfunc(expand_subexpressions) if isinstance(components, NDimArray) else expand_subexpressions(components)
+        if sparse.is_sparse(components):
+            items = sparse.nonzero_items(components)
+            result = sparse.zeros(components.shape, True)
+            for (position, _), value in zip(items, self.map([value for _, value in items])):
+                result[position] = value
+            return result
+        if isinstance(components, NDimArray):
+            return SymbolArray(self.map(list(flatten_components(components))), components.shape)
+        return self.expression(components)
+
+
+_current = Simplifier()
+
+
+def current() -> Simplifier:
+    """ The simplification policy the kernels currently use. """
+    return _current
+
+
+def set_simplifier(simplifier: Simplifier) -> None:
+    global _current
+    _current = simplifier
+
+
+@contextmanager
+def using(simplifier: Simplifier):
+    """ Temporarily sets the simplification policy. """
+    previous = current()
+    set_simplifier(simplifier)
+    try:
+        yield simplifier
+    finally:
+        set_simplifier(previous)
+
+
+def simplified(components):
+    """ Simplifies components with the current policy. """
+    return current()(components)
+
+
+# Privates
+_pools: Dict[int, ProcessPoolExecutor] = {}
+
+
+def _pool(processes: int) -> ProcessPoolExecutor:
+    """ The pool of given size, created once per session: the workers receive the policy with each job, hence serve every Simplifier. """
+    if processes not in _pools:
+        _pools[processes] = ProcessPoolExecutor(max_workers=processes)
+    return _pools[processes]
+
+
+@atexit.register
+def _shutdown_pools() -> None:
+    for pool in _pools.values():
+        pool.shutdown()
+    _pools.clear()
+
+
+@contextmanager
+def _budget(seconds: Optional[float]):
+    """ Interrupts the block after seconds (SIGALRM: unix main threads only, elsewhere the block runs without budget). """
+    if seconds == None or not hasattr(signal, 'setitimer') or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def interrupt(signum, frame):
+        raise SimplificationTimeout()
+
+    previous = signal.signal(signal.SIGALRM, interrupt)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _simplify_srepr(job: Tuple[Simplifier, str]) -> str:
+    simplifier, expr = job
+    return srepr(simplifier.expression(sympify(expr)))
@@ -0,0 +1,143 @@
+"""
+Sparse component storage.
+
+Opt-in: any EinsteinArray (or Metric) initialized with a SparseSymbolArray as components - a dictionary of the non-zero components with a known shape -
+has its einstein summation convention operations executed over the non-zero components only. Results of operations involving a sparse array are sparse.
+"""
+
+# Standard Library
+from typing import Callable, Dict, List, Tuple
+
+# External Modules
+from relativisticpy.symengine import SymbolArray, SparseSymbolArray, SparseNDimArray
+
+Position = Tuple[int, ...]
+
+
+def is_sparse(components) -> bool: return isinstance(components, SparseNDimArray)
+
+
+def zeros(shape: Tuple[int, ...], sparse: bool = False):
+    """ Zero array of given shape. Rank zero arrays are always dense as sympy does not support rank zero sparse arrays. """
+    return SparseSymbolArray.zeros(*shape) if sparse and len(shape) > 0 else SymbolArray.zeros(*shape)
+
+
+def to_sparse(components): return components if is_sparse(components) or len(components.shape) == 0 else SparseSymbolArray(components)
+
+
+def to_dense(components):
+    """ Dense copy of sparse components. Note: SymbolArray(sparse_array) does not convert correctly, hence we fill the flat list ourselves. """
+    if not is_sparse(components):
+        return components
+    flat = [0] * len(components)
+    for offset, value in nonzero(components).items():
+        flat[offset] = value
+    return SymbolArray(flat, components.shape)
+
+
+def nonzero(components) -> Dict[int, object]:
+    """ Flat offset => value of all non-zero components. For sparse arrays this is the underlying dictionary itself (no copy). """
+    if is_sparse(components):
+        return components._sparse_array
+    if hasattr(components, '_array'):
+        return {offset: value for offset, value in enumerate(components._array) if value != 0}
+    return {offset: value for offset, value in enumerate(components) if value != 0}
+
+
+def nonzero_items(components) -> List[Tuple[Position, object]]:
+    """ (position, value) of all non-zero components. Used by the geometric kernels to skip zero factors. """
+    shape = components.shape
+    return [(_position(offset, shape), value) for offset, value in nonzero(components).items()]
+
+
+def einsum(plan, A, B, operation: Callable):
+    """
+    Executes a ContractionPlan only over the non-zero components of A and B.
+    Assumes operation(a, 0) == operation(0, b) == 0, which holds for products (and derivatives of components).
+    """
+    nonzero_a, nonzero_b = nonzero(A), nonzero(B)
+    # Iterate from whichever side has the fewest non-zero components.
+    if len(nonzero_a) <= len(nonzero_b):
+        contributions = ((res, operation(value, nonzero_b[b])) for a, value in nonzero_a.items() for b, res in plan.by_a.get(a, ()) if b in nonzero_b)
+    else:
+        contributions = ((res, operation(nonzero_a[a], value)) for b, value in nonzero_b.items() for a, res in plan.by_b.get(b, ()) if a in nonzero_a)
+
+    return _from_offsets(_accumulate(contributions), plan.shape)
+
+
+def additive(A, B, locations: List[Tuple[int, int]], ranges: Tuple[Tuple[int, ...], ...], operation: Callable):
+    """
+    Adds (or subtracts) B from A over the union of their non-zero components.
+    locations: (A position, B position) pairs of the repeated indices, i.e. A_{a}_{b} + B_{b}_{a} => [(0, 1), (1, 0)].
+    """
+    to_a = [j for _, j in sorted(locations)]
+    to_b = [i for i, _ in sorted(locations, key=lambda location: location[1])]
+    dense_a, dense_b = dict(nonzero_items(A)), dict(nonzero_items(B))
+
+    positions = set(dense_a) | set([tuple([b[j] for j in to_a]) for b in dense_b])
+    result = {}
+    for a in positions:
+        if all([i in r for i, r in zip(a, ranges)]):
+            value = operation(dense_a.get(a, 0), dense_b.get(tuple([a[i] for i in to_b]), 0))
+            if value != 0:
+                result[a] = value
+    return _from_positions(result, A.shape)
+
+
+def selfsum(A, contracted: List[Tuple[int, int]], ranges: Tuple[Tuple[int, ...], ...]):
+    """ Trace of A over the contracted (position, position) pairs, i.e. T^{a}_{a}_{b} => [(0, 1)]. """
+    summed = set([i for pair in contracted for i in pair])
+    kept = [i for i in range(len(A.shape)) if i not in summed]
+    contributions = (
+        (tuple([position[i] for i in kept]), value)
+        for position, value in nonzero_items(A)
+        if all([position[i] == position[j] for i, j in contracted]) and all([i in r for i, r in zip(position, ranges)])
+    )
+    result = _accumulate(contributions)
+    return _from_positions(result, tuple([A.shape[i] for i in kept]))
+
+
+def trace_product(a, b, trace: List[List[int]]):
+    """ Sparse equivalent of relativisticpy.utils.tensor_trace_product: tensor product of a and b traced over the trace position pairs. """
+    trace_a, trace_b = [i for i, _ in trace], [j for _, j in trace]
+    kept_a = [i for i in range(len(a.shape)) if i not in trace_a]
+    kept_b = [j for j in range(len(b.shape)) if j not in trace_b]
+
+    buckets: Dict[Position, List[Tuple[Position, object]]] = {}
+    for position, value in nonzero_items(b):
+        buckets.setdefault(tuple([position[j] for j in trace_b]), []).append((position, value))
+
+    contributions = (
+        (tuple([pa[i] for i in kept_a] + [pb[j] for j in kept_b]), va * vb)
+        for pa, va in nonzero_items(a)
+        for pb, vb in buckets.get(tuple([pa[i] for i in trace_a]), ())
+    )
+    return _from_positions(_accumulate(contributions), tuple([a.shape[i] for i in kept_a] + [b.shape[j] for j in kept_b]))
+
+
+# Privates
+def _position(offset: int, shape: Tuple[int, ...]) -> Position:
+    position = []
+    for dim in reversed(shape):
+        offset, i = divmod(offset, dim)
+        position.append(i)
+    return tuple(reversed(position))
+
+
+def _accumulate(contributions) -> Dict:
+    result = {}
+    for key, value in contributions:
+        result[key] = result[key] + value if key in result else value
+    return {key: value for key, value in result.items() if value != 0}
+
+
+def _from_offsets(values: Dict[int, object], shape: Tuple[int, ...]):
+    if len(shape) == 0:
+        return SymbolArray([values.get(0, 0)], ())
+    return SparseSymbolArray(values, shape)
+
+
+def _from_positions(values: Dict[Position, object], shape: Tuple[int, ...]):
+    if len(shape) == 0:
+        return SymbolArray([values.get((), 0)], ())
+    return SparseSymbolArray(values, shape)
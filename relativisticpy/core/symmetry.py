@@ -0,0 +1,151 @@
+"""
+Index symmetries of multi-indexed arrays.
+
+Tensors which are symmetric or antisymmetric in some of their indices only have a fraction of independent components,
+i.e. in 4D the Riemann tensor R_{a}_{b}_{c}_{d} has 21 independent components (20 with the Bianchi identity) out of 256.
+An EinsteinArray subclass declares its symmetries as the class attribute `symmetries`. The kernels then only compute (and simplify) the
+independent components, stored as SymmetricComponents, and every other component is read from them by permutation and sign.
+"""
+
+# Standard Library
+from functools import lru_cache
+from itertools import product
+from typing import Callable, Dict, List, Tuple
+
+# This Module
+from relativisticpy.core import sparse
+
+Position = Tuple[int, ...]
+
+
+class Symmetry:
+    """ Generator of a symmetry group: a permutation of the index positions and the sign the component picks up under it. """
+
+    def __init__(self, permutation: Dict[int, int], sign: int):
+        self.permutation = tuple(sorted(permutation.items()))
+        self.sign = sign
+
+    def apply(self, position: Position) -> Position:
+        new = list(position)
+        for i, j in self.permutation:
+            new[j] = position[i]
+        return tuple(new)
+
+    def __eq__(self, other: 'Symmetry') -> bool: return isinstance(other, Symmetry) and (self.permutation, self.sign) == (other.permutation, other.sign)
+    def __hash__(self) -> int: return hash((self.permutation, self.sign))
+    def __repr__(self) -> str: return f"{type(self).__name__}{self.permutation, self.sign}"
+
+
+class Symmetric(Symmetry):
+    """ T_{..a..b..} = T_{..b..a..} """
+    def __init__(self, i: int, j: int): super().__init__({i: j, j: i}, 1)
+
+
+class Antisymmetric(Symmetry):
+    """ T_{..a..b..} = - T_{..b..a..} """
+    def __init__(self, i: int, j: int): super().__init__({i: j, j: i}, -1)
+
+
+class PairExchange(Symmetry):
+    """ T_{..a..b..c..d..} = T_{..c..d..a..b..} for the index pairs (a, b) and (c, d). """
+    def __init__(self, first: Tuple[int, int], second: Tuple[int, int]): super().__init__({first[0]: second[0], first[1]: second[1], second[0]: first[0], second[1]: first[1]}, 1)
+
+
+class IndexSymmetries:
+    """ Symmetry group of the index positions of an array, generated by Symmetric, Antisymmetric and PairExchange generators. """
+
+    def __init__(self, *generators: Symmetry):
+        self.generators: Tuple[Symmetry, ...] = tuple(generators)
+
+    def canonical(self, position: Position) -> Tuple[Position, int]:
+        """
+        Returns the canonical (independent) position of the orbit of position and the sign s such that T[position] = s * T[canonical].
+        A sign of 0 means the component vanishes identically, i.e. T_{a}_{a} of an antisymmetric tensor.
+        """
+        orbit = {position: 1}
+        stack = [position]
+        while stack:
+            current = stack.pop()
+            for generator in self.generators:
+                new, sign = generator.apply(current), orbit[current] * generator.sign
+                if new not in orbit:
+                    orbit[new] = sign
+                    stack.append(new)
+                elif orbit[new] != sign:
+                    return min(orbit), 0
+        canonical = min(orbit)
+        return canonical, orbit[canonical]
+
+    def table(self, shape: Tuple[int, ...]) -> Dict[Position, Tuple[Position, int]]:
+        """ position => (canonical position, sign) for every position of an array of given shape. Compiled once per shape. """
+        return _symmetry_table(self, shape)
+
+    def independent(self, shape: Tuple[int, ...]) -> List[Position]:
+        """ The independent (canonical and not identically zero) positions of an array of given shape. """
+        return [position for position, (canonical, sign) in self.table(shape).items() if position == canonical and sign != 0]
+
+    def compute(self, shape: Tuple[int, ...], component: Callable[..., object], sparse: bool = False) -> 'SymmetricComponents':
+        """ Builds SymmetricComponents by calling component(*position) on the independent positions only. """
+        return SymmetricComponents(self, shape, {position: component(*position) for position in self.independent(shape)}, sparse)
+
+    def compress(self, components) -> 'SymmetricComponents':
+        """ Keeps only the independent components of a full array, which is assumed to satisfy the symmetries. """
+        return SymmetricComponents(self, components.shape, {position: components[position] for position in self.independent(components.shape)}, sparse.is_sparse(components))
+
+    def __eq__(self, other: 'IndexSymmetries') -> bool: return isinstance(other, IndexSymmetries) and self.generators == other.generators
+    def __hash__(self) -> int: return hash(self.generators)
+    def __len__(self) -> int: return len(self.generators)
+    def __repr__(self) -> str: return f"IndexSymmetries{self.generators}"
+
+
+class SymmetricComponents:
+    """
+    Compact component storage: only the independent components of a tensor with index symmetries are kept.
+    Reading any component returns the independent one it is related to, by permutation and sign.
+    Materialized into a SymbolArray (see to_array) only at the API boundaries, i.e. when the einstein summation convention operations need the full array.
+    """
+
+    def __init__(self, symmetries: IndexSymmetries, shape: Tuple[int, ...], values: Dict[Position, object], sparse: bool = False, view: Callable = None):
+        self.symmetries = symmetries
+        self.shape = tuple(shape)
+        self.values = values
+        self.sparse = sparse
+        self.view = view # Applied to the independent components once materialized, i.e. expands the common subexpressions (see core.cse).
+        self._table = symmetries.table(self.shape)
+
+    @property
+    def rank(self) -> int: return len(self.shape)
+
+    def __getitem__(self, position: Position):
+        canonical, sign = self._table[tuple(position)]
+        return 0 if sign == 0 else sign * self.values.get(canonical, 0)
+
+    def __len__(self) -> int: return len(self._table)
+
+    def applyfunc(self, func: Callable) -> 'SymmetricComponents':
+        """ Applies func on the independent components only, i.e. simplify. """
+        return SymmetricComponents(self.symmetries, self.shape, {position: func(value) for position, value in self.values.items()}, self.sparse, self.view)
+
+    def to_array(self):
+        array = sparse.zeros(self.shape, self.sparse)
+        values = self.values if self.view is None else {position: self.view(value) for position, value in self.values.items()}
+        for position, (canonical, sign) in self._table.items():
+            value = values.get(canonical, 0) if sign != 0 else 0
+            if value != 0:
+                array[position] = sign * value
+        return array
+
+    def __repr__(self) -> str: return f"SymmetricComponents({len(self.values)} independent of {len(self)}, {self.symmetries})"
+
+
+@lru_cache(maxsize=128)
+def _symmetry_table(symmetries: IndexSymmetries, shape: Tuple[int, ...]) -> Dict[Position, Tuple[Position, int]]:
+    return {position: symmetries.canonical(position) for position in product(*[range(dim) for dim in shape])}
+
+
+# Symmetries of the common geometric objects.
+SYMMETRIC_RANK2 = IndexSymmetries(Symmetric(0, 1))
+CONNECTION_SYMMETRIES = IndexSymmetries(Symmetric(1, 2))
+RIEMANN_SYMMETRIES = IndexSymmetries(Antisymmetric(0, 1), Antisymmetric(2, 3), PairExchange((0, 1), (2, 3)))
+RIEMANN_MIXED_SYMMETRIES = IndexSymmetries(Antisymmetric(2, 3)) # R^{a}_{b}_{c}_{d}
+RIEMANN_BIVECTOR_SYMMETRIES = IndexSymmetries(Antisymmetric(0, 1), Antisymmetric(2, 3)) # R^{a}^{b}_{c}_{d}
@@ -0,0 +1,4 @@
+# The metrics shared with the tests of relativisticpy.gr.
+from relativisticpy.gr.test.conftest import schwarzschild
+
+__all__ = ['schwarzschild']
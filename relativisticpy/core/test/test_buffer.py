@@ -0,0 +1,28 @@
+from itertools import product
+from relativisticpy.core.buffer import FlatComponents
+from relativisticpy.core.symmetry import CONNECTION_SYMMETRIES
+from relativisticpy.core import sparse
+from relativisticpy.symengine import Symbol, SymbolArray
+
+
+def test_offsets_match_array_positions():
+    array = SymbolArray([Symbol(f"x{i}") for i in range(24)], (2, 3, 4))
+    buffer = FlatComponents.of(array)
+
+    assert buffer.strides == (12, 4, 1)
+    for position in product(range(2), range(3), range(4)):
+        assert buffer[position] == array[position]
+        assert buffer[buffer.offset(position)] == array[position]
+        assert buffer.position(buffer.offset(position)) == position
+    assert buffer.to_array() == array
+
+
+def test_from_sparse_and_symmetric_components():
+    x = Symbol("x")
+    array = sparse.to_sparse(SymbolArray([[x, 0], [0, x ** 2]]))
+    assert FlatComponents.of(array).nonzero_items() == [((0, 0), x), ((1, 1), x ** 2)]
+
+    compact = CONNECTION_SYMMETRIES.compute((2, 2, 2), lambda a, b, c: Symbol(f"C{a}{b}{c}"))
+    buffer = FlatComponents.of(compact)
+    for position in product(range(2), repeat=3):
+        assert buffer[position] == compact[position]
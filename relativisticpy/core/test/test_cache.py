@@ -0,0 +1,88 @@
+import os
+from relativisticpy.core import Indices, Idx
+from relativisticpy.core.cache import DiskCache, caching
+from relativisticpy.core.simplification import Simplifier, using
+from relativisticpy.symengine import Symbol, Function, SymbolArray, sin, simplify
+from relativisticpy.gr import Connection, Ricci, RicciScalar
+from relativisticpy.gr.curvature import Curvature
+from relativisticpy.gr.test.conftest import metric
+
+
+def test_warm_run_skips_the_kernels(schwarzschild, tmp_path, monkeypatch):
+    indices = Indices(-Idx('a'), -Idx('b'))
+    with caching(DiskCache(tmp_path)):
+        cold = Ricci(indices, metric(*schwarzschild))
+        C = Connection(Indices(Idx('a'), -Idx('b'), -Idx('c')), metric(*schwarzschild))
+        R = RicciScalar(metric(*schwarzschild), None)
+
+        def kernel(*args): raise AssertionError("Computed instead of read from the cache.")
+        for cls, method in ((Ricci, 'from_metric'), (RicciScalar, 'from_metric'), (Connection, '_from_metric')):
+            monkeypatch.setattr(cls, method, kernel)
+
+        warm = Ricci(indices, metric(*schwarzschild)) # New metric: nothing memoized in memory.
+        assert warm.components == cold.components
+        assert Connection(Indices(Idx('a'), -Idx('b'), -Idx('c')), metric(*schwarzschild)).components == C.components
+        assert RicciScalar(metric(*schwarzschild), None).components == R.components
+    assert [name for name in os.listdir(tmp_path) if not name.endswith('.json')] == [] # No temporary file left behind.
+
+
+def test_key_covers_metric_and_options(schwarzschild, tmp_path):
+    cache = DiskCache(tmp_path)
+    B = Function("B")(Symbol("r"))
+    components, basis = schwarzschild
+    g = metric(components, basis)
+    key = cache.key('Ricci', g)
+
+    assert cache.key('Ricci', metric(components, basis)) == key
+    assert cache.key('Riemann', g) != key
+    assert cache.key('Ricci', metric([components[0], [0, B, 0, 0], components[2], components[3]], basis)) != key
+    with using(Simplifier(strategy='cancel')):
+        assert cache.key('Ricci', g) != key
+    assert cache.key('Ricci', g, 'cartan') != key
+    Curvature.of(g, engine='cartan') # The memoized pipeline does not leak into the key: the engine is given.
+    assert cache.key('Ricci', g) == key
+
+
+def test_key_covers_custom_stages(schwarzschild, tmp_path):
+    cache = DiskCache(tmp_path)
+    g = metric(*schwarzschild)
+    keys = []
+    for stage in (lambda expr: expr, lambda expr: expr.expand(), lambda expr: expr):
+        with using(Simplifier(strategy=(stage,))):
+            keys.append(cache.key('Ricci', g))
+    assert keys[0] == keys[2] and keys[0] != keys[1]
+
+    unstable = object()
+    with using(Simplifier(strategy=(lambda expr: expr if unstable else expr,))), caching(cache):
+        assert cache.key('Ricci', g) is None
+        Ricci(Indices(-Idx('a'), -Idx('b')), g)
+    assert os.listdir(tmp_path) == [] # Computed, not cached.
+
+
+def test_functions_of_the_coordinates_round_trip(tmp_path):
+    t, r, theta, phi = [Symbol(s) for s in ("t", "r", "theta", "phi")]
+    A, B = Function("A")(r), Function("B")(r)
+    components = [[-A, 0, 0, 0], [0, B, 0, 0], [0, 0, r**2, 0], [0, 0, 0, r**2 * sin(theta)**2]]
+    expected = Ricci(Indices(-Idx('a'), -Idx('b')), metric(components, [t, r, theta, phi])).components
+    with using(Simplifier(cse=True)), caching(DiskCache(tmp_path)):
+        Ricci(Indices(-Idx('a'), -Idx('b')), metric(components, [t, r, theta, phi]))
+        warm = Ricci(Indices(-Idx('a'), -Idx('b')), metric(components, [t, r, theta, phi]))
+    assert simplify(warm.components - expected) == SymbolArray.zeros(4, 4)
+
+
+def test_least_recently_used_entries_evicted(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=250) # Two entries of ~100 bytes.
+    cache.put('a', Symbol('x') ** 2)
+    os.utime(tmp_path / 'a.json', (0, 0))
+    cache.put('b', Symbol('y') ** 2)
+    os.utime(tmp_path / 'b.json', (1, 1))
+    assert cache.get('a') is not None # Used last: b is now the oldest.
+    cache.put('c', Symbol('z') ** 2)
+    assert cache.get('b') is None and cache.get('a') == Symbol('x') ** 2 and cache.get('c') == Symbol('z') ** 2
+
+
+def test_entries_of_another_version_are_misses(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path)
+    cache.put('a', Symbol('x'))
+    monkeypatch.setattr('relativisticpy.core.cache.CACHE_VERSION', 2)
+    assert cache.get('a') is None
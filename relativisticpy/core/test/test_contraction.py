@@ -0,0 +1,41 @@
+import pytest
+from relativisticpy.core import EinsteinArray, Indices, Idx, contract, contraction_path
+from relativisticpy.core.contraction import left_to_right_cost
+from relativisticpy.symengine import Symbol, SymbolArray
+
+
+@pytest.fixture
+def basis4D():
+    return SymbolArray([Symbol('t'), Symbol('x'), Symbol('y'), Symbol('z')])
+
+
+def tensor(basis, *indices):
+    size = 4 ** len(indices)
+    return EinsteinArray(Indices(*indices), SymbolArray([(i * 7) % 5 - 2 for i in range(size)], (4,) * len(indices)), basis)
+
+
+def test_contraction_path_beats_left_to_right(basis4D):
+    a, b, c, d, e, f = [Idx(s) for s in "abcdef"]
+    tensors = (tensor(basis4D, -a, -b), tensor(basis4D, b, c, d, e), tensor(basis4D, -c, -d), tensor(basis4D, -e, f))
+    path, cost = contraction_path(*tensors)
+
+    assert path == (0, ((1, 2), 3))
+    assert cost < left_to_right_cost(*tensors)
+
+
+def test_contract_matches_left_to_right(basis4D):
+    a, b, c, d, e, f = [Idx(s) for s in "abcdef"]
+    A, B, C, D = tensor(basis4D, -a, -b), tensor(basis4D, b, c, d, e), tensor(basis4D, -c, -d), tensor(basis4D, -e, f)
+    result, expected = contract(A, B, C, D), A * B * C * D
+
+    assert str(result.indices) == str(expected.indices)
+    assert result.components == expected.components
+
+
+def test_contract_keeps_left_to_right_index_order(basis4D):
+    a, b, c, d = [Idx(s) for s in "abcd"]
+    X, Y, Z = tensor(basis4D, a, -b), tensor(basis4D, c, b), tensor(basis4D, -c, d)
+    result, expected = contract(Z, X, Y), Z * X * Y
+
+    assert str(result.indices) == str(expected.indices) == "_{d}_{a}"
+    assert result.components == expected.components
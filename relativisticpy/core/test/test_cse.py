@@ -0,0 +1,56 @@
+import pytest
+from relativisticpy.core import Metric, MetricIndices, Indices, Idx
+from relativisticpy.core.cse import eliminate, expand_subexpressions, subexpressions
+from relativisticpy.core.simplification import Simplifier, using
+from relativisticpy.symengine import Symbol, Function, SymbolArray, sin, diff, simplify
+from relativisticpy.gr import EinsteinTensor
+from relativisticpy.gr.curvature import Curvature
+
+
+def test_eliminate_and_expand_round_trip():
+    r, theta, G, M = Symbol("r"), Symbol("theta"), Symbol("G"), Symbol("M")
+    f = (1 - 2 * G * M / r) * sin(theta)**2
+    expressions = [f / r, f**2 + r, 3 * f * (1 - 2 * G * M / r), 0]
+
+    atoms, reduced = eliminate(expressions)
+    assert len(atoms) > 0 and reduced[3] == 0
+    assert all([len(subexpressions(expr)) > 0 for expr in reduced[:3]])
+    assert [simplify(expand_subexpressions(expr) - expr_0) for expr, expr_0 in zip(reduced, expressions)] == [0, 0, 0, 0]
+
+
+def test_derivatives_of_subexpressions_expand():
+    r, theta = Symbol("r"), Symbol("theta")
+    f = Function("A")(r) * sin(theta)**2
+    _, reduced = eliminate([f * r, f / r])
+    d = diff(reduced[0], r)
+    assert simplify(expand_subexpressions(d) - diff(f * r, r)) == 0
+    assert diff(reduced[0], Symbol("t")) == 0
+
+
+@pytest.fixture
+def spherically_symmetric():
+    t, r, theta, phi = [Symbol(s) for s in ("t", "r", "theta", "phi")]
+    A, B = Function("A")(r), Function("B")(r)
+    return [[-A, 0, 0, 0], [0, B, 0, 0], [0, 0, r**2, 0], [0, 0, 0, r**2 * sin(theta)**2]], [t, r, theta, phi]
+
+
+def test_compact_components_reduced_until_viewed(spherically_symmetric):
+    components, basis = spherically_symmetric
+    expected = EinsteinTensor(Indices(-Idx('a'), -Idx('b')), Metric(MetricIndices(Idx('a'), Idx('b')), SymbolArray(components), basis)).components
+
+    with using(Simplifier(cse=True)):
+        g = Metric(MetricIndices(Idx('a'), Idx('b')), SymbolArray(components), basis)
+        G = EinsteinTensor(Indices(-Idx('a'), -Idx('b')), g)
+        assert any([len(subexpressions(value)) > 0 for value in Curvature.of(g).riemann0000.values.values()])
+        assert any([len(subexpressions(value)) > 0 for value in G.compact.values.values()])
+        viewed = G.components
+
+    assert all([len(subexpressions(value)) == 0 for value in viewed])
+    assert simplify(viewed - expected) == SymbolArray.zeros(4, 4)
+
+
+def test_scalars_are_expanded(spherically_symmetric):
+    components, basis = spherically_symmetric
+    with using(Simplifier(cse=True)):
+        g = Metric(MetricIndices(Idx('a'), Idx('b')), SymbolArray(components), basis)
+        assert len(subexpressions(Curvature.of(g).ricci_scalar)) == 0
@@ -0,0 +1,22 @@
+from relativisticpy.core.dependency import DependencyIndex, coordinates, derivative
+from relativisticpy.symengine import Symbol, Function, SymbolArray, sin, diff
+
+
+def test_dependency_index():
+    t, r, theta = Symbol("t"), Symbol("r"), Symbol("theta")
+    basis = SymbolArray([t, r, theta])
+    index = DependencyIndex.of(SymbolArray([[-Function("f")(r), 0], [0, r**2 * sin(theta)**2]]), basis)
+
+    assert index.zeros == (False, True, True, False)
+    assert index.dependencies == (frozenset([1]), frozenset(), frozenset(), frozenset([1, 2]))
+    assert index.depends(0, 1) and not index.depends(0, 0)
+    assert index.coordinates == frozenset([1, 2])
+
+
+def test_derivative_matches_diff():
+    t, r, M = Symbol("t"), Symbol("r"), Symbol("M")
+    basis = (t, r)
+    for expr in (1 - 2*M/r, Function("a")(t) ** 2, M, 0, 3):
+        for k in range(2):
+            assert derivative(expr, basis, k) == diff(expr, basis[k])
+    assert coordinates(M * Function("a")(t), basis) == frozenset([0])
@@ -1,6 +1,7 @@
+import gc
 from itertools import product
 import pytest
-from relativisticpy.core.indices import Idx, Indices
+from relativisticpy.core.indices import Idx, Indices, IndexSignature
 from relativisticpy.core.metric import MetricIndices
 from relativisticpy.symengine import SymbolArray, Symbol
 
@@ -488,4 +489,51 @@ def test_selfsum_product_from_metric_einsum_result():
     # After all the Indices transformations => the basis should have been persisted 
     assert self_summed0.basis == basis3D
     assert self_summed1.basis == basis3D
-    
\ No newline at end of file
+    
+
+def test_signature_interned_and_immutable():
+    A = Indices(-Idx("a"), Idx("b"), Idx("a"))
+    B = Indices(-Idx("a"), Idx("b"), Idx("a"))
+    assert A.signature is B.signature
+    assert A.signature is not Indices(-Idx("a"), Idx("b", values=0), Idx("a")).signature
+    assert str(A.signature) == "^{a}_{b}_{a}"
+    assert len({A.signature, B.signature}) == 1
+    with pytest.raises(AttributeError):
+        A.signature.entries = ()
+
+    fresh = IndexSignature((("a", False, None), ("b", True, None), ("a", True, None))).indices()
+    assert fresh.signature is A.signature
+    assert fresh == A
+
+
+def test_built_indices_shared_and_copied_on_mutation():
+    basis, other = SymbolArray([Symbol("x"), Symbol("y")]), SymbolArray([Symbol("u"), Symbol("v")])
+    signature = IndexSignature((("a", False, None), ("b", True, 1)))
+    shared = signature.indices(Indices, basis)
+    assert signature.indices(Indices, basis) is shared and signature.indices(Indices, other) is not shared
+    assert shared.with_basis(basis) is shared
+
+    moved = shared.with_basis(other)
+    assert moved is not shared and list(moved.basis) == list(other) and list(shared.basis) == list(basis)
+    running = shared.get_non_running()
+    assert running is not shared and [idx.values for idx in shared.indices] == [None, 1] and not running.anyrunnig
+    with pytest.raises(AttributeError):
+        shared.basis = other
+
+
+def test_intern_table_only_holds_signatures_in_use():
+    signature = IndexSignature((("interned_only_while_used", True, None),))
+    key = signature.key
+    assert IndexSignature._interned[key] is signature
+    del signature
+    gc.collect()
+    assert key not in IndexSignature._interned
+
+
+def test_signature_locations_match_index_scan(const_indices_product_setup):
+    a1_f0_c1, a0_b0_c0, mu0_nu0, mu1_nu1 = const_indices_product_setup
+    for A, B in ((a1_f0_c1, a0_b0_c0), (mu0_nu0, mu1_nu1), (a0_b0_c0, a0_b0_c0)):
+        assert A._get_all_summed_locations(B) == [index.get_summed_locations(B.indices)[0] for index in A.indices if len(index.get_summed_locations(B.indices)) > 0]
+        assert A._get_all_repeated_locations(B) == [index.get_repeated_locations(B.indices)[0] for index in A.indices if len(index.get_repeated_locations(B.indices)) > 0]
+    assert Indices(-Idx("a"), Idx("b"), Idx("a"))._get_self_summed_locations() == [(0, 2)]
+    assert a1_f0_c1.rank == (2, 1)
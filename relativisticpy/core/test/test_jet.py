@@ -0,0 +1,24 @@
+from itertools import product
+from relativisticpy.core import Metric, MetricIndices, Idx
+from relativisticpy.core.jet import MetricJet
+from relativisticpy.symengine import Symbol, Function, SymbolArray, diff, expand
+
+
+def test_jet_matches_direct_derivatives():
+    t, x = Symbol("t"), Symbol("x")
+    f, h = Function("f")(t, x), Function("h")(t, x)
+    g = SymbolArray([[-f, h], [h, x**2 * f]])
+    metric = Metric(MetricIndices(Idx('a'), Idx('b')), g, SymbolArray([t, x]))
+    jet = metric.jet
+
+    assert metric.jet is jet
+    for i, j, k in product(range(2), repeat=3):
+        assert jet.first[i, j, k] == diff(g[i, j], [t, x][k])
+    for i, j, k, l in product(range(2), repeat=4):
+        assert expand(jet.second[i, j, k, l] - diff(g[i, j], [t, x][k], [t, x][l])) == 0
+
+
+def test_jet_of_upper_index_metric_is_of_lower_form():
+    x = Symbol("x")
+    metric = Metric(MetricIndices(-Idx('a'), -Idx('b')), SymbolArray([[1, 0], [0, 1 / x**2]]), SymbolArray([Symbol("t"), x]))
+    assert MetricJet.of(metric).first[1, 1, 1] == 2 * x
@@ -0,0 +1,34 @@
+import pytest
+from relativisticpy.core import Metric, MetricIndices, Idx
+from relativisticpy.symengine import Symbol, SymbolArray, sin, simplify
+
+
+@pytest.fixture
+def schwarzschild():
+    t, r, theta, phi, M = Symbol("t"), Symbol("r"), Symbol("theta"), Symbol("phi"), Symbol("M")
+    components = SymbolArray([[-(1 - 2*M/r), 0, 0, 0], [0, 1/(1 - 2*M/r), 0, 0], [0, 0, r**2, 0], [0, 0, 0, r**2*sin(theta)**2]])
+    return Metric(MetricIndices(Idx('a'), Idx('b')), components, SymbolArray([t, r, theta, phi]))
+
+
+def test_inverse_computed_once(schwarzschild):
+    inverse = schwarzschild.inv
+    assert schwarzschild.inv is inverse
+    assert schwarzschild._ is schwarzschild
+    assert inverse.inv is inverse
+    assert inverse._ is schwarzschild # Round trip: the inverse of the inverse is not recomputed.
+    assert simplify(inverse.components[1, 1] * schwarzschild.components[1, 1]) == 1
+
+
+def test_determinant(schwarzschild):
+    r, theta = Symbol("r"), Symbol("theta")
+    assert simplify(schwarzschild.determinant + r**4 * sin(theta)**2) == 0
+    assert simplify(schwarzschild.inv.determinant - schwarzschild.determinant) == 0
+    assert schwarzschild.sqrt_abs_determinant.subs({r: 2, theta: 1}) == simplify(4 * abs(sin(1)))
+
+
+def test_memo_dropped_when_components_change(schwarzschild):
+    inverse = schwarzschild.inv
+    schwarzschild.components = SymbolArray([[-1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
+    assert schwarzschild.inv is not inverse
+    assert schwarzschild.inv.components[0, 0] == -1
+    assert schwarzschild.determinant == -1
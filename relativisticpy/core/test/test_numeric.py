@@ -0,0 +1,54 @@
+import pytest
+from relativisticpy.core import EinsteinArray, NumericEinsteinArray, Indices, Idx
+from relativisticpy.symengine import Symbol, SymbolArray
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def basis3D():
+    t, r, theta = Symbol('t'), Symbol('r'), Symbol('theta')
+    return SymbolArray([t, r, theta])
+
+
+def test_einsum_matches_symbolic(basis3D):
+    A = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    B = [[2, 0, 1], [0, 3, 0], [1, 0, 4]]
+    symbolic = EinsteinArray(Indices(-Idx("a"), Idx("b")), SymbolArray(A), basis3D) * EinsteinArray(Indices(-Idx("b"), Idx("c")), SymbolArray(B), basis3D)
+    numeric = NumericEinsteinArray(Indices(-Idx("a"), Idx("b")), A, basis3D) * NumericEinsteinArray(Indices(-Idx("b"), Idx("c")), B, basis3D)
+
+    assert str(numeric.indices) == str(symbolic.indices)
+    assert np.allclose(numeric.components, np.array(symbolic.components.tolist(), dtype=float))
+
+
+def test_batched_additive_and_self_trace(basis3D):
+    A = np.random.rand(10, 3, 3)
+    a = NumericEinsteinArray(Indices(Idx("a"), Idx("b")), A, basis3D)
+    b = NumericEinsteinArray(Indices(Idx("b"), Idx("a")), A, basis3D)
+    trace = NumericEinsteinArray(Indices(-Idx("a"), Idx("a")), A, basis3D)
+
+    assert a.batched
+    assert np.allclose((a - b).components, A - A.transpose(0, 2, 1))
+    assert trace.scalar and np.allclose(trace.scalar_comp_value, np.trace(A, axis1=1, axis2=2))
+
+
+def test_from_einstein_array(basis3D):
+    r, M = basis3D[1], Symbol('M')
+    tensor = EinsteinArray(Indices(Idx("a"), Idx("b")), SymbolArray([[-(1 - 2*M/r), 0, 0], [0, 1/(1 - 2*M/r), 0], [0, 0, r**2]]), basis3D)
+    points = np.array([[0., 4., 1.], [1., 10., 2.]])
+    numeric = NumericEinsteinArray.from_einstein_array(tensor, points, {M: 1})
+
+    assert numeric.components.shape == (2, 3, 3)
+    assert np.allclose(numeric.components[:, 0, 0], [-0.5, -0.8])
+    assert np.allclose(numeric.components[:, 2, 2], [16., 100.])
+    with pytest.raises(ValueError):
+        NumericEinsteinArray.from_einstein_array(tensor, points)
+
+
+def test_repeated_index_of_same_variance_raises(basis3D):
+    A = NumericEinsteinArray(Indices(Idx("a")), [1, 2, 3], basis3D)
+    B = NumericEinsteinArray(Indices(Idx("a"), Idx("b")), np.eye(3), basis3D)
+
+    with pytest.raises(ValueError, match="Index 'a'"):
+        A * B
+    assert np.allclose((NumericEinsteinArray(Indices(-Idx("a")), [1, 2, 3], basis3D) * B).components, [1, 2, 3])
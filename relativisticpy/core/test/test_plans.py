@@ -0,0 +1,89 @@
+from itertools import product
+import pytest
+from relativisticpy.core.indices import Idx, Indices
+from relativisticpy.core.einsteinarray import EinsteinArray
+from relativisticpy.core.plans import einsum_plan, strides, flat_offset
+from relativisticpy.symengine import Symbol, SymbolArray
+
+
+@pytest.fixture
+def basis3D():
+    t, r, theta = Symbol('t'), Symbol('r'), Symbol('theta')
+    return SymbolArray([t, r, theta])
+
+
+def test_strides():
+    assert strides((4, 4, 4)) == (16, 4, 1)
+    assert strides(()) == ()
+    assert flat_offset((1, 2, 3), strides((4, 4, 4))) == 27
+
+
+def test_plan_shared_between_relabelled_products(basis3D):
+    A = Indices(-Idx("a"), -Idx("b"))
+    B = Indices(Idx("a"), Idx("c"), Idx("b"), Idx("d"))
+    C = Indices(-Idx("m"), -Idx("n"))
+    D = Indices(Idx("m"), Idx("c"), Idx("n"), Idx("d"))
+    for indices in (A, B, C, D):
+        indices.basis = basis3D
+
+    einsum_plan.cache_clear()
+    assert (A * B).plan is (C * D).plan
+    assert einsum_plan.cache_info().hits == 1
+
+
+def test_plan_matches_brute_force_filter(basis3D):
+    A = Indices(-Idx("a"), Idx("f"), -Idx("c"))
+    B = Indices(Idx("a"), Idx("b"), Idx("c"))
+    A.basis = basis3D
+    B.basis = basis3D
+    result = A * B  # => _{f}_{b}
+
+    for f, b in product(range(3), range(3)):
+        brute_force = [(i, j) for i, j in product(product(range(3), repeat=3), repeat=2) if i[0] == j[0] and i[2] == j[2] and i[1] == f and j[1] == b]
+        assert set(result.generator((f, b))) == set(brute_force)
+
+    assert len(result.plan.offsets) == 9
+    assert all([len(pairs) == 9 for _, pairs in result.plan.offsets])
+
+
+def test_tensor_trace_product_matches_brute_force():
+    from relativisticpy.utils import tensor_trace_product
+    a = SymbolArray(list(range(9)), (3, 3))
+    b = SymbolArray(list(range(27)), (3, 3, 3))
+    result = tensor_trace_product(a, b, [[1, 0]]) # => a_{i}_{k} b_{k}_{j}_{l}
+
+    assert result.shape == (3, 3, 3)
+    for i, j, l in product(range(3), repeat=3):
+        assert result[i, j, l] == sum([a[i, k] * b[k, j, l] for k in range(3)])
+    assert tensor_trace_product(a, a, [[0, 0], [1, 1]])[()] == sum([x**2 for x in range(9)])
+
+
+@pytest.mark.parametrize("left, right", [
+    ((Idx("a"), Idx("b"), -Idx("c")), (Idx("a"), Idx("b"), -Idx("c"))),
+    ((Idx("a"), Idx("b"), -Idx("c")), (-Idx("c"), Idx("a"), Idx("b"))),
+    ((Idx("a", values=1), Idx("b"), -Idx("c")), (Idx("b"), -Idx("c"), Idx("a"))),
+])
+def test_additive_plan_matches_generator(basis3D, left, right):
+    A = EinsteinArray(Indices(*left), SymbolArray([Symbol(f"a{i}") for i in range(27)], (3, 3, 3)), basis3D)
+    B = EinsteinArray(Indices(*right), SymbolArray([Symbol(f"b{i}") for i in range(27)], (3, 3, 3)), basis3D)
+    result = A + B
+
+    indices = A.indices.additive_product(B.indices)
+    for i in indices:
+        assert result.components[i] == sum([A.components[a] + B.components[b] for a, b in indices.generator(i)])
+
+
+@pytest.mark.parametrize("indices", [
+    (Idx("a"), -Idx("a"), Idx("b")),
+    (Idx("a"), Idx("b"), -Idx("a"), -Idx("b")),
+    (Idx("a"), Idx("b", values=2), -Idx("a")),
+])
+def test_selfsum_plan_matches_generator(basis3D, indices):
+    components = SymbolArray([Symbol(f"t{i}") for i in range(3 ** len(indices))], (3,) * len(indices))
+    traced = Indices(*indices)
+    traced.basis = basis3D
+    result = EinsteinArray(Indices(*indices), components, basis3D)
+
+    product_indices = traced.self_product()
+    for i in product_indices:
+        assert result.components[i] == sum([components[position] for position in product_indices.generator(i)])
@@ -0,0 +1,53 @@
+import time
+import pytest
+from relativisticpy.core import simplification
+from relativisticpy.core.simplification import Simplifier, using, simplified, current
+from relativisticpy.core.symmetry import SYMMETRIC_RANK2
+from relativisticpy.symengine import Symbol, Function, SymbolArray, sin, cos, simplify, cancel
+
+
+def slow(expr):
+    time.sleep(5)
+    return expr
+
+
+def test_strategies():
+    x = Symbol("x")
+    expr = (x**2 - 1) / (x - 1) + sin(x)**2 + cos(x)**2
+    assert Simplifier().expression(expr) == simplify(expr)
+    assert Simplifier('none').expression(expr) is expr
+    assert Simplifier('cancel').expression(expr) == cancel(expr)
+    assert Simplifier(['cancel', 'trigsimp']).expression(expr) == x + 2
+    assert Simplifier([lambda e: e.subs(x, 1)]).expression(x + 1) == 2
+    with pytest.raises(ValueError):
+        Simplifier('unknown')
+
+
+def test_timeout_keeps_best_form_so_far():
+    x = Symbol("x")
+    expr = (x**2 - 1) / (x - 1)
+    start = time.monotonic()
+    assert Simplifier(('cancel', slow), timeout=0.2).expression(expr) == x + 1
+    assert time.monotonic() - start < 2
+
+
+def test_symmetric_components_and_process_pool():
+    r = Symbol("r")
+    f = Function("f")(r)
+    compact = SYMMETRIC_RANK2.compute((2, 2), lambda i, j: (f**2 - 1) / (f - 1) * (i + j + 1))
+    in_process = Simplifier('cancel')(compact)
+    pooled = Simplifier('cancel', processes=2)(compact)
+    pool = simplification._pools[2]
+    assert pooled.values == in_process.values
+    assert Simplifier('cancel', processes=2, timeout=10)(compact).values == in_process.values
+    assert simplification._pools[2] is pool # The workers outlive a map, and serve every policy.
+    assert in_process[1, 0] == 2 * f + 2
+
+
+def test_using_restores_policy():
+    default = current()
+    with using(Simplifier('none')):
+        x = Symbol("x")
+        assert simplified(SymbolArray([x / x + 0 * x]))[0] == 1 # sympy auto-evaluation only
+        assert current() == Simplifier('none')
+    assert current() is default
@@ -0,0 +1,51 @@
+import pytest
+from relativisticpy.core import EinsteinArray, Indices, Idx
+from relativisticpy.core.sparse import to_dense, nonzero
+from relativisticpy.symengine import Symbol, SymbolArray, SparseSymbolArray
+
+
+@pytest.fixture
+def basis3D():
+    t, r, theta = Symbol('t'), Symbol('r'), Symbol('theta')
+    return SymbolArray([t, r, theta])
+
+
+@pytest.fixture
+def diagonal():
+    r, theta = Symbol('r'), Symbol('theta')
+    return [[-1, 0, 0], [0, r**2, 0], [0, 0, r**2 * theta]]
+
+
+def test_sparse_einsum_matches_dense(basis3D, diagonal):
+    dense = EinsteinArray(Indices(Idx("a"), Idx("b")), SymbolArray(diagonal), basis3D)
+    sparse = EinsteinArray(Indices(Idx("a"), Idx("b")), SparseSymbolArray(diagonal), basis3D)
+    vector = EinsteinArray(Indices(-Idx("b"), Idx("c")), SymbolArray([[1, 2, 3], [4, 5, 6], [7, 8, 9]]), basis3D)
+
+    result = sparse * vector
+    assert result.sparse
+    assert to_dense(result.components) == (dense * vector).components
+
+
+def test_sparse_additive_with_permuted_indices(basis3D, diagonal):
+    A = EinsteinArray(Indices(Idx("a"), Idx("b")), SparseSymbolArray(diagonal), basis3D)
+    B = EinsteinArray(Indices(Idx("b"), Idx("a")), SparseSymbolArray([[0, 1, 0], [0, 0, 0], [0, 0, 0]]), basis3D)
+    dense_A = EinsteinArray(Indices(Idx("a"), Idx("b")), SymbolArray(diagonal), basis3D)
+    dense_B = EinsteinArray(Indices(Idx("b"), Idx("a")), SymbolArray([[0, 1, 0], [0, 0, 0], [0, 0, 0]]), basis3D)
+
+    assert to_dense((A - B).components) == (dense_A - dense_B).components
+    assert len(nonzero((A + B).components)) == 4
+
+
+def test_sparse_selfsum(basis3D):
+    components = [[[i * 9 + j * 3 + k for k in range(3)] for j in range(3)] for i in range(3)]
+    dense = EinsteinArray(Indices(-Idx("a"), Idx("a"), Idx("b")), SymbolArray(components), basis3D)
+    sparse = EinsteinArray(Indices(-Idx("a"), Idx("a"), Idx("b")), SparseSymbolArray(components), basis3D)
+    assert to_dense(sparse.components) == dense.components
+
+
+def test_to_sparse_and_back(basis3D, diagonal):
+    tensor = EinsteinArray(Indices(Idx("a"), Idx("b")), SymbolArray(diagonal), basis3D)
+    assert tensor.to_sparse().sparse
+    assert len(nonzero(tensor.components)) == 3
+    assert not tensor.to_dense().sparse
+    assert tensor.components == SymbolArray(diagonal)
@@ -0,0 +1,35 @@
+from relativisticpy.core.symmetry import IndexSymmetries, Symmetric, Antisymmetric, RIEMANN_SYMMETRIES, CONNECTION_SYMMETRIES
+from relativisticpy.symengine import Symbol, SymbolArray
+
+
+def test_independent_component_counts():
+    assert len(RIEMANN_SYMMETRIES.independent((4, 4, 4, 4))) == 21
+    assert len(CONNECTION_SYMMETRIES.independent((4, 4, 4))) == 40
+    assert len(IndexSymmetries(Antisymmetric(0, 1)).independent((4, 4))) == 6
+
+
+def test_canonical_sign():
+    assert RIEMANN_SYMMETRIES.canonical((1, 0, 3, 2)) == ((0, 1, 2, 3), 1)
+    assert RIEMANN_SYMMETRIES.canonical((2, 3, 1, 0)) == ((0, 1, 2, 3), -1)
+    assert RIEMANN_SYMMETRIES.canonical((0, 0, 1, 2))[1] == 0
+
+
+def test_compute_only_independent_and_read_by_sign():
+    calls = []
+    def component(i, j):
+        calls.append((i, j))
+        return Symbol(f"x{i}{j}")
+
+    compact = IndexSymmetries(Antisymmetric(0, 1)).compute((3, 3), component)
+    assert sorted(calls) == [(0, 1), (0, 2), (1, 2)]
+    assert compact[2, 0] == -Symbol("x02")
+    assert compact[1, 1] == 0
+    assert compact.to_array() == SymbolArray([[0, Symbol("x01"), Symbol("x02")], [-Symbol("x01"), 0, Symbol("x12")], [-Symbol("x02"), -Symbol("x12"), 0]])
+
+
+def test_compress_round_trip():
+    a, b, c = Symbol("a"), Symbol("b"), Symbol("c")
+    full = SymbolArray([[a, b], [b, c]])
+    compact = IndexSymmetries(Symmetric(0, 1)).compress(full)
+    assert len(compact.values) == 3
+    assert compact.to_array() == full
@@ -0,0 +1,47 @@
+import pytest
+from relativisticpy.core import EinsteinArray, Indices, Idx
+from relativisticpy.core.views import PermutedArray, permute
+from relativisticpy.symengine import Symbol, SymbolArray, SparseSymbolArray
+
+
+@pytest.fixture
+def basis3D():
+    t, r, theta = Symbol('t'), Symbol('r'), Symbol('theta')
+    return SymbolArray([t, r, theta])
+
+
+def test_permuted_view_reads_base_without_copy():
+    base = SymbolArray(list(range(24)), (2, 3, 4))
+    view = permute(base, [2, 0, 1])
+
+    assert isinstance(view, PermutedArray)
+    assert view.shape == (4, 2, 3)
+    assert view[3, 1, 2] == base[1, 2, 3]
+    assert not view.materialized
+
+
+def test_view_of_view_composes_onto_base():
+    base = SymbolArray(list(range(24)), (2, 3, 4))
+    view = permute(permute(base, [2, 0, 1]), [1, 0, 2])
+
+    assert view._base is base
+    assert view[1, 3, 2] == base[1, 2, 3]
+
+
+def test_view_materializes_on_mutation():
+    base = SymbolArray(list(range(4)), (2, 2))
+    view = permute(base, [1, 0])
+    view[0, 1] = Symbol('x')
+
+    assert view.materialized
+    assert view.tolist() == [[0, Symbol('x')], [1, 3]]
+    assert base[1, 0] == 2
+
+
+def test_reshape_tensor_components(basis3D):
+    tensor = EinsteinArray(Indices(Idx("a"), Idx("b")), SymbolArray([[1, 2, 3], [4, 5, 6], [7, 8, 9]]), basis3D)
+    reshaped = tensor.reshape_tensor_components(Indices(Idx("b"), Idx("a")))
+    assert reshaped.components.tolist() == [[1, 4, 7], [2, 5, 8], [3, 6, 9]]
+
+    sparse = EinsteinArray(Indices(Idx("a"), Idx("b")), SparseSymbolArray([[0, 2, 0], [0, 0, 0], [0, 0, 1]]), basis3D)
+    assert sparse.rearrange_components([1, 0]).tolist() == [[0, 0, 0], [2, 0, 0], [0, 0, 1]]
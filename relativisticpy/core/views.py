@@ -0,0 +1,86 @@
+"""
+Permuted views of component arrays.
+
+Reordering the indices of a tensor, i.e. serving R_{b}_{a}_{c}_{d} from the components of R_{a}_{b}_{c}_{d}, does not copy the components:
+the PermutedArray returned reads the original flat buffer through remapped strides. It only materializes its own buffer once it is mutated
+(or once an operation needs the whole flat buffer), hence reordered retrievals are O(1).
+"""
+
+# Standard Library
+from functools import reduce
+from typing import List, Tuple
+
+# External Modules
+from relativisticpy.symengine import SymbolArray, SparseSymbolArray, NDimArray
+
+# This Module
+from relativisticpy.core.plans import strides
+from relativisticpy.core import sparse
+
+
+class PermutedArray(SymbolArray):
+    """
+    Zero-copy permuted view: view[new_index] = base[original_index] with original_index[order[k]] = new_index[k].
+    Behaves as any SymbolArray; element reads are served from the base buffer until the view is first mutated.
+    """
+
+    def __new__(cls, base: SymbolArray, order: Tuple[int, ...], **kwargs):
+        if not isinstance(base, NDimArray): # sympy builds derived arrays via type(self)(flat_list, shape) => those are plain arrays.
+            return SymbolArray(base, order, **kwargs)
+
+        order = tuple(order)
+        if isinstance(base, PermutedArray) and base._materialized is None: # View of a view => compose the orders onto the original buffer.
+            order = tuple([base._order[k] for k in order])
+            base = base._base
+
+        self = object.__new__(cls)
+        self._base = base
+        self._order = order
+        self._shape = tuple([base.shape[i] for i in order])
+        self._rank = len(order)
+        self._loop_size = reduce(lambda x, y: x * y, self._shape, 1)
+        base_strides = strides(base.shape)
+        self._strides = tuple([base_strides[i] for i in order]) # Stride remapping: new position => base flat offset.
+        self._materialized = None
+        return self
+
+    @property
+    def materialized(self) -> bool:
+        """ True once the view holds its own copy of the components. """
+        return self._materialized is not None
+
+    @property
+    def _array(self) -> List:
+        if self._materialized is None:
+            self._materialized = list(self._flat())
+        return self._materialized
+
+    @_array.setter
+    def _array(self, value: List) -> None:
+        self._materialized = value
+
+    def __getitem__(self, index):
+        if self._materialized is None and isinstance(index, tuple) and len(index) == self._rank and all([isinstance(i, int) and 0 <= i < dim for i, dim in zip(index, self._shape)]):
+            return self._base._array[sum([i * s for i, s in zip(index, self._strides)])]
+        return super().__getitem__(index)
+
+    # Privates
+    def _flat(self):
+        """ Reads the components in the row-major order of the view. """
+        flat, offsets = self._base._array, [0]
+        for dim, stride in zip(self._shape, self._strides):
+            offsets = [offset + i * stride for offset in offsets for i in range(dim)]
+        return [flat[offset] for offset in offsets]
+
+
+def permute(components, new_order: List[int]):
+    """
+    Reorders the axes of components: result[new_index] = components[original_index] with original_index[new_order[k]] = new_index[k].
+    Dense components get a zero-copy PermutedArray, sparse components only have their non-zero positions remapped.
+    """
+    if sparse.is_sparse(components):
+        values = {tuple([position[i] for i in new_order]): value for position, value in sparse.nonzero_items(components)}
+        return SparseSymbolArray(values, tuple([components.shape[i] for i in new_order]))
+    if len(new_order) == 0:
+        return components
+    return PermutedArray(components, new_order)
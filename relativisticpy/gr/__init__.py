@@ -9,7 +9,9 @@ from relativisticpy.gr.tensors.kscalar import KScalar
 from relativisticpy.gr.tensors.metricscalar import MetricScalar
 from relativisticpy.gr.tensors.ricciscalar import RicciScalar
 from relativisticpy.gr.tensors.einstein import EinsteinTensor
+from relativisticpy.gr.tensors.weyl import Weyl
 # 
 from relativisticpy.gr.connection import Connection
 from relativisticpy.gr.derivatives.covariant import CovDerivative
+from relativisticpy.gr.derivatives.lie import LieDerivative
 from relativisticpy.gr.derivatives.partial import Derivative
@@ -5,47 +5,24 @@ from typing import Optional, Union
 
 # External Modules
 from relativisticpy.core import Idx, Indices, EinsteinArray, einstein_convention, Metric
-from relativisticpy.symengine import SymbolArray, Rational, diff, simplify
+from relativisticpy.core.cache import cached_components
+from relativisticpy.core.symmetry import CONNECTION_SYMMETRIES, SymmetricComponents
+from relativisticpy.symengine import SymbolArray
+
+# This Module
+from relativisticpy.gr.curvature import Curvature
 
 
 @einstein_convention
 class Connection(EinsteinArray):
+    symmetries = CONNECTION_SYMMETRIES # Torsion free: C^{a}_{b}_{c} = C^{a}_{c}_{b}
 
-    def from_metric(metric: Metric) -> SymbolArray:
-        D = metric.dimention
-        empty = SymbolArray.zeros(D, D, D)
-        g = metric._.components
-        ig = metric.inv.components
-        wrt = metric.basis
-        for i, j, k, d in product(range(D), range(D), range(D), range(D)):
-            empty[i, j, k] += (
-                Rational(1, 2)
-                * (ig[d, i])
-                * (
-                    diff(g[k, d], wrt[j])
-                    + diff(g[d, j], wrt[k])
-                    - diff(g[j, k], wrt[d])
-                )
-            )
-        return simplify(empty)
+    def from_metric(metric: Metric) -> SymmetricComponents:
+        # Computed once per metric by its curvature pipeline.
+        return Curvature.of(metric).connection
 
-    def _from_metric(self, metric: Metric) -> SymbolArray:
-        D = metric.dimention
-        empty = SymbolArray.zeros(D, D, D)
-        g = metric._.components
-        ig = metric.inv.components
-        wrt = metric.basis
-        for i, j, k, d in product(range(D), range(D), range(D), range(D)):
-            empty[i, j, k] += (
-                Rational(1, 2)
-                * (ig[d, i])
-                * (
-                    diff(g[k, d], wrt[j])
-                    + diff(g[d, j], wrt[k])
-                    - diff(g[j, k], wrt[d])
-                )
-            )
-        return simplify(empty)
+    def _from_metric(self, metric: Metric) -> SymmetricComponents:
+        return Connection.from_metric(metric)
 
 
     def __init__(
@@ -61,7 +38,7 @@ class Connection(EinsteinArray):
 
         if isinstance(symbols, Metric):
             self._metric = symbols  # Only property which lives at this level
-            components = self._from_metric(symbols)
+            components = cached_components('Connection', symbols, lambda: self._from_metric(symbols), Curvature.of(symbols).engine)
             basis = symbols.basis
 
         super().__init__(indices=indices, components=components, basis=basis)
\ No newline at end of file
@@ -0,0 +1,207 @@
+"""
+Curvature pipeline of a metric.
+
+Connection -> Riemann -> Ricci -> Ricci scalar -> Einstein (and Weyl): every metric dependent geometric object is computed from the stage before it.
+Curvature.of(metric) returns the pipeline memoized on the metric, each stage is computed lazily and exactly once. Hence a workbook asking for
+R, Ric, G and the Kretschmann scalar runs the Christoffel loop (and its simplify) once, and Ricci is contracted from the cached Riemann tensor.
+The memo is dropped as soon as the components of the metric change, or once the simplification policy differs from the one it was computed with.
+
+Riemann is computed by one of two engines, selected per metric with Curvature.of(metric, engine=...):
+    - 'coordinate' (default): from the metric jet and the Christoffel symbols.
+    - 'cartan': from Cartan's structure equations in an orthonormal frame (see relativisticpy.gr.derivatives.exterior), far smaller
+      expressions for diagonal and nearly diagonal metrics. Ricci and the Ricci scalar are then traced in the frame, the later stages
+      are computed from them alike.
+"""
+
+# Standard Library
+from functools import cached_property
+
+# External Modules
+from relativisticpy.core import Metric
+from relativisticpy.core.buffer import FlatComponents
+from relativisticpy.core.dependency import product
+from relativisticpy.core.symmetry import CONNECTION_SYMMETRIES, RIEMANN_SYMMETRIES, RIEMANN_MIXED_SYMMETRIES, RIEMANN_BIVECTOR_SYMMETRIES, SYMMETRIC_RANK2, SymmetricComponents
+from relativisticpy.core.simplification import current, simplified
+from relativisticpy.gr.derivatives.exterior import Cartan
+from relativisticpy.symengine import Basic, Rational, SymbolArray
+
+
+class Curvature:
+    """
+    Lazily computed, memoized curvature of a metric. All tensor stages are SymmetricComponents (only the independent components are stored).
+
+    Attributes:
+        metric (Metric): The metric.
+        engine (str): 'coordinate' or 'cartan', the engine Riemann is computed with.
+        simplifier (Simplifier): The simplification policy the stages are computed with.
+        connection: C^{a}_{b}_{c}
+        riemann0000: R_{a}_{b}_{c}_{d}
+        riemann: R^{a}_{b}_{c}_{d}
+        riemann1100: R^{a}^{b}_{c}_{d}, the intermediate the curvature invariants are contracted from (see relativisticpy.gr.invariants).
+        ricci: Ric_{a}_{b} = R^{c}_{a}_{c}_{b}
+        ricci_mixed: Ric^{a}_{b}
+        ricci_scalar: R = g^{a}^{b} Ric_{a}_{b}
+        einstein: G_{a}_{b} = Ric_{a}_{b} - 1/2 g_{a}_{b} R
+        weyl: C_{a}_{b}_{c}_{d}, the trace free part of R_{a}_{b}_{c}_{d}
+    """
+
+    ENGINES = ('coordinate', 'cartan')
+
+    def __init__(self, metric: Metric, engine: str = 'coordinate'):
+        if engine not in Curvature.ENGINES:
+            raise ValueError(f"Unknown curvature engine '{engine}', expected one of {list(Curvature.ENGINES)}.")
+        self.metric = metric
+        self.dimention = metric.dimention
+        self.basis = metric.basis
+        self.sparse = metric.sparse
+        self.engine = engine
+        self.simplifier = current()
+
+    @classmethod
+    def of(cls, metric: Metric, engine: str = None) -> 'Curvature':
+        """ The pipeline of metric, memoized on the metric until its components change. engine None keeps the engine of the memo. """
+        memo = metric.derived.get('curvature')
+        if memo is None or memo.simplifier != current() or (engine is not None and memo.engine != engine):
+            metric.derived['curvature'] = cls(metric, engine or (memo.engine if memo is not None else 'coordinate'))
+        return metric.derived['curvature']
+
+    @cached_property
+    def cartan(self) -> Cartan: return Cartan(self.metric)
+
+    @cached_property
+    def inverse(self) -> FlatComponents: return FlatComponents.of(self.metric.inv.components)
+
+    @cached_property
+    def connection(self) -> SymmetricComponents:
+        D = self.dimention
+        jet = self.metric.jet
+        dg = jet.first # dg[a, b, c] = d_c g_{a}_{b}
+        ig_rows = self.__rows(self.inverse) # Terms with a vanishing inverse metric factor are skipped.
+        depends = lambda a, b, c: jet.dependencies.depends(jet.g.offset((a, b)), c)
+
+        def component(i, j, k):
+            # Terms whose three metric derivatives vanish structurally are skipped.
+            return sum([
+                Rational(1, 2)
+                * ig_di
+                * (
+                    dg[k, d, j]
+                    + dg[d, j, k]
+                    - dg[j, k, d]
+                )
+                for d, ig_di in ig_rows[i]
+                if depends(k, d, j) or depends(d, j, k) or depends(j, k, d)
+            ])
+
+        # Only the independent components (j <= k) are computed and simplified.
+        return simplified(CONNECTION_SYMMETRIES.compute((D, D, D), component, self.sparse))
+
+    @cached_property
+    def riemann0000(self) -> SymmetricComponents:
+        if self.engine == 'cartan':
+            return self.cartan.riemann0000
+        # R_{a}_{b}_{c}_{d} = 1/2 (d_b d_c g_{a}_{d} + d_a d_d g_{b}_{c} - d_a d_c g_{b}_{d} - d_b d_d g_{a}_{c}) + g_{e}_{f} (C^{e}_{b}_{c} C^{f}_{a}_{d} - C^{e}_{b}_{d} C^{f}_{a}_{c})
+        N = self.dimention
+        jet = self.metric.jet
+        ddg = jet.second # ddg[a, b, c, d] = d_c d_d g_{a}_{b}
+        C = FlatComponents.of(self.connection)
+        nonzero_g = jet.g.nonzero_items()
+
+        def component(a, b, c, d):
+            return Rational(1, 2) * (
+                ddg[a, d, b, c] + ddg[b, c, a, d] - ddg[b, d, a, c] - ddg[a, c, b, d]
+            ) + sum([g_ef * (product(C[e, b, c], C[f, a, d]) - product(C[e, b, d], C[f, a, c])) for (e, f), g_ef in nonzero_g])
+
+        # Only the 21 (in 4D) independent components are computed and simplified, out of 256.
+        return simplified(RIEMANN_SYMMETRIES.compute((N, N, N, N), component, self.sparse))
+
+    @cached_property
+    def riemann(self) -> SymmetricComponents:
+        # R^{a}_{b}_{c}_{d} = g^{a}^{e} R_{e}_{b}_{c}_{d}: raised from the (far fewer) independent components of the fully covariant form.
+        N = self.dimention
+        R = FlatComponents.of(self.riemann0000)
+        ig_rows = self.__rows(self.inverse)
+
+        def component(a, b, c, d):
+            return sum([ig_ae * R[e, b, c, d] for e, ig_ae in ig_rows[a]])
+
+        return simplified(RIEMANN_MIXED_SYMMETRIES.compute((N, N, N, N), component, self.sparse))
+
+    @cached_property
+    def riemann1100(self) -> SymmetricComponents:
+        # R^{a}^{b}_{c}_{d} = g^{b}^{e} R^{a}_{e}_{c}_{d}: antisymmetric in both pairs => only a < b and c < d are raised and simplified.
+        N = self.dimention
+        R = FlatComponents.of(self.riemann)
+        ig_rows = self.__rows(self.inverse)
+
+        def component(a, b, c, d):
+            return sum([product(ig_be, R[a, e, c, d]) for e, ig_be in ig_rows[b]])
+
+        return simplified(RIEMANN_BIVECTOR_SYMMETRIES.compute((N, N, N, N), component, self.sparse))
+
+    @cached_property
+    def ricci(self) -> SymmetricComponents:
+        if self.engine == 'cartan':
+            return self.cartan.ricci
+        N = self.dimention
+        R = FlatComponents.of(self.riemann)
+        # Ric_{b}_{d} = R^{a}_{b}_{a}_{d}, symmetric => only b <= d are contracted and simplified.
+        return simplified(SYMMETRIC_RANK2.compute((N, N), lambda b, d: sum([R[a, b, a, d] for a in range(N)]), self.sparse))
+
+    @cached_property
+    def ricci_mixed(self) -> SymbolArray:
+        # Ric^{a}_{b} = g^{a}^{c} Ric_{c}_{b}: not symmetric, every component is raised.
+        N = self.dimention
+        Ric = self.ricci
+        ig_rows = self.__rows(self.inverse)
+        return simplified(SymbolArray([sum([product(ig_ac, Ric[c, b]) for c, ig_ac in ig_rows[a]]) for a in range(N) for b in range(N)], (N, N)))
+
+    @cached_property
+    def ricci_scalar(self) -> Basic:
+        if self.engine == 'cartan':
+            return self.cartan.ricci_scalar
+        Ric = self.ricci
+        return simplified(sum([ig_ab * Ric[a, b] for (a, b), ig_ab in self.inverse.nonzero_items()]))
+
+    @cached_property
+    def einstein(self) -> SymmetricComponents:
+        N = self.dimention
+        Ric, R = self.ricci, self.ricci_scalar
+        g = FlatComponents.of(self.metric.components)
+        # G_{i}_{j} = Ric_{i}_{j} - 1/2 g_{i}_{j} R, symmetric => only i <= j are computed and simplified.
+        return simplified(SYMMETRIC_RANK2.compute((N, N), lambda i, j: Ric[i, j] - Rational(1, 2) * g[i, j] * R, self.sparse))
+
+    @cached_property
+    def weyl(self) -> SymmetricComponents:
+        # C_{a}_{b}_{c}_{d} = R_{a}_{b}_{c}_{d} - 1/(N-2) (g_{a}_{c} Ric_{b}_{d} - g_{a}_{d} Ric_{b}_{c} - g_{b}_{c} Ric_{a}_{d} + g_{b}_{d} Ric_{a}_{c})
+        #                   + R/((N-1)(N-2)) (g_{a}_{c} g_{b}_{d} - g_{a}_{d} g_{b}_{c})
+        N = self.dimention
+        if N < 3:
+            # The Weyl tensor vanishes identically in 2D.
+            return RIEMANN_SYMMETRIES.compute((N, N, N, N), lambda a, b, c, d: 0, self.sparse)
+        Riem, Ric, R = self.riemann0000, self.ricci, self.ricci_scalar
+        g = self.metric.jet.g
+        k1, k2 = Rational(1, N - 2), R * Rational(1, (N - 1) * (N - 2))
+
+        def component(a, b, c, d):
+            # The g^Ric and g^g terms are built from the non-zero factors only: no N^4 temporaries.
+            return (
+                Riem[a, b, c, d]
+                - k1 * (product(g[a, c], Ric[b, d]) - product(g[a, d], Ric[b, c]) - product(g[b, c], Ric[a, d]) + product(g[b, d], Ric[a, c]))
+                + product(k2, product(g[a, c], g[b, d]) - product(g[a, d], g[b, c]))
+            )
+
+        # Same index symmetries as R_{a}_{b}_{c}_{d}: only the 21 (in 4D) independent components are computed and simplified.
+        return simplified(RIEMANN_SYMMETRIES.compute((N, N, N, N), component, self.sparse))
+
+    def __repr__(self) -> str:
+        computed = [stage for stage in ('connection', 'riemann0000', 'riemann', 'riemann1100', 'ricci', 'ricci_mixed', 'ricci_scalar', 'einstein', 'weyl') if stage in self.__dict__]
+        return f"Curvature({self.metric.indices}, engine={self.engine}, computed={computed})"
+
+    # Privates
+    def __rows(self, matrix: FlatComponents):
+        """ Non-zero entries of each row: rows[i] = [(j, m_ij), ...]. """
+        rows = [[] for _ in range(self.dimention)]
+        for (i, j), m_ij in matrix.nonzero_items():
+            rows[i].append((j, m_ij))
+        return rows
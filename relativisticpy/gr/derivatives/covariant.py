@@ -1,31 +1,74 @@
 # Standard Library
+from dataclasses import replace
 from typing import Union
 
 # External Modules
-from relativisticpy.core import Indices, EinsteinArray, Metric
+from relativisticpy.core import Indices, EinsteinArray, einstein_convention, Metric
+from relativisticpy.core.dependency import derivative, product
+from relativisticpy.core.plans import covariant_plan, flatten_components
+from relativisticpy.core.simplification import current, simplified, using
+from relativisticpy.symengine import SymbolArray, Basic
 
 # This Module
 from relativisticpy.gr.connection import Connection
 
+
+@einstein_convention
 class CovDerivative(EinsteinArray):
+    """
+    Covariant derivative operator D_{a}, applied by multiplication: D_{a} * T^{b}_{c} = d_{a} T^{b}_{c} + C^{b}_{a}_{e} T^{e}_{c} - C^{e}_{a}_{c} T^{b}_{e}.
+    The connection terms of each index variance pattern of T are compiled once (see core.plans.covariant_plan).
+    """
+
+    SYMBOL = "CovariantDerivativeSymbol"
+    NAME = "CovariantDerivative"
+
+    @staticmethod
+    def from_metric(metric: Metric) -> SymbolArray:
+        # The Christoffel symbols cached by the curvature pipeline of the metric.
+        return Connection.from_metric(metric).to_array()
+
+    @staticmethod
+    def from_connection(connection: Connection) -> SymbolArray:
+        return connection.components
+
+    def __init__(self, indices: Indices, arg: Union[Metric, Connection]):
+        if not isinstance(arg, (Metric, Connection)):
+            raise ValueError(f'arg must be of types: {Metric} or {Connection}')
+        self._arg = arg
+        self._connection = None
+        super().__init__(indices=indices, basis=arg.basis)
+
+    @property
+    def connection(self) -> SymbolArray:
+        """ Components of the connection C^{i}_{j}_{k}, computed on first use. """
+        if self._connection is None:
+            self._connection = CovDerivative.from_metric(self._arg) if isinstance(self._arg, Metric) else CovDerivative.from_connection(self._arg)
+        return self._connection
+
+    def __mul__(self, other: Union[EinsteinArray, Basic]) -> EinsteinArray:
+        if not isinstance(other, (float, int, Basic, EinsteinArray)):
+            raise TypeError(f"Unsupported operand type(s) for *: '{type(self).__name__}' and '{type(other).__name__}'")
+
+        wrt = tuple(self.basis)
+        if not isinstance(other, EinsteinArray): # Scalar field => D_{a} f = d_{a} f
+            return EinsteinArray(indices=Indices(*self.indices.indices), components=simplified(SymbolArray([derivative(other, wrt, k) for k in range(len(wrt))])), basis=self.basis)
+
+        N = self.dimention
+        T = flatten_components(other.components)
+        C = flatten_components(self.connection)
+        size = len(T)
+
+        result = SymbolArray.zeros(N, *other.components.shape)
+        flat = flatten_components(result)
+        for offset, terms in covariant_plan(tuple([idx.covariant for idx in other.indices.indices]), N):
+            partial = derivative(T[offset % size], wrt, offset // size)
+            flat[offset] = partial + sum([sign * product(C[c], T[t]) for sign, c, t in terms])
 
-    @classmethod
-    def from_metric(metric: Metric) -> 'CovDerivative':
-        pass
-
-    @classmethod
-    def from_connection(connection: Connection) -> 'CovDerivative':
-        pass
-    
-    def __init__(self, arg : Union[Metric, Connection], indices : Indices):
-        super().__init__(components  =   CovDerivative.from_metric(arg) if isinstance(arg, Metric) else CovDerivative.from_connection(arg) if isinstance(arg, Connection) else ValueError(f'arg must be of types: {type(Metric)} or {type(Connection)}'), 
-                         indices     =   indices,
-                         basis       =   arg.basis
-                        )
-
-    def __mul__(self, other : EinsteinArray) -> EinsteinArray:
-        self.__cov_derivative_object(other) # The number of connections in expression depends on indices stricture of other component
-        pass
-        
-    def __cov_derivative_object(self, other: EinsteinArray) -> EinsteinArray:
-        pass
+        # Repeated symbols with opposite variance, i.e. D_{a} * V^{a}, are summed by the EinsteinArray itself, before the simplification.
+        result = EinsteinArray(indices=Indices(*self.indices.indices, *other.indices.indices), components=result, basis=self.basis)
+        # trigsimp first: the simplified connection mixes forms, i.e. 1/tan(theta) and sin(2*theta)/2, which simplify alone does not cancel.
+        policy = current()
+        with using(policy if policy.strategy == 'none' else replace(policy, strategy=('trigsimp', *policy.pipeline))):
+            result.components = simplified(result.components)
+        return result.scalar_comp_value if result.scalar else result
@@ -0,0 +1,220 @@
+"""
+Exterior derivative and Cartan's structure equations.
+
+For diagonal and nearly diagonal metrics the curvature computed in an orthonormal frame has far fewer and much smaller expressions than the
+coordinate Christoffel route: the frame metric is constant (diag(+-1)), so no inverse metric enters the contractions and the connection 1-forms
+are mostly zero. Cartan computes
+
+    coframe        e^a = E^a_m dx^m                          g_{m}_{n} = eta_{a}_{b} E^a_m E^b_n
+    structure      de^a = 1/2 C^a_{b}_{c} e^b ^ e^c
+    connection     de^a = - w^a_b ^ e^b, w_{a}_{b} = - w_{b}_{a}       w_{a}_{b}_{c} = 1/2 (C_{a}_{b}_{c} + C_{b}_{c}_{a} - C_{c}_{a}_{b})
+    curvature      W^a_b = dw^a_b + w^a_e ^ w^e_b = 1/2 R^a_{b}_{c}_{d} e^c ^ e^d
+    ricci          Ric_{b}_{d} = eta^{a}^{c} R_{a}_{b}_{c}_{d}, R = eta^{a}^{b} Ric_{a}_{b}: traces, no inverse metric
+    coordinates    R_{m}_{n}_{r}_{s} = E^a_m E^b_n E^c_r E^d_s R_{a}_{b}_{c}_{d}, Ric_{m}_{n} = E^a_m E^b_n Ric_{a}_{b}  (on demand)
+
+It is selected per metric with Curvature.of(metric, engine='cartan'), after which every curvature stage (Riemann, Ricci, Einstein, Weyl, the
+invariants) is computed from the frame Riemann tensor: Ricci and the Ricci scalar are traced in the frame, so the coordinate Riemann tensor
+is only transformed when asked for.
+"""
+
+# Standard Library
+from functools import cached_property
+from typing import List, Tuple
+
+# External Modules
+from relativisticpy.core import Metric
+from relativisticpy.core.buffer import FlatComponents
+from relativisticpy.core.dependency import derivative, product
+from relativisticpy.core.simplification import simplified
+from relativisticpy.core.symmetry import IndexSymmetries, Antisymmetric, RIEMANN_SYMMETRIES, SYMMETRIC_RANK2, SymmetricComponents
+from relativisticpy.symengine import Basic, Matrix, Mul, Rational, expand, sqrt, sympify
+
+TWO_FORM_SYMMETRIES = IndexSymmetries(Antisymmetric(0, 1)) # F_{m}_{n}
+STRUCTURE_SYMMETRIES = IndexSymmetries(Antisymmetric(1, 2)) # C^a_{b}_{c}
+CONNECTION_FORM_SYMMETRIES = IndexSymmetries(Antisymmetric(0, 1)) # w_{a}_{b}_{c}
+
+
+def exterior_derivative(form: List, basis) -> SymmetricComponents:
+    """ (dA)_{m}_{n} = d_m A_n - d_n A_m of the 1-form A = A_m dx^m. """
+    N, wrt = len(basis), tuple(basis)
+    return TWO_FORM_SYMMETRIES.compute((N, N), lambda m, n: derivative(form[n], wrt, m) - derivative(form[m], wrt, n))
+
+
+class Cartan:
+    """
+    Curvature of a metric in an orthonormal frame. The stages are computed lazily and exactly once.
+
+    Attributes:
+        metric (Metric): The metric.
+        signature (Tuple[int, ...]): eta, the diagonal of the frame metric. Guessed from the signs of the metric if not given.
+        coframe (FlatComponents): coframe[a, m] = E^a_m
+        frame (FlatComponents): frame[m, a] = e_a^m, the inverse of the coframe.
+        structure: C^a_{b}_{c}
+        connection: w_{a}_{b}_{c}, the connection 1-forms w_{a}_{b} = w_{a}_{b}_{c} e^c
+        riemann_frame: R_{a}_{b}_{c}_{d}, in the orthonormal frame
+        riemann0000: R_{m}_{n}_{r}_{s}, in the coordinates of the metric
+        ricci_frame: Ric_{a}_{b}, in the orthonormal frame
+        ricci: Ric_{m}_{n}, in the coordinates of the metric
+        ricci_scalar: R
+    """
+
+    def __init__(self, metric: Metric, signature: Tuple[int, ...] = None):
+        self.metric = metric
+        self.dimention = metric.dimention
+        self.basis = tuple(metric.basis)
+        self.sparse = metric.sparse
+        self.signature = None if signature is None else tuple(signature)
+        if self.signature is not None and len(self.signature) != self.dimention:
+            raise ValueError(f"The signature {self.signature} does not match the dimention {self.dimention} of the metric.")
+
+    @cached_property
+    def coframe(self) -> FlatComponents:
+        # g = U^T D U with U unit upper triangular: E^a_m = sqrt(eta_a D_a) U_{a}_{m}, diagonal for a diagonal metric.
+        N = self.dimention
+        D, U = self.__ldl(FlatComponents.of(self.metric._.components))
+        if self.signature is None:
+            self.signature = tuple([_sign(D_a) for D_a in D])
+        E = [_root(eta_a * D_a) for eta_a, D_a in zip(self.signature, D)]
+        return FlatComponents([E[a] * U[a][m] for a in range(N) for m in range(N)], (N, N))
+
+    @cached_property
+    def frame(self) -> FlatComponents:
+        N = self.dimention
+        E = self.coframe
+        inverse = Matrix(N, N, E.flat).inv()
+        return FlatComponents([simplified(inverse[m, a]) for m in range(N) for a in range(N)], (N, N))
+
+    @cached_property
+    def structure(self) -> SymmetricComponents:
+        # C^a_{b}_{c} = (de^a)_{m}_{n} e_b^m e_c^n
+        N = self.dimention
+        e = self.__rows(self.frame, transpose=True) # e[b] = [(m, e_b^m), ...]
+        dE = [FlatComponents.of(exterior_derivative([self.coframe[a, m] for m in range(N)], self.basis)) for a in range(N)]
+
+        def component(a, b, c):
+            return sum([e_bm * e_cn * dE[a][m, n] for m, e_bm in e[b] for n, e_cn in e[c] if m != n and dE[a][m, n] != 0])
+
+        return simplified(STRUCTURE_SYMMETRIES.compute((N, N, N), component))
+
+    @cached_property
+    def connection(self) -> SymmetricComponents:
+        # w_{a}_{b}_{c} = 1/2 (C_{a}_{b}_{c} + C_{b}_{c}_{a} - C_{c}_{a}_{b}), with C_{a}_{b}_{c} = eta_a C^a_{b}_{c}.
+        N, eta = self.dimention, self.__signature()
+        C = FlatComponents.of(self.structure)
+        return simplified(CONNECTION_FORM_SYMMETRIES.compute(
+            (N, N, N), lambda a, b, c: Rational(1, 2) * (eta[a] * C[a, b, c] + eta[b] * C[b, c, a] - eta[c] * C[c, a, b])
+        ))
+
+    @cached_property
+    def riemann_frame(self) -> SymmetricComponents:
+        # R^a_{b}_{c}_{d} = e_c(w^a_{b}_{d}) - e_d(w^a_{b}_{c}) + w^a_{e}_{c} w^e_{b}_{d} - w^a_{e}_{d} w^e_{b}_{c} + w^a_{b}_{e} C^e_{c}_{d}
+        # with w^a_{b}_{c} = eta_a w_{a}_{b}_{c}, lowered with R_{a}_{b}_{c}_{d} = eta_a R^a_{b}_{c}_{d}.
+        N, eta = self.dimention, self.__signature()
+        w = FlatComponents.of(self.connection)
+        C = FlatComponents.of(self.structure)
+        e = self.__rows(self.frame, transpose=True)
+        directional = lambda c, f: sum([e_cm * derivative(f, self.basis, m) for m, e_cm in e[c]]) if f != 0 else 0 # e_c(f) = e_c^m d_m f
+
+        def component(a, b, c, d):
+            # eta_a eta_a = 1 => lowering a cancels the eta_a of w^a.
+            return (
+                directional(c, w[a, b, d])
+                - directional(d, w[a, b, c])
+                + sum([eta[f] * (product(w[a, f, c], w[f, b, d]) - product(w[a, f, d], w[f, b, c])) for f in range(N)])
+                + sum([product(w[a, b, f], C[f, c, d]) for f in range(N)])
+            )
+
+        # Only the independent components (21 in 4D) are computed and simplified.
+        return simplified(RIEMANN_SYMMETRIES.compute((N, N, N, N), component, self.sparse))
+
+    @cached_property
+    def riemann0000(self) -> SymmetricComponents:
+        # R_{m}_{n}_{r}_{s} = E^a_m E^b_n E^c_r E^d_s R_{a}_{b}_{c}_{d}: a single term per component for a diagonal metric.
+        N = self.dimention
+        R = FlatComponents.of(self.riemann_frame)
+        E = self.__rows(self.coframe, transpose=True) # E[m] = [(a, E^a_m), ...]
+
+        def component(m, n, r, s):
+            return sum([
+                E_am * E_bn * E_cr * E_ds * R[a, b, c, d]
+                for a, E_am in E[m] for b, E_bn in E[n] for c, E_cr in E[r] for d, E_ds in E[s]
+                if R[a, b, c, d] != 0
+            ])
+
+        return simplified(RIEMANN_SYMMETRIES.compute((N, N, N, N), component, self.sparse))
+
+    @cached_property
+    def ricci_frame(self) -> SymmetricComponents:
+        N, eta = self.dimention, self.__signature()
+        R = FlatComponents.of(self.riemann_frame)
+        return simplified(SYMMETRIC_RANK2.compute((N, N), lambda b, d: sum([eta[a] * R[a, b, a, d] for a in range(N)]), self.sparse))
+
+    @cached_property
+    def ricci(self) -> SymmetricComponents:
+        N = self.dimention
+        Ric = self.ricci_frame
+        E = self.__rows(self.coframe, transpose=True)
+        return simplified(SYMMETRIC_RANK2.compute(
+            (N, N), lambda m, n: sum([E_am * E_bn * Ric[a, b] for a, E_am in E[m] for b, E_bn in E[n] if Ric[a, b] != 0]), self.sparse
+        ))
+
+    @cached_property
+    def ricci_scalar(self) -> Basic:
+        eta = self.__signature()
+        Ric = self.ricci_frame
+        return simplified(sum([eta[a] * Ric[a, a] for a in range(self.dimention)]))
+
+    def __repr__(self) -> str:
+        computed = [stage for stage in ('coframe', 'frame', 'structure', 'connection', 'riemann_frame', 'riemann0000', 'ricci_frame', 'ricci', 'ricci_scalar') if stage in self.__dict__]
+        return f"Cartan({self.metric.indices}, computed={computed})"
+
+    # Privates
+    def __signature(self) -> Tuple[int, ...]:
+        self.coframe # The signature is guessed with the coframe.
+        return self.signature
+
+    def __rows(self, matrix: FlatComponents, transpose: bool = False):
+        """ Non-zero entries of each row (or column): rows[i] = [(j, m_ij), ...]. """
+        rows = [[] for _ in range(self.dimention)]
+        for (i, j), m_ij in matrix.nonzero_items():
+            if transpose:
+                rows[j].append((i, m_ij))
+            else:
+                rows[i].append((j, m_ij))
+        return rows
+
+    def __ldl(self, g: FlatComponents):
+        """ g_{m}_{n} = sum_a D_a U_{a}_{m} U_{a}_{n}, U unit upper triangular. """
+        N = self.dimention
+        D, U = [0] * N, [[1 if m == a else 0 for m in range(N)] for a in range(N)]
+        for a in range(N):
+            D[a] = simplified(g[a, a] - sum([D[b] * U[b][a] ** 2 for b in range(a) if U[b][a] != 0]))
+            if D[a] == 0:
+                raise ValueError(f"The metric has no orthonormal coframe in the coordinates {self.basis}: pivot {a} vanishes, i.e. reorder null coordinates.")
+            for m in range(a + 1, N):
+                U[a][m] = simplified((g[a, m] - sum([D[b] * U[b][a] * U[b][m] for b in range(a) if U[b][a] != 0 and U[b][m] != 0])) / D[a])
+        return D, U
+
+
+def _sign(expr) -> int:
+    """ Sign of a metric pivot, guessed from its constant term or numeric coefficient: (2 G M - r) / r => -1, r**2 => 1. """
+    expr = expand(sympify(expr))
+    if expr.is_number:
+        return -1 if expr < 0 else 1
+    constant, _ = expr.as_coeff_Add()
+    coefficient = constant if constant != 0 else expr.as_coeff_Mul()[0]
+    return -1 if coefficient < 0 else 1
+
+
+def _root(expr):
+    """
+    A square root of expr, with the even powers of its factors taken out: r**2 sin(theta)**2 => r sin(theta).
+    Any E^a_m such that eta_a (E^a_m)^2 reproduces the metric is a valid coframe (frames differ by reflections), hence no Abs is needed.
+    """
+    outside, inside = [], []
+    for base, exponent in sympify(expr).as_powers_dict().items():
+        if exponent.is_integer and exponent % 2 == 0:
+            outside.append(base ** (exponent / 2))
+        else:
+            inside.append(base ** exponent)
+    return Mul(*outside) * sqrt(Mul(*inside))
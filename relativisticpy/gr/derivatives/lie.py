@@ -0,0 +1,74 @@
+# Standard Library
+from typing import List, Tuple, Union
+
+# External Modules
+from relativisticpy.core import Indices, EinsteinArray, einstein_convention, Metric
+from relativisticpy.core.buffer import FlatComponents
+from relativisticpy.core.dependency import derivative, product
+from relativisticpy.core.plans import lie_plan, flatten_components
+from relativisticpy.core.simplification import simplified
+from relativisticpy.symengine import SymbolArray, Basic
+
+
+def jacobian(vector: List, basis) -> List:
+    """ Flat d_j X^{i}, at offset i * N + j. """
+    wrt = tuple(basis)
+    return [derivative(X, wrt, j) for X in vector for j in range(len(wrt))]
+
+
+def lie_components(vector: List, J: List, components: List, variance: Tuple[bool, ...], basis, first: FlatComponents = None) -> List:
+    """
+    Flat components of L_X T, not simplified.
+
+    Args:
+        vector (List): X^{a}.
+        J (List): Flat jacobian of X (see jacobian).
+        components (List): Flat components of T.
+        variance (Tuple[bool, ...]): Index variance of T, True for a lower index.
+        basis: The coordinates.
+        first (FlatComponents, optional): d_c T at [..., c], i.e. MetricJet.first of a metric: the cached derivatives are read instead of recomputed.
+    """
+    wrt = tuple(basis)
+    N = len(wrt)
+    partial = (lambda offset, c: first[offset * N + c]) if first is not None else (lambda offset, c: derivative(components[offset], wrt, c))
+    result = []
+    for offset, terms in lie_plan(variance, N):
+        transport = sum([product(vector[c], partial(offset, c)) for c in range(N) if vector[c] != 0])
+        result.append(transport + sum([sign * product(J[j], components[t]) for sign, j, t in terms]))
+    return result
+
+
+@einstein_convention
+class LieDerivative(EinsteinArray):
+    """
+    Lie derivative operator L_X along the vector field X^{a}, applied by multiplication:
+    L_X * T^{a}_{b} = X^{c} d_{c} T^{a}_{b} - d_{c} X^{a} T^{c}_{b} + d_{b} X^{c} T^{a}_{c}, for tensors of any rank.
+    The jacobian of X is differentiated once per operator, the terms of each index variance pattern compiled once (see core.plans.lie_plan),
+    and the derivatives of a metric read from its jet.
+    """
+
+    def __init__(self, vector: EinsteinArray):
+        if not isinstance(vector, EinsteinArray) or vector.rank != (1, 0):
+            raise ValueError(f"The Lie derivative is taken along a vector field X^{{a}}, got {vector}.")
+        super().__init__(indices=vector.indices, components=vector.components, basis=vector.basis)
+        self._jacobian = None
+
+    @property
+    def vector(self) -> List: return list(flatten_components(self.components))
+
+    @property
+    def jacobian(self) -> List:
+        if self._jacobian is None:
+            self._jacobian = jacobian(self.vector, self.basis)
+        return self._jacobian
+
+    def __mul__(self, other: Union[EinsteinArray, Basic]) -> EinsteinArray:
+        if not isinstance(other, (float, int, Basic, EinsteinArray)):
+            raise TypeError(f"Unsupported operand type(s) for *: '{type(self).__name__}' and '{type(other).__name__}'")
+
+        if not isinstance(other, EinsteinArray): # Scalar field => L_X f = X^{c} d_{c} f
+            return simplified(lie_components(self.vector, self.jacobian, [other], (), self.basis)[0])
+
+        first = other.jet.first if isinstance(other, Metric) and other._ is other else None
+        components = lie_components(self.vector, self.jacobian, list(flatten_components(other.components)), tuple([idx.covariant for idx in other.indices.indices]), self.basis, first)
+        return EinsteinArray(indices=Indices(*other.indices.indices), components=simplified(SymbolArray(components, other.components.shape)), basis=self.basis)
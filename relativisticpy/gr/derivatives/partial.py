@@ -1,6 +1,7 @@
 # External Modules
 from relativisticpy.core import EinsteinArray, einstein_convention, Indices
-from relativisticpy.symengine import diff, simplify
+from relativisticpy.core.dependency import derivative
+from relativisticpy.core.simplification import simplified
 
 
 @einstein_convention
@@ -14,6 +15,7 @@ class Derivative(EinsteinArray):
 
     def __mul__(self, other: EinsteinArray) -> EinsteinArray:
         self.components = other.basis
-        operation = lambda a, b : diff(b, a)
+        wrt = tuple(other.basis)
+        operation = lambda a, b : derivative(b, wrt, wrt.index(a)) # No diff when b does not depend on a.
         result = self.einsum_operation(other, operation)
-        return EinsteinArray(components = simplify(result.components), indices = result.indices, basis = other.basis)
+        return EinsteinArray(components = simplified(result.components), indices = result.indices, basis = other.basis)
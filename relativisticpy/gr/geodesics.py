@@ -0,0 +1,397 @@
+"""
+Numerical geodesics.
+
+GrComputations.Geodesic only writes down the geodesic equations, which then had to be lambdified and integrated one trajectory at a time.
+Here the Christoffel symbols cached by the curvature pipeline of a metric are compiled once (lambdify, sharing common subexpressions) into a numpy
+kernel evaluated on a whole batch of points per call, and GeodesicIntegrator integrates many geodesics at once, as one (geodesics, 2N) state
+array [x^{a}, v^{a} = dx^{a}/dtau]:
+
+    d v^{a} / dtau = - C^{a}_{b}_{c} v^{b} v^{c}
+
+with the methods:
+
+    'rk45'      adaptive Dormand-Prince 5(4), one step size per geodesic,
+    'rk4'       classical Runge-Kutta, fixed step,
+    'midpoint'  implicit midpoint rule on the canonical (x^{a}, p_{a} = g_{a}_{b} v^{b}), fixed step. Symplectic: the normalization g_{a}_{b} v^{a} v^{b}
+                and the energy do not drift over long integrations, and the momenta of the cyclic coordinates are conserved exactly.
+
+Events are sign changes of functions of the state between two steps (i.e. horizon crossings, turning points), located by linear interpolation,
+and the normalization constraint g_{a}_{b} v^{a} v^{b} is monitored along the geodesics.
+
+Numpy is an optional dependency (pip install relativisticpy[numeric]).
+"""
+
+# Standard Library
+from dataclasses import dataclass, field
+from timeit import default_timer
+from typing import Callable, Dict, List, Sequence, Tuple
+
+# External Modules
+from relativisticpy.core import Metric
+from relativisticpy.core.buffer import FlatComponents
+from relativisticpy.core.numeric import numpy
+from relativisticpy.gr.curvature import Curvature
+from relativisticpy.symengine import Basic, Symbol, lambdify
+
+# Status of a geodesic at the end of an integration.
+COMPLETED, TERMINATED, MAX_STEPS, STALLED = 0, 1, 2, 3
+
+# Dormand-Prince 5(4) tableau.
+_A = (
+    (),
+    (1/5,),
+    (3/40, 9/40),
+    (44/45, -56/15, 32/9),
+    (19372/6561, -25360/2187, 64448/6561, -212/729),
+    (9017/3168, -355/33, 46732/5247, 49/176, -5103/18656),
+    (35/384, 0, 500/1113, 125/192, -2187/6784, 11/84),
+)
+_B5 = (35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0)
+_B4 = (5179/57600, 0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40)
+
+
+class GeodesicKernel:
+    """
+    The Christoffel symbols, the metric and its inverse, compiled once into numpy functions of a batch of points x of shape (points, N).
+
+    Attributes:
+        basis (Tuple): The coordinates.
+        nonzero (Tuple[Tuple[int, int, int], ...]): Positions (a, b, c), b <= c, of the non-zero Christoffel symbols C^{a}_{b}_{c}.
+    """
+
+    def __init__(self, metric: Metric, substitutions: Dict[Symbol, float] = None):
+        np = numpy()
+        self.basis = tuple(metric.basis)
+        self.dimention = N = len(self.basis)
+        self.substitutions = substitutions
+
+        C = FlatComponents.of(Curvature.of(metric).connection)
+        g, inverse = FlatComponents.of(metric._.components), FlatComponents.of(metric.inv.components)
+        self.nonzero = tuple([(a, b, c) for a in range(N) for b in range(N) for c in range(b, N) if C[a, b, c] != 0])
+        self._pairs = tuple([(a, b) for a in range(N) for b in range(a, N)])
+
+        self._expressions = tuple([self.__substitute(expressions) for expressions in ([C[position] for position in self.nonzero], [g[pair] for pair in self._pairs], [inverse[pair] for pair in self._pairs])])
+        self.__compile()
+
+        # - C^{a}_{b}_{c} v^{b} v^{c} = - sum over the non-zero b <= c of (2 if b < c else 1) C^{a}_{b}_{c} v^{b} v^{c}: scattered onto a by a matmul.
+        index = np.array(self.nonzero, dtype=int).reshape(-1, 3)
+        self._a, self._b, self._c = index[:, 0], index[:, 1], index[:, 2]
+        self._scatter = np.zeros((len(self.nonzero), N))
+        self._scatter[np.arange(len(self.nonzero)), self._a] = -np.where(self._b < self._c, 2., 1.)
+        pairs = np.array(self._pairs, dtype=int)
+        self._i, self._j = pairs[:, 0], pairs[:, 1]
+
+    def christoffel(self, x):
+        """ C^{a}_{b}_{c} at the points x, shape (points, N, N, N). """
+        np = numpy()
+        values = self._connection(x)
+        result = np.zeros((x.shape[0],) + (self.dimention,) * 3)
+        result[:, self._a, self._b, self._c] = values
+        result[:, self._a, self._c, self._b] = values
+        return result
+
+    def metric(self, x):
+        """ g_{a}_{b} at the points x, shape (points, N, N). """
+        return self.__symmetric(self._metric(x), x.shape[0])
+
+    def inverse(self, x):
+        """ g^{a}^{b} at the points x, shape (points, N, N). """
+        return self.__symmetric(self._inverse(x), x.shape[0])
+
+    def acceleration(self, x, v):
+        """ - C^{a}_{b}_{c} v^{b} v^{c}, shape (points, N). """
+        return (self._connection(x) * v[:, self._b] * v[:, self._c]) @ self._scatter
+
+    def norm(self, x, v):
+        """ g_{a}_{b} v^{a} v^{b}: -1 for timelike geodesics parametrized by proper time (signature - + + +), 0 for null ones. """
+        np = numpy()
+        return np.einsum('nab,na,nb->n', self.metric(x), v, v)
+
+    def __getstate__(self) -> dict:
+        # Pickled with the expressions and compiled again on load, i.e. to send the kernel to the workers of a process pool.
+        return {key: value for key, value in self.__dict__.items() if key not in ('_connection', '_metric', '_inverse')}
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self.__compile()
+
+    # Privates
+    def __substitute(self, expressions: List) -> List:
+        if self.substitutions:
+            expressions = [expr.subs(self.substitutions) if isinstance(expr, Basic) else expr for expr in expressions]
+        free = set().union(*[getattr(expr, 'free_symbols', set()) for expr in expressions]) - set(self.basis)
+        if len(free) > 0:
+            raise ValueError(f"Symbols {free} must be given values via substitutions to integrate geodesics numerically.")
+        return expressions
+
+    def __compile(self):
+        self._connection, self._metric, self._inverse = [self.__lambdify(expressions) for expressions in self._expressions]
+
+    def __lambdify(self, expressions: List) -> Callable:
+        np = numpy()
+        if len(expressions) == 0:
+            return lambda x: np.zeros((x.shape[0], 0))
+        function = lambdify(self.basis, expressions, modules="numpy", cse=True)
+        return lambda x: np.stack([np.broadcast_to(np.asarray(value, dtype=np.float64), (x.shape[0],)) for value in function(*x.T)], axis=-1)
+
+    def __symmetric(self, values, points: int):
+        np = numpy()
+        result = np.zeros((points, self.dimention, self.dimention))
+        result[:, self._i, self._j] = values
+        result[:, self._j, self._i] = values
+        return result
+
+
+@dataclass
+class Event:
+    """
+    A sign change of function(tau, x, v) -> (geodesics,) values between two steps.
+
+    Attributes:
+        name (str): Key of the occurrences in GeodesicSolution.events.
+        function (Callable): (tau, x, v) -> values, each argument batched over the geodesics.
+        terminal (bool): Stops the geodesics at the event.
+        direction (int): +1 (-1) only detects the crossings where the value increases (decreases), 0 both.
+    """
+    name: str
+    function: Callable
+    terminal: bool = False
+    direction: int = 0
+
+
+def horizon(radius: float, coordinate: int = 1, margin: float = 1e-3) -> Event:
+    """
+    Terminal event of the geodesics falling through radius, i.e. horizon(2 * M) in Schwarzschild coordinates.
+    Fires at radius * (1 + margin): coordinates singular on the horizon (v^{t} diverges in Schwarzschild coordinates) never let a geodesic reach it.
+    """
+    return Event('horizon', lambda tau, x, v: x[:, coordinate] - radius * (1 + margin), terminal=True, direction=-1)
+
+
+def escape(radius: float, coordinate: int = 1) -> Event:
+    """ Terminal event of the geodesics leaving through radius. """
+    return Event('escape', lambda tau, x, v: x[:, coordinate] - radius, terminal=True, direction=1)
+
+
+def turning_point(coordinate: int = 1) -> Event:
+    """ The extrema of a coordinate along the geodesics, i.e. the periapsis and apoapsis of orbits. """
+    return Event('turning_point', lambda tau, x, v: v[:, coordinate])
+
+
+@dataclass
+class GeodesicSolution:
+    """
+    Attributes:
+        tau (ndarray): Affine parameter of the records, shape (records, geodesics). Adaptive steps differ per geodesic.
+        states (ndarray): [x, v] of the records, shape (records, geodesics, 2N). Only the initial and final states unless recorded.
+        constraint (ndarray): g_{a}_{b} v^{a} v^{b} of the records, shape (records, geodesics).
+        status (ndarray): COMPLETED, TERMINATED (by a terminal event), MAX_STEPS or STALLED, per geodesic. STALLED: the adaptive step underflowed,
+            a fixed step diverged or an implicit step did not converge.
+        steps (ndarray): Accepted steps per geodesic.
+        events (Dict[str, List[Tuple[int, float, ndarray]]]): Per event name, the (geodesic, tau, state) of its occurrences.
+        elapsed (float): Wall time of the integration, in seconds.
+    """
+    tau: object
+    states: object
+    constraint: object
+    status: object
+    steps: object
+    events: Dict[str, List[Tuple[int, float, object]]] = field(default_factory=dict)
+    elapsed: float = 0.
+
+    @property
+    def final(self): return self.states[-1]
+
+    @property
+    def drift(self):
+        """ Largest deviation of the normalization constraint from its initial value, per geodesic. """
+        return numpy().abs(self.constraint - self.constraint[0]).max(axis=0)
+
+    @property
+    def steps_per_second(self) -> float:
+        """ Throughput of the integration, in geodesic-steps per second. """
+        return float(self.steps.sum()) / self.elapsed if self.elapsed > 0 else float('inf')
+
+
+class GeodesicIntegrator:
+    """
+    Integrates batches of geodesics of a metric, compiled once (see GeodesicKernel).
+
+    Attributes:
+        kernel (GeodesicKernel): The compiled Christoffel symbols and metric.
+    """
+
+    METHODS = ('rk45', 'rk4', 'midpoint')
+
+    def __init__(self, metric: Metric, substitutions: Dict[Symbol, float] = None):
+        self.kernel = GeodesicKernel(metric, substitutions)
+        self.dimention = self.kernel.dimention
+
+    def state(self, x, spatial, norm: float = -1.):
+        """
+        Initial states with v^{0} solved from g_{a}_{b} v^{a} v^{b} = norm (future directed: the larger root).
+
+        Args:
+            x (array_like): Positions, shape (geodesics, N) or (N,).
+            spatial (array_like): v^{1}, ..., v^{N-1}, shape (geodesics, N - 1) or (N - 1,).
+            norm (float): -1 for timelike geodesics parametrized by proper time, 0 for null geodesics.
+
+        Returns:
+            ndarray: The states [x, v], shape (geodesics, 2N) or (2N,).
+        """
+        np = numpy()
+        x, spatial = np.asarray(x, dtype=np.float64), np.asarray(spatial, dtype=np.float64)
+        single = x.ndim == 1
+        x, spatial = np.atleast_2d(x), np.atleast_2d(spatial)
+        g = self.kernel.metric(x)
+        A = g[:, 0, 0]
+        B = 2 * np.einsum('ni,ni->n', g[:, 0, 1:], spatial)
+        C = np.einsum('nij,ni,nj->n', g[:, 1:, 1:], spatial, spatial) - norm
+        discriminant = B**2 - 4 * A * C
+        if np.any(discriminant < 0):
+            raise ValueError(f"No v^0 solves g(v, v) = {norm} for the geodesics {np.flatnonzero(discriminant < 0)}.")
+        roots = np.stack([(-B - np.sqrt(discriminant)) / (2 * A), (-B + np.sqrt(discriminant)) / (2 * A)])
+        state = np.concatenate([x, roots.max(axis=0)[:, None], spatial], axis=1)
+        return state[0] if single else state
+
+    def rhs(self, y):
+        """ d/dtau [x, v] = [v, - C v v] """
+        np = numpy()
+        N = self.dimention
+        x, v = y[:, :N], y[:, N:]
+        return np.concatenate([v, self.kernel.acceleration(x, v)], axis=1)
+
+    def validate(self, y):
+        """ Raises ValueError unless y is a batch of states [x, v]. """
+        if y.shape[1] != 2 * self.dimention:
+            raise ValueError(f"States must have 2N = {2 * self.dimention} components, got {y.shape[1]}.")
+
+    def integrate(self, state, tau: float, method: str = 'rk45', step: float = None, rtol: float = 1e-9, atol: float = 1e-12,
+                  events: Sequence[Event] = (), max_steps: int = 100000, record: bool = True) -> GeodesicSolution:
+        """
+        Integrates the geodesics from tau = 0 to tau.
+
+        Args:
+            state (array_like): Initial states [x, v], shape (geodesics, 2N) or (2N,).
+            tau (float): Final value of the affine parameter, > 0.
+            method (str): 'rk45' (adaptive), 'rk4' or 'midpoint' (fixed step, symplectic).
+            step (float, optional): Step of the fixed step methods, initial step of 'rk45'.
+            rtol, atol (float): Tolerances of 'rk45'.
+            events (Sequence[Event]): Events to detect.
+            max_steps (int): Bound on the iterations.
+            record (bool): Keeps every step in the solution, else only the initial and final states.
+        """
+        np = numpy()
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown method '{method}', expected one of {self.METHODS}.")
+        if method != 'rk45' and step is None:
+            raise ValueError(f"The fixed step method '{method}' needs a step.")
+        if tau <= 0:
+            raise ValueError("Geodesics are integrated forward: tau must be positive.")
+
+        N = self.dimention
+        y = np.atleast_2d(np.array(state, dtype=np.float64))
+        self.validate(y)
+        n = y.shape[0]
+
+        t, h = np.zeros(n), np.full(n, step if step is not None else 1e-3 * tau)
+        status, steps, active = np.full(n, COMPLETED), np.zeros(n, dtype=int), np.ones(n, dtype=bool)
+        values = [event.function(t, y[:, :N], y[:, N:2 * N]) for event in events]
+        occurrences = {event.name: [] for event in events}
+        taus, states, constraints = [t.copy()], [y.copy()], [self.kernel.norm(y[:, :N], y[:, N:2 * N])]
+
+        start = default_timer()
+        for _ in range(max_steps):
+            rows = np.flatnonzero(active)
+            if len(rows) == 0:
+                break
+            hr = np.minimum(h[rows], tau - t[rows])
+
+            if method == 'rk45':
+                y_new, error = self.__dormand_prince(y[rows], hr)
+                scale = atol + rtol * np.maximum(np.abs(y[rows]), np.abs(y_new))
+                error = np.sqrt(np.mean((error / scale)**2, axis=1))
+                accepted = error <= 1
+                with np.errstate(divide='ignore'):
+                    h[rows] = hr * np.clip(0.9 * error**-0.2, 0.2, 5.)
+                stalled = rows[~accepted & (h[rows] < 1e-14 * tau)] # i.e. at a coordinate singularity.
+                status[stalled], active[stalled] = STALLED, False
+            else:
+                with np.errstate(all='ignore'):
+                    if method == 'rk4':
+                        y_new, converged = self.__rk4(y[rows], hr), np.ones(len(rows), dtype=bool)
+                    else:
+                        y_new, converged = self.__midpoint(y[rows], hr)
+                # i.e. a fixed step jumping over a coordinate singularity, or an implicit step the fixed point iteration did not solve.
+                diverged = ~np.isfinite(y_new).all(axis=1) | ~converged
+                status[rows[diverged]], active[rows[diverged]] = STALLED, False
+                accepted = ~diverged
+
+            rows, y_new, hr = rows[accepted], y_new[accepted], hr[accepted]
+            t_new = t[rows] + hr
+            stopped = np.zeros(len(rows), dtype=bool)
+            for k, event in enumerate(events):
+                before, after = values[k][rows], event.function(t_new, y_new[:, :N], y_new[:, N:2 * N])
+                crossed = ((before < 0) & (after >= 0) & (event.direction >= 0)) | ((before > 0) & (after <= 0) & (event.direction <= 0))
+                for i in np.flatnonzero(crossed & ~stopped):
+                    s = before[i] / (before[i] - after[i])
+                    located = y[rows[i]] + s * (y_new[i] - y[rows[i]])
+                    occurrences[event.name].append((int(rows[i]), float(t[rows[i]] + s * hr[i]), located))
+                    if event.terminal:
+                        y_new[i], t_new[i], stopped[i] = located, t[rows[i]] + s * hr[i], True
+                values[k][rows] = after
+
+            y[rows], t[rows] = y_new, t_new
+            steps[rows] += 1
+            status[rows[stopped]] = TERMINATED
+            active[rows[stopped | (t_new >= tau * (1 - 1e-12))]] = False
+            if record:
+                taus.append(t.copy()), states.append(y.copy()), constraints.append(self.kernel.norm(y[:, :N], y[:, N:2 * N]))
+        status[active] = MAX_STEPS
+        elapsed = default_timer() - start
+
+        if not record:
+            taus.append(t.copy()), states.append(y.copy()), constraints.append(self.kernel.norm(y[:, :N], y[:, N:2 * N]))
+        return GeodesicSolution(np.array(taus), np.array(states), np.array(constraints), status, steps, occurrences, elapsed)
+
+    # Privates
+    def __dormand_prince(self, y, h):
+        h = h[:, None]
+        k = [self.rhs(y)]
+        for a in _A[1:]:
+            k.append(self.rhs(y + h * sum([coefficient * ki for coefficient, ki in zip(a, k) if coefficient != 0])))
+        y5 = y + h * sum([b * ki for b, ki in zip(_B5, k) if b != 0])
+        error = h * sum([(b5 - b4) * ki for b5, b4, ki in zip(_B5, _B4, k) if b5 != b4])
+        return y5, error
+
+    def __rk4(self, y, h):
+        h = h[:, None]
+        k1 = self.rhs(y)
+        k2 = self.rhs(y + h / 2 * k1)
+        k3 = self.rhs(y + h / 2 * k2)
+        k4 = self.rhs(y + h * k3)
+        return y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+    def __midpoint(self, y, h, tolerance: float = 1e-14, iterations: int = 100):
+        """
+        z_1 = z_0 + h f((z_0 + z_1) / 2) on z = (x, p), solved by fixed point iteration: dx/dtau = v, dp_a/dtau = C^{d}_{a}_{b} v^{b} p_d.
+        Returns the steps, and whether the iteration converged for each geodesic.
+        """
+        np = numpy()
+        N, h = self.dimention, h[:, None]
+        x0, p0 = y[:, :N], np.einsum('nab,nb->na', self.kernel.metric(y[:, :N]), y[:, N:])
+        x1, p1 = x0.copy(), p0.copy()
+        pending = np.arange(len(y)) # Only the geodesics not yet converged are iterated.
+        for _ in range(iterations):
+            x, p = (x0[pending] + x1[pending]) / 2, (p0[pending] + p1[pending]) / 2
+            v = np.einsum('nab,nb->na', self.kernel.inverse(x), p)
+            dp = np.einsum('ndab,nb,nd->na', self.kernel.christoffel(x), v, p)
+            x2, p2 = x0[pending] + h[pending] * v, p0[pending] + h[pending] * dp
+            change = np.maximum(np.abs(x2 - x1[pending]).max(axis=1), np.abs(p2 - p1[pending]).max(axis=1))
+            size = np.maximum(np.abs(x2).max(axis=1), np.abs(p2).max(axis=1))
+            x1[pending], p1[pending] = x2, p2
+            pending = pending[~(change <= tolerance * (1 + size))]
+            if len(pending) == 0:
+                break
+        converged = np.ones(len(y), dtype=bool)
+        converged[pending] = False
+        return np.concatenate([x1, np.einsum('nab,nb->na', self.kernel.inverse(x1), p1)], axis=1), converged
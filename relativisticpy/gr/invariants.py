@@ -0,0 +1,106 @@
+"""
+Curvature invariants of a metric.
+
+The Kretschmann scalar was contracted as g^{i}^{j} g^{k}^{p} g^{d}^{n} g^{s}^{t} R_{i}_{k}_{d}_{s} R_{j}_{p}_{n}_{t}: an 8-deep loop, 65,536 terms in 4D.
+Instead the cached Riemann tensor is raised once to R^{a}^{b}_{c}_{d} (see Curvature.riemann1100) and every invariant is a pairwise contraction
+of the cached intermediates, in O(N^4) at most. The antisymmetry of both index pairs is used: only a < b and c < d are summed over.
+
+    K = R_{a}_{b}_{c}_{d} R^{a}^{b}^{c}^{d} = R^{a}^{b}_{c}_{d} R^{c}^{d}_{a}_{b}       (Kretschmann)
+    Ric^2 = Ric_{a}_{b} Ric^{a}^{b} = Ric^{a}_{b} Ric^{b}_{a}
+    W^2 = C_{a}_{b}_{c}_{d} C^{a}^{b}^{c}^{d} = K - 4/(N-2) Ric^2 + 2/((N-1)(N-2)) R^2   (Weyl squared)
+    E = K - 4 Ric^2 + R^2                                                             (Gauss-Bonnet scalar, Euler density sqrt|g| E)
+    P = 1/2 [a b e f] R^{c}^{d}_{a}_{b} R_{c}_{d}_{e}_{f}                            (Chern-Pontryagin density, 4D only)
+
+where [a b e f] is the Levi-Civita symbol, [0 1 2 3] = 1.
+"""
+
+# Standard Library
+from functools import cached_property
+
+# External Modules
+from relativisticpy.core import Metric
+from relativisticpy.core.buffer import FlatComponents
+from relativisticpy.core.dependency import product
+from relativisticpy.core.simplification import simplified
+from relativisticpy.gr.curvature import Curvature
+from relativisticpy.symengine import Basic, LeviCivita, Rational
+
+
+class Invariants:
+    """
+    Lazily computed, memoized curvature invariants of a metric, all contracted from the stages of its Curvature pipeline.
+
+    Attributes:
+        curvature (Curvature): The pipeline the invariants are contracted from.
+        kretschmann: R_{a}_{b}_{c}_{d} R^{a}^{b}^{c}^{d}
+        ricci_squared: Ric_{a}_{b} Ric^{a}^{b}
+        weyl_squared: C_{a}_{b}_{c}_{d} C^{a}^{b}^{c}^{d}
+        gauss_bonnet: K - 4 Ric^2 + R^2
+        euler_density: sqrt|g| (K - 4 Ric^2 + R^2)
+        chern_pontryagin: 1/2 [a b e f] R^{c}^{d}_{a}_{b} R_{c}_{d}_{e}_{f}
+    """
+
+    def __init__(self, curvature: Curvature):
+        self.curvature = curvature
+        self.metric = curvature.metric
+        self.dimention = curvature.dimention
+
+    @classmethod
+    def of(cls, metric: Metric) -> 'Invariants':
+        """ The invariants of metric, memoized on the metric as long as its curvature pipeline is. """
+        curvature = Curvature.of(metric)
+        if 'invariants' not in metric.derived or metric.derived['invariants'].curvature is not curvature:
+            metric.derived['invariants'] = cls(curvature)
+        return metric.derived['invariants']
+
+    @cached_property
+    def kretschmann(self) -> Basic:
+        # R^{a}^{b}_{c}_{d} R^{c}^{d}_{a}_{b}: both pairs antisymmetric => 4 x the sum over a < b, c < d.
+        M = FlatComponents.of(self.curvature.riemann1100)
+        pairs = self.__pairs()
+        return simplified(4 * sum([product(M[a, b, c, d], M[c, d, a, b]) for a, b in pairs for c, d in pairs]))
+
+    @cached_property
+    def ricci_squared(self) -> Basic:
+        N = self.dimention
+        Ric = FlatComponents.of(self.curvature.ricci_mixed)
+        return simplified(sum([product(Ric[a, b], Ric[b, a]) for a in range(N) for b in range(N)]))
+
+    @cached_property
+    def weyl_squared(self) -> Basic:
+        N = self.dimention
+        if N < 3:
+            return 0 # The Weyl tensor vanishes identically in 2D (and in 3D, where the identity below gives 0 too).
+        K, Ric2, R = self.kretschmann, self.ricci_squared, self.curvature.ricci_scalar
+        return simplified(K - Rational(4, N - 2) * Ric2 + Rational(2, (N - 1) * (N - 2)) * R**2)
+
+    @cached_property
+    def gauss_bonnet(self) -> Basic:
+        return simplified(self.kretschmann - 4 * self.ricci_squared + self.curvature.ricci_scalar**2)
+
+    @cached_property
+    def euler_density(self) -> Basic:
+        return simplified(self.metric.sqrt_abs_determinant * self.gauss_bonnet)
+
+    @cached_property
+    def chern_pontryagin(self) -> Basic:
+        if self.dimention != 4:
+            raise ValueError(f"The Chern-Pontryagin density is only defined in 4 dimentions, the metric has {self.dimention}.")
+        M = FlatComponents.of(self.curvature.riemann1100)
+        R = FlatComponents.of(self.curvature.riemann0000)
+        pairs = self.__pairs()
+        # Each of the three pairs (a, b), (e, f) and (c, d) is antisymmetric => 1/2 x 8 x the sum over a < b, e < f, c < d.
+        return simplified(4 * sum([
+            LeviCivita(a, b, e, f) * sum([product(M[c, d, a, b], R[c, d, e, f]) for c, d in pairs])
+            for a, b in pairs
+            for e, f in pairs
+            if len({a, b, e, f}) == 4
+        ]))
+
+    def __repr__(self) -> str:
+        computed = [invariant for invariant in ('kretschmann', 'ricci_squared', 'weyl_squared', 'gauss_bonnet', 'euler_density', 'chern_pontryagin') if invariant in self.__dict__]
+        return f"Invariants({self.metric.indices}, computed={computed})"
+
+    # Privates
+    def __pairs(self):
+        return [(a, b) for a in range(self.dimention) for b in range(a + 1, self.dimention)]
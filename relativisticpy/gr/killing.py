@@ -0,0 +1,142 @@
+"""
+Killing vectors of a metric and their symmetry algebra.
+
+A Killing vector X solves L_X g_{a}_{b} = X^{c} d_{c} g_{a}_{b} + g_{c}_{b} d_{a} X^{c} + g_{a}_{c} d_{b} X^{c} = 0. The equations are solved with
+an undetermined coefficient ansatz X^{a} = sum_i c^{a}_{i} f_i over a dictionary of functions of the coordinates:
+
+    1, the coordinates (translations, boosts, rotations of flat space), and sin(y), cos(y) (and sin(y) / tan(z), cos(y) / tan(z)) for the angles y,
+    i.e. the coordinates the metric depends on through trigonometric functions (z) and the coordinates it does not depend on at all.
+
+L_X g is linear in the coefficients c. Each of its components is put over a common denominator with the trigonometric functions rewritten as
+exponentials, so its numerator is a sum of linearly independent functions of the coordinates (monomials, exp(i n y), metric functions A(r) and
+their derivatives, taken generic): the coefficient of each must vanish. The Killing vectors are the null space of these linear equations.
+Every vector found is an exact solution. Symmetries outside of the span of the dictionary are not found: extend it with functions=[...].
+"""
+
+# Standard Library
+from collections import defaultdict
+from functools import cached_property
+from typing import Dict, List, Tuple
+
+# External Modules
+from relativisticpy.core import Metric, EinsteinArray, Indices, Idx
+from relativisticpy.core.plans import flatten_components
+from relativisticpy.core.simplification import simplified
+from relativisticpy.gr.derivatives.lie import jacobian, lie_components
+from relativisticpy.symengine import Add, Basic, Matrix, Symbol, SymbolArray, TrigonometricFunction, exp, expand, linsolve, sin, cos, tan, sympify, together
+
+
+class KillingVectors:
+    """
+    Lazily solved, memoized Killing vectors of a metric.
+
+    Attributes:
+        metric (Metric): The metric.
+        functions (List): The dictionary the components of the Killing vectors are expanded over.
+        vectors (List[EinsteinArray]): A basis X_k^{a} of the Killing vectors.
+        structure_constants (Dict[Tuple[int, int], Dict[int, Basic]]): [X_i, X_j] = sum_k f_ij^k X_k, for i < j (non-zero f_ij^k only).
+        cyclic (List): The coordinates x^k the metric does not depend on, i.e. with d_k Killing: no component of the curvature depends on them.
+    """
+
+    def __init__(self, metric: Metric, functions: List = None, degree: int = 1):
+        self.metric = metric._
+        self.basis = tuple(metric.basis)
+        self.dimention = len(self.basis)
+        self.functions = [sympify(f) for f in functions] if functions is not None else self.__dictionary(degree)
+
+    @classmethod
+    def of(cls, metric: Metric) -> 'KillingVectors':
+        """ The Killing vectors of metric over the default dictionary, memoized on the metric until its components change. """
+        if 'killing' not in metric.derived:
+            metric.derived['killing'] = cls(metric)
+        return metric.derived['killing']
+
+    @property
+    def dimension(self) -> int:
+        """ Dimension of the symmetry algebra found. """
+        return len(self.vectors)
+
+    @property
+    def cyclic(self) -> List:
+        return [x for k, x in enumerate(self.basis) if k not in self.metric.jet.dependencies.coordinates]
+
+    @cached_property
+    def vectors(self) -> List[EinsteinArray]:
+        N, F = self.dimention, self.functions
+        coefficients = [[Symbol(f'c_{a}_{i}') for i in range(len(F))] for a in range(N)]
+        unknowns = [c for row in coefficients for c in row]
+        X = [sum([c * f for c, f in zip(row, F)]) for row in coefficients]
+
+        # L_X g_{a}_{b}, reading the derivatives of the metric from its jet. Symmetric in a, b: only a <= b are solved.
+        jet = self.metric.jet
+        L = lie_components(X, jacobian(X, self.basis), jet.g.flat, (True, True), self.basis, jet.first)
+        equations = _linear_conditions([L[a * N + b] for a in range(N) for b in range(a, N)], self.basis)
+        if len(equations) == 0:
+            solutions = [[int(i == j) for i in range(len(unknowns))] for j in range(len(unknowns))]
+        else:
+            solutions = Matrix([[equation.coeff(c) for c in unknowns] for equation in equations]).nullspace()
+
+        vectors = []
+        for solution in solutions:
+            components = [simplified(sum([solution[a * len(F) + i] * F[i] for i in range(len(F))])) for a in range(N)]
+            vectors.append(EinsteinArray(Indices(-Idx('a')), SymbolArray(components), SymbolArray(list(self.basis))))
+        return vectors
+
+    @cached_property
+    def structure_constants(self) -> Dict[Tuple[int, int], Dict[int, Basic]]:
+        vectors = [list(flatten_components(X.components)) for X in self.vectors]
+        f = [Symbol(f'f_{k}') for k in range(len(vectors))]
+        constants = {}
+        for i in range(len(vectors)):
+            for j in range(i + 1, len(vectors)):
+                bracket = self.bracket(vectors[i], vectors[j])
+                conditions = _linear_conditions([bracket[a] - sum([f[k] * vectors[k][a] for k in range(len(vectors))]) for a in range(self.dimention)], self.basis)
+                solution = list(linsolve(conditions, f)) if len(conditions) > 0 else [tuple([0] * len(f))]
+                if len(solution) == 0:
+                    raise ValueError(f"[X_{i}, X_{j}] is not in the span of the Killing vectors found: extend the dictionary.")
+                constants[(i, j)] = {k: simplified(value) for k, value in enumerate(solution[0]) if value != 0}
+        return constants
+
+    def bracket(self, X: List, Y: List) -> List:
+        """ [X, Y]^{a} = X^{b} d_{b} Y^{a} - Y^{b} d_{b} X^{a} """
+        N = self.dimention
+        JX, JY = jacobian(X, self.basis), jacobian(Y, self.basis)
+        return [simplified(sum([X[b] * JY[a * N + b] - Y[b] * JX[a * N + b] for b in range(N)])) for a in range(N)]
+
+    def __repr__(self) -> str: return f"KillingVectors(dimension={self.dimension if 'vectors' in self.__dict__ else 'unsolved'})"
+
+    # Privates
+    def __dictionary(self, degree: int) -> List:
+        g = [component for component in self.metric.jet.g.flat if isinstance(component, Basic)]
+        trigonometric = set().union(*[set(f.free_symbols) for component in g for f in component.atoms(TrigonometricFunction)])
+        periodic = [x for x in self.basis if x in trigonometric]
+        angles = periodic + self.cyclic
+        functions = [sympify(1)] + _monomials(self.basis, degree)
+        for y in angles:
+            for f in (sin(y), cos(y)):
+                functions += [f] + [f / tan(z) for z in periodic if z != y]
+        return functions
+
+
+# Privates
+def _monomials(basis: Tuple, degree: int) -> List:
+    monomials, previous = [], [sympify(1)]
+    for _ in range(degree):
+        previous = list(dict.fromkeys([m * x for m in previous for x in basis]))
+        monomials += previous
+    return monomials
+
+
+def _linear_conditions(expressions: List, basis: Tuple) -> List:
+    """ The linear equations on the unknown coefficients for each expression to vanish identically in the coordinates. """
+    conditions = []
+    for expr in expressions:
+        if expr == 0:
+            continue
+        numerator = together(expand(expr).rewrite(exp)).as_numer_denom()[0]
+        groups = defaultdict(int)
+        for term in Add.make_args(expand(numerator)):
+            coefficient, function = term.as_independent(*basis)
+            groups[function] += coefficient
+        conditions += [condition for condition in groups.values() if condition != 0]
+    return conditions
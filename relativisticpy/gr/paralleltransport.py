@@ -0,0 +1,94 @@
+"""
+Numerical parallel transport of tensors along batches of curves.
+
+The tensors T^{a}_{b} are transported along the curves x(tau), of tangent u = dx/dtau:
+
+    d T^{a}_{b} / dtau = - C^{a}_{c}_{d} u^{c} T^{d}_{b} + C^{d}_{c}_{b} u^{c} T^{a}_{d}
+
+integrated together with the curves, as one (curves, 2N + m N^k) state array [x, u, T_1, ..., T_m] of m tensors of rank k per curve
+(i.e. the four vectors of a tetrad). The curves are geodesics, or accelerated worldlines du^{a}/dtau = - C^{a}_{b}_{c} u^{b} u^{c} + a^{a}(x, u)
+(i.e. static observers, circular orbits, circles of latitude). The Christoffel symbols are compiled once (see gr.geodesics.GeodesicKernel),
+and the transport is stepped by the integrator of the geodesics, with its events and its monitoring of g_{a}_{b} u^{a} u^{b}.
+
+    transport = ParallelTransport(metric, {M: 1}, variance=(False,))
+    solution = transport.integrate(transport.attach(state, tetrad), 100., method='rk4', step=0.1)
+    transport.tensors(solution.final) # (curves, 4, N): the transported tetrads.
+
+Numpy is an optional dependency (pip install relativisticpy[numeric]).
+"""
+
+# Standard Library
+from typing import Callable, Dict, Tuple
+
+# External Modules
+from relativisticpy.core import Metric
+from relativisticpy.core.numeric import numpy
+from relativisticpy.symengine import Symbol
+
+# This Module
+from relativisticpy.gr.geodesics import GeodesicIntegrator
+
+
+class ParallelTransport(GeodesicIntegrator):
+    """
+    Integrates curves of a metric together with the tensors transported along them.
+
+    Attributes:
+        variance (Tuple[bool, ...]): Index variance of the transported tensors, True for a lower index: (False,) for vectors V^{a}.
+        acceleration (Callable, optional): a^{a}(x, u), batched over the curves, shape (curves, N). None for geodesics.
+    """
+
+    METHODS = ('rk45', 'rk4')
+
+    def __init__(self, metric: Metric, substitutions: Dict[Symbol, float] = None, variance: Tuple[bool, ...] = (False,), acceleration: Callable = None):
+        super().__init__(metric, substitutions)
+        self.variance = tuple(variance)
+        self.acceleration = acceleration
+
+    @property
+    def size(self) -> int:
+        """ Number of components of each transported tensor. """
+        return self.dimention ** len(self.variance)
+
+    def attach(self, state, tensors):
+        """
+        The states [x, u, T_1, ..., T_m] of the curves with the tensors to transport.
+
+        Args:
+            state (array_like): [x, u] of the curves, shape (curves, 2N) or (2N,).
+            tensors (array_like): Components of the tensors, shape (curves, m, N, ..., N), or (curves, N, ..., N) for one tensor per curve.
+        """
+        np = numpy()
+        state = np.atleast_2d(np.asarray(state, dtype=np.float64))
+        tensors = np.asarray(tensors, dtype=np.float64).reshape(len(state), -1)
+        if tensors.shape[1] % self.size != 0:
+            raise ValueError(f"Tensors of variance {self.variance} have {self.size} components, got {tensors.shape[1]} per curve.")
+        return np.concatenate([state, tensors], axis=1)
+
+    def tensors(self, states):
+        """ The transported tensors of states (curves, 2N + m N^k), shape (curves, m, N, ..., N). """
+        return states[..., 2 * self.dimention:].reshape(states.shape[:-1] + (-1,) + (self.dimention,) * len(self.variance))
+
+    def validate(self, y):
+        """ Raises ValueError unless y is a batch of states [x, u, T_1, ..., T_m]. """
+        if y.shape[1] < 2 * self.dimention or (y.shape[1] - 2 * self.dimention) % self.size != 0:
+            raise ValueError(f"States must have 2N + m N^k = {2 * self.dimention} + m {self.size} components, got {y.shape[1]}.")
+
+    def rhs(self, y):
+        """ d/dtau [x, u, T] = [u, - C u u + a, - C u T (upper indices) + C u T (lower indices)] """
+        np = numpy()
+        N, n = self.dimention, len(y)
+        x, u = y[:, :N], y[:, N:2 * N]
+        du = self.kernel.acceleration(x, u)
+        if self.acceleration is not None:
+            du = du + self.acceleration(x, u)
+
+        # A^{a}_{d} = C^{a}_{c}_{d} u^{c}, contracted with each index of the tensors in turn.
+        A = np.einsum('nacd,nc->nad', self.kernel.christoffel(x), u)
+        T = y[:, 2 * N:].reshape((n, -1) + (N,) * len(self.variance))
+        dT = np.zeros_like(T)
+        for k, lower in enumerate(self.variance):
+            moved = np.moveaxis(T, 2 + k, -1)
+            term = np.einsum('n...d,ndb->n...b', moved, A) if lower else -np.einsum('n...d,nad->n...a', moved, A)
+            dT += np.moveaxis(term, -1, 2 + k)
+        return np.concatenate([u, du, dT.reshape(n, -1)], axis=1)
@@ -0,0 +1,208 @@
+"""
+Batched ray tracing of null geodesics: black hole shadows and lensing maps.
+
+A Camera at rest in the coordinates (a static observer) sees along the directions n of its pixels, in the orthonormal frame e_{0}, ..., e_{3}
+obtained from the coordinate basis by Gram-Schmidt (e_{1} radially outwards, e_{2} towards increasing theta, e_{3} towards increasing phi).
+The photon seen along n arrives with momentum e_{0} - n^{i} e_{i}: it is traced backwards from the camera, as the null geodesic with initial
+tangent - e_{0} + n^{i} e_{i}, until it is captured (falls through the horizon) or escapes (reaches the escape radius). Every ray of the image
+is integrated by the vectorized kernels of gr.geodesics, in chunks across a process pool, each chunk written into memory-mapped output buffers.
+
+    camera = Camera([0, 30, pi / 2, 0], resolution=(512, 512), field_of_view=0.6)
+    image = RayTracer(metric, {M: 1}, horizon=2, escape=60).trace(camera, processes=8, output='shadow')
+    image.shadow # (512, 512) booleans: the captured rays.
+
+The Christoffel symbols need not be simplified to be compiled: for Kerr-like metrics, build the tracer within using(Simplifier('none')).
+Numpy is an optional dependency (pip install relativisticpy[numeric]).
+"""
+
+# Standard Library
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from timeit import default_timer
+from typing import Dict, Sequence, Tuple
+
+# External Modules
+from relativisticpy.core import Metric
+from relativisticpy.core.numeric import numpy
+from relativisticpy.symengine import Symbol
+
+# This Module
+from relativisticpy.gr.geodesics import GeodesicIntegrator, GeodesicKernel, STALLED, escape, horizon
+
+# Fate of a ray.
+CAPTURED, ESCAPED, UNRESOLVED = 0, 1, 2
+
+
+def orthonormal_frame(kernel: GeodesicKernel, x):
+    """
+    The frame e_{k}^{a} (rows k) at the point x of the static observer, by Gram-Schmidt of the coordinate basis: g(e_{j}, e_{k}) = diag(-1, 1, ..., 1).
+    Raises ValueError where d_{0} is not timelike (i.e. inside an ergoregion), no observer being at rest there.
+    """
+    np = numpy()
+    g = kernel.metric(np.atleast_2d(np.asarray(x, dtype=np.float64)))[0]
+    N = len(g)
+    if g[0, 0] >= 0:
+        raise ValueError(f"No observer is at rest at {list(x)}: g_00 = {g[0, 0]} is not negative.")
+    frame, signs = np.zeros((N, N)), np.ones(N)
+    signs[0] = -1.
+    for k in range(N):
+        u = np.eye(N)[k]
+        for j in range(k):
+            u = u - signs[j] * (frame[j] @ g @ u) * frame[j]
+        frame[k] = u / np.sqrt(signs[k] * (u @ g @ u))
+    return frame
+
+
+@dataclass
+class Camera:
+    """
+    Pinhole camera of a static observer, looking towards decreasing radius.
+
+    Attributes:
+        position (Sequence[float]): Coordinates of the camera (t, r, theta, phi).
+        resolution (Tuple[int, int]): (width, height) in pixels.
+        field_of_view (float): Horizontal angle of view, in radians.
+    """
+    position: Sequence[float]
+    resolution: Tuple[int, int] = (64, 64)
+    field_of_view: float = 0.5
+
+    @property
+    def shape(self) -> Tuple[int, int]: return (self.resolution[1], self.resolution[0])
+
+    @property
+    def pixels(self) -> int: return self.resolution[0] * self.resolution[1]
+
+    def directions(self):
+        """ Unit directions (n^{1}, n^{2}, n^{3}) seen by the pixels in the frame of the camera, row by row from the top left, shape (pixels, 3). """
+        np = numpy()
+        width, height = self.resolution
+        half = np.tan(self.field_of_view / 2)
+        u = (np.arange(width) + 0.5) / width * 2 * half - half # Rightwards: increasing phi.
+        v = ((np.arange(height) + 0.5) / height * 2 * half - half) * height / width # Upwards: decreasing theta.
+        U, V = np.meshgrid(u, v[::-1])
+        n = np.stack([-np.ones(U.size), -V.ravel(), U.ravel()], axis=1)
+        return n / np.linalg.norm(n, axis=1)[:, None]
+
+
+@dataclass
+class Image:
+    """
+    Attributes:
+        status (ndarray): CAPTURED, ESCAPED or UNRESOLVED, per pixel, shape (height, width).
+        final (ndarray): [x, v] of the rays where they stopped, shape (height, width, 2N): the escaped rays give the lensing map (theta, phi).
+        steps (int): Steps integrated over all the rays.
+        elapsed (float): Wall time of the tracing, in seconds.
+    """
+    status: object
+    final: object
+    steps: int = 0
+    elapsed: float = 0.
+
+    @property
+    def shadow(self): return self.status == CAPTURED
+
+    @property
+    def rays_per_second(self) -> float: return self.status.size / self.elapsed if self.elapsed > 0 else float('inf')
+
+    @property
+    def steps_per_second(self) -> float: return self.steps / self.elapsed if self.elapsed > 0 else float('inf')
+
+
+class RayTracer:
+    """
+    Traces the null geodesics seen by a camera, compiled once (see GeodesicKernel) and sent to the workers of the process pool.
+
+    Attributes:
+        integrator (GeodesicIntegrator): The compiled geodesic equations.
+        horizon (float): Radius the captured rays fall through.
+        escape (float): Radius the escaping rays reach, beyond the camera.
+        coordinate (int): Index of the radial coordinate.
+        length (float): Bound on the affine parameter of the rays, the rays still in flight are UNRESOLVED. Defaults to 10 * escape.
+    """
+
+    def __init__(self, metric: Metric, substitutions: Dict[Symbol, float] = None, horizon: float = 2., escape: float = 100., coordinate: int = 1,
+                 length: float = None, method: str = 'rk45', rtol: float = 1e-8, atol: float = 1e-10, max_steps: int = 20000):
+        self.integrator = GeodesicIntegrator(metric, substitutions)
+        if self.integrator.dimention != 4:
+            raise ValueError(f"Rays are traced in four dimensions, the metric has {self.integrator.dimention}.")
+        self.horizon, self.escape, self.coordinate = horizon, escape, coordinate
+        self.length = length if length is not None else 10. * escape
+        self.method, self.rtol, self.atol, self.max_steps = method, rtol, atol, max_steps
+
+    def rays(self, camera: Camera):
+        """ Initial states [x, v] of the rays of the pixels, traced backwards in time, shape (pixels, 2N). """
+        np = numpy()
+        if not self.horizon < camera.position[self.coordinate] < self.escape:
+            raise ValueError(f"The camera must lie between the horizon ({self.horizon}) and the escape radius ({self.escape}).")
+        frame = orthonormal_frame(self.integrator.kernel, camera.position)
+        v = -frame[0] + camera.directions() @ frame[1:]
+        return np.concatenate([np.tile(np.asarray(camera.position, dtype=np.float64), (camera.pixels, 1)), v], axis=1)
+
+    def trace(self, camera: Camera, processes: int = None, chunk: int = 4096, output: str = None) -> Image:
+        """
+        Traces every ray of the camera.
+
+        Args:
+            camera (Camera): The camera.
+            processes (int, optional): Number of worker processes the chunks are traced across. None (or 1) traces in process.
+            chunk (int): Number of rays integrated as one batch.
+            output (str, optional): Directory of the memory-mapped buffers status.npy and final.npy, kept on disk (i.e. for images too
+                large for memory). None for an image in memory.
+        """
+        np = numpy()
+        states = self.rays(camera)
+        bounds = [(start, min(start + chunk, len(states))) for start in range(0, len(states), chunk)]
+
+        with tempfile.TemporaryDirectory() as scratch:
+            directory = output if output is not None else scratch
+            os.makedirs(directory, exist_ok=True)
+            np.lib.format.open_memmap(os.path.join(directory, 'status.npy'), mode='w+', dtype=np.int8, shape=(len(states),)).flush()
+            np.lib.format.open_memmap(os.path.join(directory, 'final.npy'), mode='w+', dtype=np.float64, shape=states.shape).flush()
+            work = [(start, stop, states[start:stop], directory) for start, stop in bounds]
+
+            start = default_timer()
+            if processes == None or processes <= 1 or len(work) <= 1:
+                steps = [_trace_chunk(args, self) for args in work]
+            else:
+                with ProcessPoolExecutor(max_workers=processes, initializer=_initialize, initargs=(self,)) as pool:
+                    steps = list(pool.map(_trace_chunk, work))
+            elapsed = default_timer() - start
+
+            status, final = [np.load(os.path.join(directory, name), mmap_mode='r+' if output is not None else None) for name in ('status.npy', 'final.npy')]
+            return Image(status.reshape(camera.shape), final.reshape(camera.shape + (states.shape[1],)), int(sum(steps)), elapsed)
+
+    def trace_rays(self, states) -> Tuple[object, object, int]:
+        """ Integrates a batch of rays [x, v]: their status, final states and the number of steps integrated. """
+        np = numpy()
+        solution = self.integrator.integrate(states, self.length, method=self.method, rtol=self.rtol, atol=self.atol,
+                                             events=[horizon(self.horizon, self.coordinate), escape(self.escape, self.coordinate)],
+                                             max_steps=self.max_steps, record=False)
+        status = np.full(len(states), UNRESOLVED, dtype=np.int8)
+        status[[geodesic for geodesic, _, _ in solution.events['escape']]] = ESCAPED
+        status[[geodesic for geodesic, _, _ in solution.events['horizon']]] = CAPTURED
+        # The step underflows on the rays approaching the horizon closer than its event, i.e. tangentially.
+        status[(solution.status == STALLED) & (solution.final[:, self.coordinate] < 1.1 * self.horizon)] = CAPTURED
+        return status, solution.final, int(solution.steps.sum())
+
+
+# Privates
+_worker = {}
+
+
+def _initialize(tracer: RayTracer):
+    _worker['tracer'] = tracer
+
+
+def _trace_chunk(args, tracer: RayTracer = None) -> int:
+    """ Traces the rays [start, stop) into the buffers of the directory, by the tracer of the worker process unless given one. """
+    np = numpy()
+    start, stop, states, directory = args
+    status, final, steps = (tracer or _worker['tracer']).trace_rays(states)
+    buffers = [np.load(os.path.join(directory, name), mmap_mode='r+') for name in ('status.npy', 'final.npy')]
+    buffers[0][start:stop], buffers[1][start:stop] = status, final
+    for buffer in buffers:
+        buffer.flush()
+    return steps
@@ -5,9 +5,11 @@
 from typing import Union
 
 from relativisticpy.gr.connection import Connection
+from relativisticpy.gr.curvature import Curvature
 
 from relativisticpy.symengine import SymbolArray
 from relativisticpy.core import EinsteinArray, Indices, Metric
+from relativisticpy.core.cache import cached_components
 
 
 class GeometricObject(EinsteinArray):
@@ -29,7 +31,7 @@ class GeometricObject(EinsteinArray):
 
         if isinstance(symbols, Metric):
             self._metric = symbols  # Only property which lives at this level
-            components = self.from_metric(symbols)
+            components = cached_components(type(self).__name__, symbols, lambda: self.from_metric(symbols), Curvature.of(symbols).engine)
             basis = symbols.basis
 
         elif isinstance(symbols, Connection):
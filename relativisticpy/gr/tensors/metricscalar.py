@@ -1,8 +1,7 @@
-from itertools import product
-from relativisticpy.core import Metric, Indices, einstein_convention
-from relativisticpy.gr.connection import Connection
+from relativisticpy.core import Metric, Indices, einstein_convention, sparse
 from relativisticpy.gr.tensors.geometric import GeometricObject
-from relativisticpy.symengine import SymbolArray, simplify
+from relativisticpy.core.simplification import simplified
+from relativisticpy.symengine import SymbolArray
 
 
 @einstein_convention
@@ -11,12 +10,11 @@ class MetricScalar(GeometricObject):
         super().__init__(symbols=metric, indices=Indices(), basis=basis)
 
     def from_metric(self, metric: Metric):
-        N = metric.dimention
         g = metric.components
         ig = metric.inv.components
         A = float()
-        for i, j in product( range(N), range(N) ):
+        for (i, j), ig_ij in sparse.nonzero_items(ig):
             A += (
-                ig[i, j] * g[i, j]
+                ig_ij * g[i, j]
             )
-        return simplify(A)
+        return simplified(A)
@@ -1,47 +1,48 @@
-# Standard Library
-from itertools import product
-
 # External Modules
 from relativisticpy.core import Indices, Metric, einstein_convention
-from relativisticpy.symengine import SymbolArray, Rational, zeros, diff, simplify
+from relativisticpy.core.symmetry import SYMMETRIC_RANK2, SymmetricComponents
+from relativisticpy.core.buffer import FlatComponents
+from relativisticpy.core.dependency import derivative
+from relativisticpy.core.simplification import simplified
+from relativisticpy.symengine import SymbolArray
 
 # This Module
 from relativisticpy.gr.connection import Connection
+from relativisticpy.gr.curvature import Curvature
 from relativisticpy.gr.tensors.geometric import GeometricObject
-from relativisticpy.gr.tensors.riemann import Riemann
 
 
 @einstein_convention
 class Ricci(GeometricObject):
+    symmetries = SYMMETRIC_RANK2
+
     def __init__(self, indices: Indices, arg, basis: SymbolArray = None):
         super().__init__(indices=indices, symbols=arg, basis=basis)
 
-    def from_connection(self, connection: Connection) -> SymbolArray:
+    def from_connection(self, connection: Connection) -> SymmetricComponents:
         N = connection.dimention
         wrt = connection.basis
-        Gamma = connection.components
-        A = SymbolArray(zeros(N**2), (N, N))
-        for j, p, i, d in product(range(N), range(N), range(N), range(N)):
-            A[j, p] += Rational(1, N) * (
-                diff(Gamma[i, p, j], wrt[i])
-                - diff(Gamma[i, i, j], wrt[p])
-            ) + (
-                Gamma[i, i, d] * Gamma[d, p, j]
-                - Gamma[i, p, d] * Gamma[d, i, j]
-            )
-        return simplify(A)
-
-    def from_metric(self, metric: Metric) -> SymbolArray:
-        N = metric.dimention
-        wrt = metric.basis
-        Gamma = Connection.from_metric(metric)
-        A = SymbolArray(zeros(N**2), (N, N))
-        for j, p, i, d in product(range(N), range(N), range(N), range(N)):
-            A[j, p] += Rational(1, N) * (
-                diff(Gamma[i, p, j], wrt[i])
-                - diff(Gamma[i, i, j], wrt[p])
-            ) + (
-                Gamma[i, i, d] * Gamma[d, p, j]
-                - Gamma[i, p, d] * Gamma[d, i, j]
-            )
-        return simplify(A)
+        Gamma = connection.compact if connection.compact is not None else connection.components
+        return Ricci.components_from_christoffels(Gamma, wrt, N, connection.sparse)
+
+    def from_metric(self, metric: Metric) -> SymmetricComponents:
+        # Contracted from the Riemann tensor cached by the curvature pipeline of the metric.
+        return Curvature.of(metric).ricci
+
+    @classmethod
+    def components_from_christoffels(cls, Gamma, wrt: SymbolArray, N: int, sparse: bool = False) -> SymmetricComponents:
+        Gamma = FlatComponents.of(Gamma)
+        wrt = tuple(wrt)
+
+        def component(j, p):
+            # Structurally vanishing derivatives and products with a zero factor are skipped.
+            return sum([
+                derivative(Gamma[i, p, j], wrt, i)
+                - derivative(Gamma[i, i, j], wrt, p)
+                + sum([Gamma[i, i, d] * Gamma[d, p, j] for d in range(N) if Gamma[i, i, d] != 0 and Gamma[d, p, j] != 0])
+                - sum([Gamma[i, p, d] * Gamma[d, i, j] for d in range(N) if Gamma[i, p, d] != 0 and Gamma[d, i, j] != 0])
+                for i in range(N)
+            ])
+
+        # Symmetric => only the components j <= p are computed and simplified.
+        return simplified(Ricci.symmetries.compute((N, N), component, sparse))
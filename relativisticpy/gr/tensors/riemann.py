@@ -1,24 +1,30 @@
 # Standard Library
 from typing import Union
-from itertools import product
 
 # External Modules
 from relativisticpy.core import Indices, Metric, einstein_convention
-from relativisticpy.symengine import SymbolArray, Rational, zeros, diff, simplify
+from relativisticpy.core.buffer import FlatComponents
+from relativisticpy.core.dependency import derivative
+from relativisticpy.core.symmetry import SymmetricComponents, RIEMANN_MIXED_SYMMETRIES
+from relativisticpy.core.simplification import simplified
+from relativisticpy.symengine import SymbolArray
 
 # This Module
 from relativisticpy.gr.connection import Connection
+from relativisticpy.gr.curvature import Curvature
 from relativisticpy.gr.tensors.geometric import GeometricObject
 
 @einstein_convention
 class Riemann(GeometricObject):
+    symmetries = RIEMANN_MIXED_SYMMETRIES # Components are stored as R^{a}_{b}_{c}_{d}
+
     def __init__(self, indices: Indices, arg, basis: SymbolArray = None):
         super().__init__(symbols=arg, indices=indices, basis=basis)
 
     def from_components(components: SymbolArray) -> SymbolArray:
         return components
 
-    def from_metric(self, metric: Metric, index_structure: int = None) -> SymbolArray:
+    def from_metric(self, metric: Metric, index_structure: int = None) -> SymmetricComponents:
         if index_structure == 0000:
             return Riemann.riemann0000_components_from_metric(metric)
 
@@ -26,41 +32,29 @@ class Riemann(GeometricObject):
         return Riemann.riemann1000_components_from_metric(metric)
 
     @classmethod
-    def riemann1000_components_from_metric(cls, metric: Metric):
-        N = metric.dimention
-        wrt = metric.basis
-        C = Connection.from_metric(metric)
-        A = SymbolArray(zeros(N**4), (N, N, N, N))
-        for i, j, k, p, d in product(range(N), range(N), range(N), range(N), range(N)):
-            A[i, j, k, p] += Rational(1, N) * (
-                diff(C[i, p, j], wrt[k]) - diff(C[i, k, j], wrt[p])
-            ) + (C[i, k, d] * C[d, p, j] - C[i, p, d] * C[d, k, j])
-        return simplify(A)
+    def riemann1000_components_from_metric(cls, metric: Metric) -> SymmetricComponents:
+        return Curvature.of(metric).riemann
 
     @classmethod
-    def riemann0000_components_from_metric(cls, metric: Metric):
-        dim = metric.dimention
-        metric_comps = metric.components
-        rie_comps = Riemann.riemann1000_components_from_metric(metric)
-        A = SymbolArray(zeros(dim**4), (dim, dim, dim, dim))
-        for i, j, k, p, d in product(
-            range(dim), range(dim), range(dim), range(dim), range(dim)
-        ):
-            A[i, j, k, p] += metric_comps[i, d] * rie_comps[d, j, k, p]
-        return simplify(A)
+    def riemann0000_components_from_metric(cls, metric: Metric) -> SymmetricComponents:
+        return Curvature.of(metric).riemann0000
 
-    def from_connection(connection: Connection) -> SymbolArray:
+    def from_connection(self, connection: Connection) -> SymmetricComponents:
         # Setup Relevant quantities for computation
         N = connection.dimention
         wrt = connection.basis
-        C = connection.components
-        A = SymbolArray(zeros(N**4), (N, N, N, N))
+        C = FlatComponents.of(connection.compact if connection.compact is not None else connection.components)
 
-        # Perform computation
-        for i, j, k, p, d in product(range(N), range(N), range(N), range(N), range(N)):
-            A[i, j, k, p] += Rational(1, N) * (
-                diff(C[i, p, j], wrt[k]) - diff(C[i, k, j], wrt[p])
-            ) + (C[i, k, d] * C[d, p, j] - C[i, p, d] * C[d, k, j])
+        wrt = tuple(wrt)
 
-        # Simplify object on before returning.
-        return simplify(A)
+        def component(i, j, k, p):
+            # Structurally vanishing derivatives and products with a zero factor are skipped.
+            return (
+                derivative(C[i, p, j], wrt, k)
+                - derivative(C[i, k, j], wrt, p)
+                + sum([C[i, k, d] * C[d, p, j] for d in range(N) if C[i, k, d] != 0 and C[d, p, j] != 0])
+                - sum([C[i, p, d] * C[d, k, j] for d in range(N) if C[i, p, d] != 0 and C[d, k, j] != 0])
+            )
+
+        # Perform computation on the independent components only (antisymmetric in the last two indices) and simplify.
+        return simplified(Riemann.symmetries.compute((N, N, N, N), component, connection.sparse))
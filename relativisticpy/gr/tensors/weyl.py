@@ -0,0 +1,20 @@
+# External Modules
+from relativisticpy.core import Indices, Metric, einstein_convention
+from relativisticpy.core.symmetry import RIEMANN_SYMMETRIES, SymmetricComponents
+from relativisticpy.symengine import SymbolArray
+
+# This Module
+from relativisticpy.gr.curvature import Curvature
+from relativisticpy.gr.tensors.geometric import GeometricObject
+
+
+@einstein_convention
+class Weyl(GeometricObject):
+    symmetries = RIEMANN_SYMMETRIES # Components are stored as C_{a}_{b}_{c}_{d}
+
+    def __init__(self, indices: Indices, arg, basis: SymbolArray = None):
+        super().__init__(symbols=arg, indices=indices, basis=basis)
+
+    def from_metric(self, metric: Metric) -> SymmetricComponents:
+        # Decomposed from the Riemann, Ricci and Ricci scalar stages cached by the curvature pipeline of the metric.
+        return Curvature.of(metric).weyl
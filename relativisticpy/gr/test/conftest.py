@@ -0,0 +1,22 @@
+import pytest
+from relativisticpy.core import Metric, MetricIndices, Idx
+from relativisticpy.symengine import Symbol, SymbolArray, sin
+
+
+def metric(components, basis):
+    return Metric(MetricIndices(Idx('a'), Idx('b')), SymbolArray(components), basis)
+
+
+@pytest.fixture(scope="module")
+def schwarzschild():
+    """ (components, basis) of the Schwarzschild metric, of mass M (G the gravitational constant). """
+    t, r, theta, phi, G, M = [Symbol(s) for s in ("t", "r", "theta", "phi", "G", "M")]
+    f = 1 - 2 * G * M / r
+    return [[-f, 0, 0, 0], [0, 1 / f, 0, 0], [0, 0, r**2, 0], [0, 0, 0, r**2 * sin(theta)**2]], [t, r, theta, phi]
+
+
+@pytest.fixture(scope="module")
+def sphere():
+    """ The metric of the unit 2-sphere. """
+    theta, phi = Symbol("theta"), Symbol("phi")
+    return metric([[1, 0], [0, sin(theta)**2]], [theta, phi])
@@ -0,0 +1,63 @@
+import pytest
+from relativisticpy.core import Indices, Idx
+from relativisticpy.symengine import Symbol, Function, sin, simplify
+from relativisticpy.gr import Riemann
+from relativisticpy.gr.curvature import Curvature
+from relativisticpy.gr.derivatives.exterior import Cartan, exterior_derivative
+from relativisticpy.gr.test.conftest import metric
+
+
+def assert_engines_agree(components, basis):
+    coordinate = Curvature.of(metric(components, basis), engine='coordinate')
+    cartan = Curvature.of(metric(components, basis), engine='cartan')
+    for position, value in coordinate.riemann0000.values.items():
+        assert simplify(value - cartan.riemann0000[position]) == 0
+    for position, value in coordinate.ricci.values.items():
+        assert simplify(value - cartan.ricci[position]) == 0
+    assert simplify(coordinate.ricci_scalar - cartan.ricci_scalar) == 0
+
+
+def test_exterior_derivative_of_one_form():
+    x, y = Symbol("x"), Symbol("y")
+    dA = exterior_derivative([y, x**2], [x, y])
+    assert dA[0, 1] == 2 * x - 1 and dA[1, 0] == 1 - 2 * x and dA[0, 0] == 0
+
+
+def test_orthonormal_frame_of_schwarzschild(schwarzschild):
+    G, M, r = Symbol("G"), Symbol("M"), Symbol("r")
+    cartan = Cartan(metric(*schwarzschild))
+    assert cartan.signature is None
+    R = cartan.riemann_frame
+    assert cartan.signature == (-1, 1, 1, 1)
+    assert simplify(R[0, 1, 0, 1] + 2 * G * M / r**3) == 0
+    assert simplify(R[2, 3, 2, 3] - 2 * G * M / r**3) == 0
+
+
+@pytest.mark.parametrize("name", ["schwarzschild", "spherically_symmetric", "off_diagonal"])
+def test_cartan_engine_matches_coordinate_engine(name, schwarzschild):
+    t, r, theta, phi, x, y, z = [Symbol(s) for s in ("t", "r", "theta", "phi", "x", "y", "z")]
+    A, B = Function("A")(r), Function("B")(r)
+    cases = {
+        "schwarzschild": schwarzschild,
+        "spherically_symmetric": ([[-A, 0, 0, 0], [0, B, 0, 0], [0, 0, r**2, 0], [0, 0, 0, r**2 * sin(theta)**2]], [t, r, theta, phi]),
+        "off_diagonal": ([[-1, 0, 0, x * y], [0, 1, 0, 0], [0, 0, 1, 0], [x * y, 0, 0, 1 + x**2]], [t, x, y, z]),
+    }
+    assert_engines_agree(*cases[name])
+
+
+def test_engine_selected_per_metric(schwarzschild):
+    g = metric(*schwarzschild)
+    curvature = Curvature.of(g, engine='cartan')
+    assert Curvature.of(g) is curvature # The memo keeps its engine.
+    Riemann(Indices(Idx('a'), -Idx('b'), -Idx('c'), -Idx('d')), g)
+    assert 'riemann_frame' in curvature.cartan.__dict__ and 'connection' not in curvature.__dict__
+
+    assert Curvature.of(g, engine='coordinate') is not curvature
+    with pytest.raises(ValueError):
+        Curvature.of(g, engine='tetrad')
+
+
+def test_null_pivot_has_no_coframe():
+    u, v = Symbol("u"), Symbol("v")
+    with pytest.raises(ValueError):
+        Cartan(metric([[0, 1], [1, 0]], [u, v])).coframe
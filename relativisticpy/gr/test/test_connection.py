@@ -0,0 +1,23 @@
+import pytest
+from relativisticpy.core.indices import Idx
+from relativisticpy.core.sparse import to_dense
+from relativisticpy.symengine import Symbol, sin, SymbolArray, SparseSymbolArray, simplify
+from relativisticpy.gr.connection import Connection
+from relativisticpy.core import Metric, MetricIndices, Indices
+
+
+@pytest.fixture
+def schild_components():
+    M, r, theta = Symbol("M"), Symbol("r"), Symbol("theta")
+    components = [[-(1 - M/r), 0, 0, 0], [0, 1/(1 - M/r), 0, 0], [0, 0, r**2, 0], [0, 0, 0, r**2*sin(theta)**2]]
+    basis = [Symbol("t"), r, theta, Symbol("phi")]
+    return components, basis
+
+
+def test_sparse_metric_connection(schild_components):
+    components, basis = schild_components
+    dense = Connection(Indices(-Idx('a'), Idx('b'), Idx('c')), Metric(MetricIndices(Idx('a'), Idx('b')), SymbolArray(components), basis))
+    sparse = Connection(Indices(-Idx('a'), Idx('b'), Idx('c')), Metric(MetricIndices(Idx('a'), Idx('b')), SparseSymbolArray(components), basis))
+
+    assert sparse.sparse
+    assert simplify(dense.components - to_dense(sparse.components)) == SymbolArray.zeros(4, 4, 4)
@@ -0,0 +1,64 @@
+import pytest
+from relativisticpy.core import EinsteinArray, Indices, Idx
+from relativisticpy.core.plans import covariant_plan
+from relativisticpy.core.simplification import Simplifier, using
+from relativisticpy.symengine import Symbol, Function, SymbolArray, sin, cos, diff, simplify
+from relativisticpy.gr import CovDerivative, EinsteinTensor
+from relativisticpy.gr.test.conftest import metric
+
+
+@pytest.fixture
+def spherically_symmetric():
+    t, r, theta, phi = [Symbol(s) for s in ("t", "r", "theta", "phi")]
+    A, B = Function("A")(r), Function("B")(r)
+    return metric([[-A, 0, 0, 0], [0, B, 0, 0], [0, 0, r**2, 0], [0, 0, 0, r**2 * sin(theta)**2]], [t, r, theta, phi])
+
+
+def test_metric_is_covariantly_constant(spherically_symmetric):
+    g = spherically_symmetric
+    D = CovDerivative(Indices(Idx('a')), g)
+    lower = D * EinsteinArray(Indices(Idx('b'), Idx('c')), g.components, g.basis)
+    upper = D * EinsteinArray(Indices(-Idx('b'), -Idx('c')), g.inv.components, g.basis)
+    assert str(lower.indices) == "_{a}_{b}_{c}" and str(upper.indices) == "_{a}^{b}^{c}"
+    assert simplify(lower.components) == SymbolArray.zeros(4, 4, 4)
+    assert simplify(upper.components) == SymbolArray.zeros(4, 4, 4)
+
+
+def test_simplification_policy_applies():
+    theta, phi = Symbol("theta"), Symbol("phi")
+    g = metric([[1, 0], [0, 1]], [theta, phi])
+    T = EinsteinArray(Indices(Idx('b')), SymbolArray([(sin(theta)**2 + cos(theta)**2) * phi, 0]), g.basis)
+    with using(Simplifier('none')):
+        assert (CovDerivative(Indices(Idx('a')), g) * T).components[1, 0] == sin(theta)**2 + cos(theta)**2
+    assert (CovDerivative(Indices(Idx('a')), g) * T).components[1, 0] == 1
+
+
+def test_divergence_of_vector_field():
+    theta, phi = Symbol("theta"), Symbol("phi")
+    g = metric([[1, 0], [0, sin(theta)**2]], [theta, phi])
+    V = [Function("f")(theta, phi), Function("h")(theta, phi)]
+    divergence = CovDerivative(Indices(Idx('a')), g) * EinsteinArray(Indices(-Idx('a')), SymbolArray(V), g.basis)
+    expected = sum([diff(sin(theta) * V[k], x) for k, x in enumerate(g.basis)]) / sin(theta) # (1/sqrt|g|) d_a (sqrt|g| V^a)
+    assert simplify(divergence - expected) == 0
+
+
+def test_contracted_bianchi_identity(spherically_symmetric):
+    g = spherically_symmetric
+    G = EinsteinArray(Indices(-Idx('a'), -Idx('c')), g.inv.components, g.basis) * EinsteinTensor(Indices(Idx('c'), Idx('b')), g)
+    divergence = CovDerivative(Indices(Idx('a')), g) * G
+    assert str(divergence.indices) == "_{b}"
+    assert simplify(divergence.components) == SymbolArray.zeros(4)
+
+
+def test_gradient_of_scalar_field():
+    x, y = Symbol("x"), Symbol("y")
+    g = metric([[1, 0], [0, x**2]], [x, y])
+    gradient = CovDerivative(Indices(Idx('a')), g) * (x**2 * y)
+    assert list(gradient.components) == [2 * x * y, x**2]
+
+
+def test_correction_terms_compiled_once_per_variance_pattern():
+    covariant_plan.cache_clear()
+    plan = covariant_plan((False, True), 4)
+    assert covariant_plan((False, True), 4) is plan and covariant_plan.cache_info().hits == 1
+    assert len(plan) == 4**3 and all([len(terms) == 2 * 4 for _, terms in plan])
@@ -0,0 +1,42 @@
+import pytest
+from relativisticpy.core import Metric, MetricIndices, Indices, Idx
+from relativisticpy.symengine import Symbol, SymbolArray, sin, simplify
+from relativisticpy.gr import Connection, Ricci, RicciScalar, Riemann
+from relativisticpy.gr.curvature import Curvature
+
+
+@pytest.fixture
+def sphere():
+    theta, phi = Symbol("theta"), Symbol("phi")
+    return Metric(MetricIndices(Idx('a'), Idx('b')), SymbolArray([[1, 0], [0, sin(theta)**2]]), [theta, phi])
+
+
+def test_stages_computed_once_per_metric(sphere):
+    curvature = Curvature.of(sphere)
+    assert Curvature.of(sphere) is curvature
+
+    Riemann(Indices(Idx('a'), -Idx('b'), -Idx('c'), -Idx('d')), sphere)
+    connection, riemann = curvature.connection, curvature.riemann
+    Ricci(Indices(-Idx('a'), -Idx('b')), sphere)
+    RicciScalar(sphere, sphere.basis)
+
+    assert Connection.from_metric(sphere) is connection
+    assert Riemann.riemann1000_components_from_metric(sphere) is riemann
+    assert simplify(curvature.ricci_scalar - 2) == 0
+
+
+def test_ricci_contracted_from_riemann_matches_christoffels(sphere):
+    curvature = Curvature.of(sphere)
+    direct = Ricci.components_from_christoffels(curvature.connection, sphere.basis, 2)
+    for a in range(2):
+        for b in range(2):
+            assert simplify(curvature.ricci[a, b] - direct[a, b]) == 0
+
+
+def test_memo_dropped_when_metric_components_change(sphere):
+    curvature = Curvature.of(sphere)
+    assert curvature.ricci_scalar != 0
+
+    sphere.components = SymbolArray([[1, 0], [0, 1]])
+    assert Curvature.of(sphere) is not curvature
+    assert Curvature.of(sphere).ricci_scalar == 0
@@ -0,0 +1,77 @@
+import pytest
+from relativisticpy.symengine import Symbol
+from relativisticpy.gr.geodesics import GeodesicIntegrator, COMPLETED, TERMINATED, STALLED, horizon, turning_point
+from relativisticpy.gr.test.conftest import metric
+
+np = pytest.importorskip("numpy")
+
+UNITS = {Symbol("G"): 1, Symbol("M"): 1}
+
+
+@pytest.fixture(scope="module")
+def integrator(schwarzschild):
+    return GeodesicIntegrator(metric(*schwarzschild), UNITS)
+
+
+def circular(integrator, radius):
+    return integrator.state([0, radius, np.pi / 2, 0], [0, 0, np.sqrt(1 / radius**3) / np.sqrt(1 - 3 / radius)])
+
+
+@pytest.mark.parametrize("method, step", [("rk45", None), ("rk4", 0.5), ("midpoint", 0.5)])
+def test_circular_orbit_stays_circular(integrator, method, step):
+    solution = integrator.integrate(circular(integrator, 6.), 300., method=method, step=step)
+    assert solution.status[0] == COMPLETED
+    assert np.allclose(solution.states[:, 0, 1], 6., atol=1e-6)
+    assert solution.drift[0] < 1e-8
+
+
+def test_radial_infall_stops_at_horizon(integrator):
+    solution = integrator.integrate(integrator.state([0, 10, np.pi / 2, 0], [0, 0, 0]), 100., events=[horizon(2.)])
+    (geodesic, tau, state), = solution.events["horizon"]
+    assert solution.status[0] == TERMINATED and geodesic == 0
+    assert state[1] == pytest.approx(2.002) and solution.final[0][1] == pytest.approx(2.002)
+    # Proper time of the fall from rest at r0 to r: sqrt(r0^3 / 2M) (eta + sin(eta)) / 2 with r = r0 (1 + cos(eta)) / 2.
+    eta = np.arccos(2 * 2.002 / 10 - 1)
+    assert tau == pytest.approx(np.sqrt(10**3 / 2) * (eta + np.sin(eta)) / 2, rel=1e-6)
+
+
+def test_unconverged_midpoint_steps_stall(integrator):
+    # Steps of 50 M are too long for the fixed point iteration at r = 6 M, not at r = 20 M.
+    solution = integrator.integrate(np.vstack([circular(integrator, 6.), circular(integrator, 20.)]), 300., method="midpoint", step=50.)
+    assert list(solution.status) == [STALLED, COMPLETED]
+    assert solution.steps[0] < 6 and np.isfinite(solution.final).all()
+
+
+def test_batch_matches_single_geodesics(integrator):
+    x = np.tile([0., 0., np.pi / 2, 0.], (3, 1))
+    x[:, 1] = [12., 15., 20.]
+    spatial = np.zeros((3, 3))
+    spatial[:, 2] = 0.95 * np.sqrt(1 / x[:, 1]**3) / np.sqrt(1 - 3 / x[:, 1])
+    states = integrator.state(x, spatial)
+    batch = integrator.integrate(states, 400., events=[turning_point()], record=False)
+    for k in range(3):
+        single = integrator.integrate(states[k], 400., record=False)
+        assert np.allclose(batch.final[k], single.final[0]) and batch.steps[k] == single.steps[0]
+    # The orbits start at their apoapsis: radial turning points alternate between periapsis and apoapsis.
+    radii = [state[1] for geodesic, _, state in batch.events["turning_point"] if geodesic == 0]
+    assert len(radii) >= 2 and radii[0] < 12. and radii[1] == pytest.approx(12., rel=1e-4)
+
+
+def test_minkowski_geodesics_are_straight_lines():
+    t, x, y, z = [Symbol(s) for s in ("t", "x", "y", "z")]
+    integrator = GeodesicIntegrator(metric([[-1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]], [t, x, y, z]))
+    assert integrator.kernel.nonzero == ()
+    light = integrator.state([0, 0, 0, 0], [1, 0, 0], norm=0)
+    assert np.allclose(light, [0, 0, 0, 0, 1, 1, 0, 0])
+    solution = integrator.integrate(light, 5., method="rk4", step=1.)
+    assert np.allclose(solution.final[0], [5, 5, 0, 0, 1, 1, 0, 0])
+
+
+def test_invalid_integrations(schwarzschild, integrator):
+    with pytest.raises(ValueError):
+        GeodesicIntegrator(metric(*schwarzschild))
+    state = circular(integrator, 6.)
+    with pytest.raises(ValueError):
+        integrator.integrate(state, 10., method="euler")
+    with pytest.raises(ValueError):
+        integrator.integrate(state, 10., method="rk4")
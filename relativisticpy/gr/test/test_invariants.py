@@ -0,0 +1,50 @@
+import pytest
+from relativisticpy.core import Metric, MetricIndices, Idx
+from relativisticpy.symengine import Symbol, SymbolArray, sin, simplify
+from relativisticpy.gr import KScalar
+from relativisticpy.gr.curvature import Curvature
+from relativisticpy.gr.invariants import Invariants
+
+
+@pytest.fixture
+def sphere():
+    theta, phi = Symbol("theta"), Symbol("phi")
+    return Metric(MetricIndices(Idx('a'), Idx('b')), SymbolArray([[1, 0], [0, sin(theta)**2]]), [theta, phi])
+
+
+@pytest.fixture
+def schwarzschild():
+    t, r, theta, phi, G, M = [Symbol(s) for s in ("t", "r", "theta", "phi", "G", "M")]
+    f = 1 - 2 * G * M / r
+    return Metric(MetricIndices(Idx('a'), Idx('b')), SymbolArray([[-f, 0, 0, 0], [0, 1 / f, 0, 0], [0, 0, r**2, 0], [0, 0, 0, r**2 * sin(theta)**2]]), [t, r, theta, phi])
+
+
+def test_invariants_of_unit_sphere(sphere):
+    invariants = Invariants.of(sphere)
+    assert invariants.kretschmann == 4
+    assert invariants.ricci_squared == 2
+    assert invariants.weyl_squared == 0
+    assert invariants.gauss_bonnet == 0
+    with pytest.raises(ValueError):
+        invariants.chern_pontryagin
+
+
+def test_invariants_of_schwarzschild(schwarzschild):
+    G, M, r = Symbol("G"), Symbol("M"), Symbol("r")
+    invariants = Invariants.of(schwarzschild)
+    assert simplify(invariants.kretschmann - 48 * G**2 * M**2 / r**6) == 0
+    assert invariants.ricci_squared == 0
+    assert simplify(invariants.weyl_squared - invariants.kretschmann) == 0
+    assert simplify(invariants.gauss_bonnet - invariants.kretschmann) == 0
+    assert invariants.chern_pontryagin == 0
+    assert simplify(KScalar(schwarzschild, schwarzschild.basis).components - invariants.kretschmann) == 0
+
+
+def test_invariants_memoized_with_the_curvature_pipeline(sphere):
+    invariants = Invariants.of(sphere)
+    assert Invariants.of(sphere) is invariants
+    assert invariants.curvature is Curvature.of(sphere)
+
+    sphere.components = SymbolArray([[1, 0], [0, 1]])
+    assert Invariants.of(sphere) is not invariants
+    assert Invariants.of(sphere).kretschmann == 0
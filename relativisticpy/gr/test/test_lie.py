@@ -0,0 +1,58 @@
+import pytest
+from relativisticpy.core import EinsteinArray, Indices, Idx
+from relativisticpy.symengine import Symbol, Function, SymbolArray, sin, cos, tan, simplify
+from relativisticpy.gr import LieDerivative
+from relativisticpy.gr.killing import KillingVectors
+from relativisticpy.gr.test.conftest import metric
+
+
+def vector(components, basis):
+    return EinsteinArray(Indices(-Idx('a')), SymbolArray(components), SymbolArray(basis))
+
+
+def test_lie_derivative_of_metric_along_rotation(sphere):
+    theta, phi = sphere.basis
+    L = LieDerivative(vector([sin(phi), cos(phi) / tan(theta)], [theta, phi]))
+    assert (L * sphere).components == SymbolArray.zeros(2, 2)
+    assert 'jet' in sphere.derived # The derivatives of the metric were read from its jet.
+
+    dilation = LieDerivative(vector([theta, 0], [theta, phi]))
+    assert simplify((dilation * sphere).components - SymbolArray([[2, 0], [0, theta * sin(2 * theta)]])) == SymbolArray.zeros(2, 2)
+
+
+def test_lie_derivative_of_vector_is_the_bracket():
+    x, y = Symbol("x"), Symbol("y")
+    f = Function("f")(x, y)
+    L = LieDerivative(vector([x, y**2], [x, y]))
+    result = L * vector([f, x], [x, y])
+    assert str(result.indices) == "^{a}"
+    assert simplify(result.components - SymbolArray([x * f.diff(x) + y**2 * f.diff(y) - f, x - 2 * x * y])) == SymbolArray.zeros(2)
+    assert simplify(L * f - x * f.diff(x) - y**2 * f.diff(y)) == 0
+    with pytest.raises(ValueError):
+        LieDerivative(EinsteinArray(Indices(Idx('a')), SymbolArray([x, y]), SymbolArray([x, y])))
+
+
+def test_killing_vectors_of_sphere(sphere):
+    K = KillingVectors.of(sphere)
+    assert KillingVectors.of(sphere) is K and K.dimension == 3
+    assert K.cyclic == [Symbol("phi")]
+    for X in K.vectors:
+        assert simplify((LieDerivative(X) * sphere).components) == SymbolArray.zeros(2, 2)
+    # so(3): every bracket of two rotations is the third one, up to sign.
+    assert all([len(constants) == 1 and abs(list(constants.values())[0]) == 1 for constants in K.structure_constants.values()])
+
+
+def test_killing_vectors_of_minkowski():
+    t, x, y, z = [Symbol(s) for s in ("t", "x", "y", "z")]
+    K = KillingVectors(metric([[-1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]], [t, x, y, z]))
+    assert K.dimension == 10 # 4 translations, 3 boosts, 3 rotations.
+
+
+def test_killing_vectors_of_static_spherically_symmetric_metric():
+    t, r, theta, phi = [Symbol(s) for s in ("t", "r", "theta", "phi")]
+    A, B = Function("A")(r), Function("B")(r)
+    K = KillingVectors(metric([[-A, 0, 0, 0], [0, B, 0, 0], [0, 0, r**2, 0], [0, 0, 0, r**2 * sin(theta)**2]], [t, r, theta, phi]))
+    assert K.dimension == 4 and K.cyclic == [t, phi]
+    assert [list(X.components) for X in K.vectors][0] == [1, 0, 0, 0]
+    # The time translation commutes with the rotations.
+    assert all([constants == {} for (i, j), constants in K.structure_constants.items() if i == 0])
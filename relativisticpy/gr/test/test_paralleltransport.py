@@ -0,0 +1,51 @@
+import pytest
+from relativisticpy.symengine import Symbol
+from relativisticpy.gr.paralleltransport import ParallelTransport
+from relativisticpy.gr.raytracing import orthonormal_frame
+from relativisticpy.gr.test.conftest import metric
+
+np = pytest.importorskip("numpy")
+
+UNITS = {Symbol("G"): 1, Symbol("M"): 1}
+
+
+def test_holonomy_of_circles_of_latitude(sphere):
+    # Around the circle theta = theta0, a transported vector turns by 2 pi cos(theta0) relative to the orthonormal basis (e_theta, e_phi).
+    latitudes = np.array([0.3, 0.8, np.pi / 2])
+    transport = ParallelTransport(sphere, acceleration=lambda x, u: np.stack([-np.sin(x[:, 0]) * np.cos(x[:, 0]) * u[:, 1]**2, 0 * u[:, 1]], axis=1))
+    states = np.stack([latitudes, 0 * latitudes, 0 * latitudes, 1 + 0 * latitudes], axis=1)
+    solution = transport.integrate(transport.attach(states, np.tile([1., 0.], (3, 1))), 2 * np.pi, method="rk4", step=np.pi / 200)
+    x, V = solution.final[:, :2], transport.tensors(solution.final)[:, 0]
+    assert np.allclose(x[:, 0], latitudes) and np.allclose(x[:, 1], 2 * np.pi)
+    angle = np.arctan2(V[:, 1] * np.sin(latitudes), V[:, 0])
+    assert np.allclose(np.cos(angle), np.cos(2 * np.pi * np.cos(latitudes)), atol=1e-8)
+    assert np.allclose(np.sin(angle), -np.sin(2 * np.pi * np.cos(latitudes)), atol=1e-8)
+
+
+def test_tetrad_stays_orthonormal_along_geodesics(schwarzschild):
+    transport = ParallelTransport(metric(*schwarzschild), UNITS)
+    state = transport.state([[0, 12, np.pi / 2, 0], [0, 10, 1., 0]], [[0, 0, 0.03], [0, 0.025, 0.04]])
+    tetrads = np.stack([orthonormal_frame(transport.kernel, x) for x in state[:, :4]])
+    solution = transport.integrate(transport.attach(state, tetrads), 100.)
+    assert solution.final.shape == (2, 8 + 16)
+    for x, tetrad in zip(solution.final[:, :4], transport.tensors(solution.final)):
+        assert np.allclose(tetrad @ transport.kernel.metric(x[None])[0] @ tetrad.T, np.diag([-1., 1., 1., 1.]), atol=1e-7)
+    # The tangent of a geodesic is transported along it.
+    tangent = transport.integrate(transport.attach(state, state[:, 4:]), 100.)
+    assert np.allclose(transport.tensors(tangent.final)[:, 0], tangent.final[:, 4:8], atol=1e-7)
+
+
+def test_metric_is_transported_to_itself(schwarzschild):
+    transport = ParallelTransport(metric(*schwarzschild), UNITS, variance=(True, True))
+    state = transport.state([0, 10, np.pi / 2, 0], [0.05, 0, 0.03])
+    g = transport.kernel.metric(state[None, :4])
+    solution = transport.integrate(transport.attach(state, g), 50.)
+    assert np.allclose(transport.tensors(solution.final)[0, 0], transport.kernel.metric(solution.final[:, :4])[0], atol=1e-7)
+
+
+def test_invalid_transports(sphere):
+    transport = ParallelTransport(sphere, variance=(False, True))
+    with pytest.raises(ValueError):
+        transport.attach([0.5, 0, 0, 1], [1., 0., 0.])
+    with pytest.raises(ValueError):
+        transport.integrate(transport.attach([0.5, 0, 0, 1], np.eye(2)), 1., method="midpoint", step=0.1)
@@ -0,0 +1,53 @@
+import pytest
+from relativisticpy.core import Metric, MetricIndices, Idx
+from relativisticpy.symengine import Symbol, SymbolArray, sin
+from relativisticpy.gr.raytracing import RayTracer, Camera, CAPTURED, ESCAPED, orthonormal_frame
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture(scope="module")
+def tracer():
+    t, r, theta, phi, M = [Symbol(s) for s in ("t", "r", "theta", "phi", "M")]
+    f = 1 - 2 * M / r
+    components = SymbolArray([[-f, 0, 0, 0], [0, 1 / f, 0, 0], [0, 0, r**2, 0], [0, 0, 0, r**2 * sin(theta)**2]])
+    return RayTracer(Metric(MetricIndices(Idx('a'), Idx('b')), components, [t, r, theta, phi]), {M: 1}, horizon=2., escape=60.)
+
+
+def test_orthonormal_frame_of_static_observer(tracer):
+    kernel = tracer.integrator.kernel
+    x = np.array([0., 10., 1., 0.5])
+    frame = orthonormal_frame(kernel, x)
+    assert np.allclose(frame @ kernel.metric(x[None])[0] @ frame.T, np.diag([-1., 1., 1., 1.]))
+    assert np.allclose(frame[0], [1 / np.sqrt(1 - 2 / 10), 0, 0, 0])
+    with pytest.raises(ValueError):
+        orthonormal_frame(kernel, [0., 1.5, 1., 0.])
+
+
+def test_rays_are_null(tracer):
+    camera = Camera([0, 30., np.pi / 2, 0], resolution=(8, 6))
+    rays = tracer.rays(camera)
+    assert rays.shape == (48, 8)
+    assert np.allclose(tracer.integrator.kernel.norm(rays[:, :4], rays[:, 4:]), 0.)
+    with pytest.raises(ValueError):
+        tracer.rays(Camera([0, 80., np.pi / 2, 0]))
+
+
+def test_shadow_of_schwarzschild(tracer):
+    # Angular radius of the shadow seen by a static observer at r: sin(alpha) = 3 sqrt(3) M sqrt(1 - 2M / r) / r.
+    camera = Camera([0, 30., np.pi / 2, 0], resolution=(64, 1), field_of_view=0.8)
+    image = tracer.trace(camera)
+    assert image.status.shape == (1, 64) and set(np.unique(image.status)) == {CAPTURED, ESCAPED}
+    u = np.arctan((np.arange(64) + 0.5) / 64 * 2 * np.tan(0.4) - np.tan(0.4))
+    alpha = np.arcsin(3 * np.sqrt(3) * np.sqrt(1 - 2 / 30) / 30)
+    assert np.abs(u[image.shadow[0]]).max() == pytest.approx(alpha, abs=2 * np.tan(0.4) / 64)
+    assert np.allclose(image.final[image.status == ESCAPED][:, 1], 60.)
+
+
+def test_chunks_across_processes_into_memory_mapped_buffers(tracer, tmp_path):
+    camera = Camera([0, 20., np.pi / 2, 0], resolution=(8, 4), field_of_view=1.)
+    expected = tracer.trace(camera)
+    image = tracer.trace(camera, processes=2, chunk=10, output=str(tmp_path))
+    assert isinstance(image.status, np.memmap) and (tmp_path / "final.npy").exists()
+    assert np.array_equal(image.status, expected.status) and np.allclose(image.final, expected.final)
+    assert image.steps == expected.steps
@@ -0,0 +1,26 @@
+import pytest
+from relativisticpy.core import Metric, MetricIndices, Indices, Idx
+from relativisticpy.symengine import Symbol, SymbolArray, sin, simplify
+from relativisticpy.gr import Riemann
+
+
+@pytest.fixture
+def sphere():
+    theta, phi = Symbol("theta"), Symbol("phi")
+    return Metric(MetricIndices(Idx('a'), Idx('b')), SymbolArray([[1, 0], [0, sin(theta)**2]]), [theta, phi])
+
+
+def test_riemann_compact_components(sphere):
+    riemann = Riemann(Indices(Idx('a'), -Idx('b'), -Idx('c'), -Idx('d')), sphere)
+
+    assert riemann.compact is not None
+    assert len(riemann.compact.values) == 4 # Antisymmetric in the last two indices: 2 * 2 * 1
+    assert simplify(riemann.components[0, 1, 0, 1] - sin(Symbol("theta"))**2) == 0
+    assert riemann.components[0, 1, 1, 0] == -riemann.components[0, 1, 0, 1]
+
+
+def test_riemann0000_symmetries(sphere):
+    R = Riemann.riemann0000_components_from_metric(sphere)
+    assert len(R.values) == 1 # Single independent component in 2D
+    assert R[1, 0, 1, 0] == R[0, 1, 0, 1]
+    assert R[1, 0, 0, 1] == -R[0, 1, 0, 1]
@@ -0,0 +1,38 @@
+from relativisticpy.core import Indices, Idx
+from relativisticpy.core.symmetry import SymmetricComponents
+from relativisticpy.symengine import Symbol, Function, SymbolArray, simplify
+from relativisticpy.gr import Weyl
+from relativisticpy.gr.curvature import Curvature
+from relativisticpy.gr.test.conftest import metric
+
+
+def weyl(g):
+    return Weyl(Indices(Idx('a'), Idx('b'), Idx('c'), Idx('d')), g)
+
+
+def test_weyl_of_schwarzschild_from_cached_curvature(schwarzschild):
+    r, G, M = Symbol("r"), Symbol("G"), Symbol("M")
+    g = metric(*schwarzschild)
+    W = weyl(g)
+
+    assert W.compact is Curvature.of(g).weyl
+    assert isinstance(W.compact, SymmetricComponents) and len(W.compact.values) == 21
+    assert simplify(W.components[0, 1, 0, 1] + 2 * G * M / r**3) == 0
+    assert simplify(W.components[1, 0, 0, 1] - 2 * G * M / r**3) == 0
+
+
+def test_weyl_is_trace_free():
+    t, x, y, z = [Symbol(s) for s in ("t", "x", "y", "z")]
+    g = metric([[-1, 0, 0, x * y], [0, 1, 0, 0], [0, 0, 1, 0], [x * y, 0, 0, 1 + x**2]], [t, x, y, z])
+    C, ig = weyl(g).components, g.inv.components
+    for b in range(4):
+        for d in range(4):
+            assert simplify(sum([ig[a, c] * C[a, b, c, d] for a in range(4) for c in range(4)])) == 0
+
+
+def test_weyl_vanishes_for_conformally_flat_and_2d_metrics(sphere):
+    t, x, y, z = [Symbol(s) for s in ("t", "x", "y", "z")]
+    a = Function("a")(t)
+    flrw = metric([[-1, 0, 0, 0], [0, a**2, 0, 0], [0, 0, a**2, 0], [0, 0, 0, a**2]], [t, x, y, z])
+    assert weyl(flrw).components == SymbolArray.zeros(4, 4, 4, 4)
+    assert weyl(sphere).components == SymbolArray.zeros(2, 2, 2, 2)
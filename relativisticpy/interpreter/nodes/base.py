@@ -204,6 +204,24 @@ class BinaryNode(AstNode):
     def callback(self, value):
         self._callback = value
 
+    def execute_node(self, implementer: Implementer):
+        """ Chains of multiplications A * B * C * ... are collected and handed over as a whole, so the implementer can choose the evaluation order. """
+        if self.type != NodeType.MUL:
+            return super().execute_node(implementer)
+
+        if not hasattr(implementer, Implementer.mul_chain.__name__):
+            raise NotImplementedError(f"The object {type(implementer).__name__} does not have the method '{Implementer.mul_chain.__name__}()' required to implement the Node: {type(self).__name__}. ")
+        operands = [operand.execute_node(implementer) for operand in self.mul_chain_operands()]
+        return getattr(implementer, Implementer.mul_chain.__name__)(operands)
+
+    def mul_chain_operands(self) -> List[AstNode]:
+        """
+        The factors of the chain A * B * C * ... ending at this node, in the order they are written.
+        The parser drops the parentheses, so (A * B) * C is one chain of three factors: only right-nested groups, A * (B * C), stay single factors.
+        """
+        left, right = self.children
+        return (left.mul_chain_operands() if isinstance(left, BinaryNode) and left.type == NodeType.MUL else [left]) + [right]
+
     @property
     def left_child(self) -> AstNode:
         return self.args[0]
@@ -605,6 +623,9 @@ class TensorNode(
 
         if self.identifier == state.get_variable(Scope.DerivativeSymbol):
             return implementer.init_tensor_derivative(self)
+
+        if self.identifier == state.get_variable(Scope.CovariantDerivativeSymbol):
+            return implementer.init_tensor_covariant_derivative(self)
         
         # If this components of the tensor were set => We do not return anything. We only cache the object
         elif self.component_ast != None:
@@ -635,7 +656,7 @@ class TensorNode(
         state : ScopedState = self.get_state(implementer)
 
         # Place this within the init_tensor_indices method.
-        tensor_indices.basis = (
+        tensor_indices = tensor_indices.with_basis(
             state.get_variable(Scope.Coordinates)
         )  # Error handling needed => if no coordinates defined cannot continue
 
@@ -1,4 +1,4 @@
-from typing import Protocol, Any, Type
+from typing import Protocol, Any, Type, List
 from relativisticpy.interpreter.protocols.tensor import Tensor, Indices
 from relativisticpy.interpreter.protocols.state import State
 from relativisticpy.interpreter.protocols.nodes import TreeNodes
@@ -59,6 +59,10 @@ class Implementer(Protocol):
         "Based on the state of the Tensor node and the sate - we will initialize the indices of a tensor."
         ...
 
+    def init_tensor_covariant_derivative(self, node: TreeNodes) -> Tensor:
+        "Based on the state of the Tensor node and the sate - we will initialize the indices of a tensor."
+        ...
+
     def metric_dependent_types(self, tensor_key: str) -> Type[Tensor]:
         "Based on the state of the Tensor node and the sate - we will initialize the indices of a tensor."
         ...
@@ -128,6 +132,10 @@ class Implementer(Protocol):
     def mul(self, node: TreeNodes) -> Expression:
         ...
 
+    def mul_chain(self, operands: List[Expression]) -> Expression:
+        "Multiplies the factors of a whole chain A * B * C * ..., i.e. contracting tensors in the cheapest order."
+        ...
+
     def div(self, node: TreeNodes) -> Expression:
         ...
 
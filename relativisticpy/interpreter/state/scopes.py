@@ -42,6 +42,7 @@ class Scope:
     ConnectionSymbol = "ConnectionSymbol"
     RicciSymbol = "RicciSymbol"
     RiemannSymbol = "RiemannSymbol"
+    WeylSymbol = "WeylSymbol"
     DerivativeSymbol = "DerivativeSymbol"
     CovariantDerivativeSymbol = "CovariantDerivativeSymbol"
 
@@ -51,6 +52,7 @@ class Scope:
         "ConnectionSymbol" : "C",
         "RicciSymbol" : "Ric",
         "RiemannSymbol" : "R",
+        "WeylSymbol" : "W",
         "DerivativeSymbol" : "d",
         "CovariantDerivativeSymbol" : "D"
     }
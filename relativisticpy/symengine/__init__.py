@@ -13,7 +13,6 @@ from sympy import (
     LaplaceTransform,
     diff,
     integrate,
-    simplify,
     tensorproduct,
     symbols,
     residue,
@@ -39,6 +38,21 @@ from sympy import (
     dsolve,
     expand,
     latex,
+    lambdify,
+    cancel,
+    together,
+    trigsimp,
+    sympify,
+    srepr,
+    LeviCivita,
+    Matrix,
+    Mul,
+    Add,
+    linsolve,
+    Derivative,
+    cse,
+    numbered_symbols,
+    count_ops,
 
     # Series Source: https://docs.sympy.org/latest/modules/series/series.html
     limit,
@@ -97,6 +111,9 @@ from sympy import (
     ifft
 )
 from sympy import MutableDenseNDimArray as SymbolArray
-from .sympy import root
+from sympy import MutableSparseNDimArray as SparseSymbolArray
+from sympy.tensor.array import NDimArray, SparseNDimArray
+from sympy.functions.elementary.trigonometric import TrigonometricFunction
+from .sympy import root, simplify
 
 # Implement `function` - `constant` - `infinity`
@@ -1,7 +1,12 @@
 from sympy import MutableDenseNDimArray, Pow, Rational
+from sympy import simplify as _simplify
+from sympy.tensor.array import SparseNDimArray
 
 ### THE ONLY REASON THIS EXISTS IS BECAUSE OF Mojo Language, I wanted to reduce refactoring if we 
 
 def SymbolArray(*args, **kwargs) -> MutableDenseNDimArray: return MutableDenseNDimArray(*args, **kwargs)
 
-def root(arg, k: int, evaluate = None): return Pow(arg, Rational(1, k), evaluate=evaluate)
\ No newline at end of file
+def root(arg, k: int, evaluate = None): return Pow(arg, Rational(1, k), evaluate=evaluate)
+
+# sympy's simplify leaves the components of sparse arrays untouched => simplify the non-zero components one by one.
+def simplify(expr, *args, **kwargs): return expr.applyfunc(lambda component: _simplify(component, *args, **kwargs)) if isinstance(expr, SparseNDimArray) else _simplify(expr, *args, **kwargs)
@@ -1,5 +1,5 @@
 from typing import Tuple
-from operator import itemgetter
+from functools import lru_cache
 from itertools import product
 from typing import List
 from relativisticpy.typing import MetricType
@@ -29,72 +29,50 @@ def tensor_trace_product(a: SymbolArray, b: SymbolArray, trace: List[List[int]])
     Performs the tensor product by:
         1. Performing the tensor product.
         2. Taking the trace.
+
+    The summation plan is built once per (shapes, trace) and cached. Each resulting component streams over its contributing
+    pairs only: the full cartesian product of the indices of a and b is never materialized.
     """
     if len(trace) == 0:
         return tensorproduct(a, b)
 
-    shape_a = a.shape
-    shape_b = b.shape
-    new_shape = [
-        shape_a[0] for i in range(len(shape_b) + len(shape_a) - 2 * len(trace))
-    ]
-    summed_index_locations = transpose_list(trace)
-    all = (
-        [
-            (idxs[: len(a.shape)], idxs[len(a.shape) :])
-            for idxs in list(product(*[range(i) for i in a.shape + b.shape]))
-            if itemgetter(*summed_index_locations[0])(idxs[: len(a.shape)])
-            == itemgetter(*summed_index_locations[1])(idxs[len(a.shape) :])
-        ]
-        if len(summed_index_locations) > 0
-        else [
-            (idxs[: len(a.shape)], idxs[len(a.shape) :])
-            for idxs in list(product(*[range(i) for i in a.shape + b.shape]))
-        ]
-    )
-
-    result_indices = [i for i in range(len(shape_a) + len(shape_b) - 2 * len(trace))]
-    res_a_indices = [
-        i for i in range(len(shape_a)) if i not in summed_index_locations[0]
-    ]
-    res_b_indices = [
-        i for i in range(len(shape_b)) if i not in summed_index_locations[1]
-    ]
-
-    def generator(idx):
-        if not len(res_a_indices) == 0 and not len(res_b_indices) == 0:
-            return [
-                (IndicesA, IndicesB)
-                for (IndicesA, IndicesB) in all
-                if itemgetter(*res_a_indices)(IndicesA)
-                == itemgetter(*result_indices[: len(res_a_indices)])(idx)
-                and itemgetter(*res_b_indices)(IndicesB)
-                == itemgetter(*result_indices[len(res_a_indices) :])(idx)
-            ]
-        elif len(res_a_indices) == 0 and not len(res_b_indices) == 0:
-            return [
-                (IndicesA, IndicesB)
-                for (IndicesA, IndicesB) in all
-                if itemgetter(*res_b_indices)(IndicesB)
-                == itemgetter(*result_indices[: len(res_b_indices)])(idx)
-            ]
-        elif len(res_b_indices) == 0 and not len(res_a_indices) == 0:
-            return [
-                (IndicesA, IndicesB)
-                for (IndicesA, IndicesB) in all
-                if itemgetter(*res_a_indices)(IndicesA)
-                == itemgetter(*result_indices[: len(res_a_indices)])(idx)
-            ]
-        else:
-            return [(IndicesA, IndicesB) for IndicesA, IndicesB in all]
-
-    func = lambda idcs: sum([a[i] * b[j] for i, j in generator(idcs)])
-    zeros = SymbolArray.zeros(*new_shape)
-
-    for i in list(product(*[range(i) for i in new_shape])):
-        zeros[i] = func(i)
-
-    return zeros
+    from relativisticpy.core.plans import flatten_components # relativisticpy.core imports this module.
+
+    shape, bases, summed = _trace_product_plan(tuple(a.shape), tuple(b.shape), tuple([tuple(pair) for pair in trace]))
+    flat_a, flat_b = flatten_components(a), flatten_components(b)
+    result = SymbolArray.zeros(*shape)
+    flat_res = result._array
+    for res, (base_a, base_b) in enumerate(bases):
+        flat_res[res] = sum([flat_a[base_a + da] * flat_b[base_b + db] for da, db in summed])
+    return result
+
+
+@lru_cache(maxsize=256)
+def _trace_product_plan(shape_a: Tuple[int, ...], shape_b: Tuple[int, ...], trace: Tuple[Tuple[int, int], ...]):
+    """
+    Summation plan of tensor_trace_product:
+        shape: shape of the result (the free positions of a followed by the free positions of b).
+        bases: for each resulting flat offset, the flat offsets in a and b of its free positions.
+        summed: the (a, b) flat offsets added on top of the bases by each value of the traced positions.
+    Memory is bounded by the size of the result.
+    """
+    from relativisticpy.core.plans import strides # relativisticpy.core imports this module.
+
+    strides_a, strides_b = strides(shape_a), strides(shape_b)
+    traced_a, traced_b = [i for i, _ in trace], [j for _, j in trace]
+    free_a = [i for i in range(len(shape_a)) if i not in traced_a]
+    free_b = [j for j in range(len(shape_b)) if j not in traced_b]
+
+    shape = tuple([shape_a[i] for i in free_a] + [shape_b[j] for j in free_b])
+    bases = tuple([
+        (sum([idx * strides_a[i] for idx, i in zip(position, free_a)]), sum([idx * strides_b[j] for idx, j in zip(position[len(free_a):], free_b)]))
+        for position in product(*[range(dim) for dim in shape])
+    ])
+    summed = tuple([
+        (sum([v * strides_a[i] for v, (i, _) in zip(values, trace)]), sum([v * strides_b[j] for v, (_, j) in zip(values, trace)]))
+        for values in product(*[range(shape_a[i]) for i, _ in trace])
+    ])
+    return shape, bases, summed
 
 
 def connection_components_from_metric(metric: MetricType):
@@ -159,17 +137,23 @@ def ricci_scalar(metric: MetricType):
 
 def kscalar_from_metric(metric: MetricType):
     """
-    Warning: Very Slow! Indirect claculation with too many for loops.
+    R_{a}_{b}_{c}_{d} R^{a}^{b}^{c}^{d}, with the Riemann tensor raised one index at a time: O(N^5) instead of the O(N^8) contraction.
+    See relativisticpy.gr.invariants for the cached O(N^4) version.
     """
     N = metric.dimention
     R = riemann0000_components_from_metric(metric)
     ig = metric.inv.components
-    A = float()
-    for i, j, k, p, d, n, s, t in product(
-        range(N), range(N), range(N), range(N), range(N), range(N), range(N), range(N)
-    ):
-        A += ig[i, j] * ig[k, p] * ig[d, n] * ig[s, t] * R[i, k, d, s] * R[j, p, d, s]
-    return simplify(A)
+    A = R
+    for position in range(4):
+        # Raises the index at position: A^{..a..} = g^{a}^{e} A_{..e..}
+        raised = SymbolArray(zeros(N**4), (N, N, N, N))
+        for indices in product(range(N), repeat=4):
+            for e in range(N):
+                if ig[indices[position], e] != 0:
+                    lowered = indices[:position] + (e,) + indices[position + 1:]
+                    raised[indices] += ig[indices[position], e] * A[lowered]
+        A = raised
+    return simplify(sum([R[indices] * A[indices] for indices in product(range(N), repeat=4)]))
 
 
 ######### DEPRICATED ########
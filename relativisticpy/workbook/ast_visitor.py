@@ -1,8 +1,9 @@
 from dataclasses import dataclass
+from functools import reduce
 from typing import List
 
-from relativisticpy.core import EinsteinArray, Indices, Metric, MetricIndices, Idx
-from relativisticpy.gr import RicciScalar, MetricScalar, Ricci, Riemann, Connection, Derivative, EinsteinTensor
+from relativisticpy.core import EinsteinArray, Indices, Metric, MetricIndices, Idx, IndexSignature, contract
+from relativisticpy.gr import RicciScalar, MetricScalar, Ricci, Riemann, Connection, Derivative, CovDerivative, EinsteinTensor, Weyl
 
 from relativisticpy.interpreter.protocols import Implementer
 from relativisticpy.interpreter import ScopedState
@@ -78,6 +79,7 @@ class RelPyAstNodeTraverser(Implementer):
     def neg(self, node: AstNode): return -node.args[0]
     def pos(self, node: AstNode): return +node.args[0]
     def mul(self, node: AstNode): return node.args[0] * node.args[1]
+    def mul_chain(self, operands: List): return contract(*operands) if all([isinstance(operand, EinsteinArray) for operand in operands]) else reduce(lambda a, b: a * b, operands)
     def div(self, node: AstNode): return node.args[0] / node.args[1]
     def pow(self, node: AstNode): return node.args[0] ** node.args[1]
     def int(self, node: AstNode): return int("".join(node.args))
@@ -192,16 +194,17 @@ class RelPyAstNodeTraverser(Implementer):
             self.state.get_variable("EinsteinTensorSymbol"): EinsteinTensor,
             self.state.get_variable("ConnectionSymbol"): Connection,
             self.state.get_variable("RiemannSymbol"): Riemann,
-            self.state.get_variable("CovariantDerivativeSymbol"): RelPyError
+            self.state.get_variable("WeylSymbol"): Weyl,
+            self.state.get_variable("CovariantDerivativeSymbol"): CovDerivative
         }
         return types_map[tensor_key] if tensor_key in types_map else None
 
     def init_indices(self, node: AstNode):
-        if not self.state.get_variable("MetricSymbol") == node.identifier:
-            indices = node.indices.indices
-            return Indices(*[Idx(symbol=idx.identifier, values=idx.values) if idx.covariant else -Idx(symbol=idx.identifier, values=idx.values) for idx in indices])
         indices = node.indices.indices
-        return MetricIndices(*[Idx(symbol=idx.identifier, values=idx.values) if idx.covariant else -Idx(symbol=idx.identifier, values=idx.values) for idx in indices])
+        cls = Indices if not self.state.get_variable("MetricSymbol") == node.identifier else MetricIndices
+        if all([idx.values == None or isinstance(idx.values, int) for idx in indices]): # Interned signature => the built indices are shared across uses.
+            return IndexSignature(tuple([(idx.identifier, idx.covariant, idx.values) for idx in indices])).indices(cls, self.state.get_variable("Coordinates"))
+        return cls(*[Idx(symbol=idx.identifier, values=idx.values) if idx.covariant else -Idx(symbol=idx.identifier, values=idx.values) for idx in indices])
 
     def init_metric_tensor(self, indices: Indices, components: SymbolArray, basis: SymbolArray) -> Metric:
         "Based on the state of the Tensor node and the sate - we will initialize the indices of a tensor."
@@ -226,4 +229,8 @@ class RelPyAstNodeTraverser(Implementer):
     def init_tensor_derivative(self, node: AstNode) -> Derivative:
         "Based on the state of the Tensor node and the sate - we will initialize the indices of a tensor."
         basis = self.state.get_variable("Coordinates")
-        return Derivative(self.init_indices(node), basis)
\ No newline at end of file
+        return Derivative(self.init_indices(node), basis)
+
+    def init_tensor_covariant_derivative(self, node: AstNode) -> CovDerivative:
+        "Based on the state of the Tensor node and the sate - we will initialize the indices of a tensor."
+        return CovDerivative(self.init_indices(node), self.state.metric_tensor)
\ No newline at end of file
@@ -93,7 +93,6 @@ def test_basic_tensor_component_generations_symbols():
     assert str(res.indices) == "_{a}_{b}"
 
 
-@pytest.mark.skip(reason="TDD =====> Implement TODO: Covariant Derivative <======== ")
 def test_covariant_derivative_metric_mapping(
     Schwarzschild_Basis
 ):
@@ -133,3 +132,24 @@ def test_tensor_multiplication_with_scalar(
     assert str(res.components) == '[[(2*G*M/r - 1)*f(x), 0, 0, 0], [0, f(x)/(-2*G*M/r + 1), 0, 0], [0, 0, r**2*f(x), 0], [0, 0, 0, r**2*f(x)*sin(theta)**2]]'
     assert str(res.indices) == "_{a}_{b}"
     assert str(res.basis) == '[t, r, theta, phi]'
+
+
+@pytest.mark.parametrize("operator", ["d", "D"])
+def test_operator_chains_evaluate_left_to_right(operator):
+    # The chain evaluates left to right, (d_{c} A) B: the contraction path search does not reorder it into d_{c} (A B).
+    r = smp.symbols("r")
+    definitions = """
+                    Coordinates := [t, r, theta, phi]
+                    g_{mu}_{nu} := [[-1, 0, 0, 0], [0, 1, 0, 0], [0, 0, r**2, 0], [0, 0, 0, r**2 * sin(theta)**2]]
+                    A_{a}_{b} := [[1, 0, 0, 0], [0, r**2, 0, 0], [0, 0, r, 0], [0, 0, 0, 1]]
+                    B^{b} := [r, 1, 0, 0]
+    """
+    zeros = smp.MutableDenseNDimArray.zeros(4, 4)
+    chain = Workbook().expr(definitions + f"{operator}_{{c}} * A_{{a}}_{{b}} * B^{{b}}")
+    right_nested = Workbook().expr(definitions + f"{operator}_{{c}} * (A_{{a}}_{{b}} * B^{{b}})")
+    expected = Workbook().expr(definitions + f"{operator}_{{c}} * A_{{a}}_{{b}}") * Workbook().expr(definitions + "B^{b}")
+    assert str(chain.indices) == str(expected.indices) == "_{c}_{a}"
+    assert smp.simplify(chain.components - expected.components) == zeros
+    assert smp.simplify(chain.components - right_nested.components) != zeros
+    if operator == "d":
+        assert chain.components == smp.MutableDenseNDimArray([[0, 0, 0, 0], [0, 2 * r, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]])
@@ -44,4 +44,26 @@ def workbook_setup():
 def test_calculus_basic(workbook_setup, calculus_basic_result):
     wb = workbook_setup
     result = calculus_basic_result
-    assert wb.exe("relativisticpy/workbook/tests/gr_test_scripts/calculus_basic.txt")[0] == result
\ No newline at end of file
+    assert wb.exe("relativisticpy/workbook/tests/gr_test_scripts/calculus_basic.txt")[0] == result
+
+
+def test_simplification_policy_per_session():
+    script = """
+        Coordinates := [t, r, theta, phi]
+        g_{mu}_{nu} := [[-(1 - (2 * G * M) / (r)), 0, 0, 0],[0, 1 / (1 - (2 * G * M) / (r)), 0, 0],[0, 0, r**2, 0],[0, 0, 0, r**2 * sin(theta) ** 2]]
+        Ric_{a}_{b}
+    """
+    unsimplified = Workbook(simplification="none").expr(script)
+    zeros = SymbolArray.zeros(4, 4)
+    assert unsimplified.components != zeros
+    assert simplify(unsimplified.components) == zeros
+    assert Workbook().expr(script).components == zeros
+
+
+def test_weyl_tensor():
+    script = """
+        Coordinates := [t, r, theta, phi]
+        g_{mu}_{nu} := [[-(1 - (2 * G * M) / (r)), 0, 0, 0],[0, 1 / (1 - (2 * G * M) / (r)), 0, 0],[0, 0, r**2, 0],[0, 0, 0, r**2 * sin(theta) ** 2]]
+        W_{a:0}_{b:1}_{c:0}_{f:1}
+    """
+    assert simplify(Workbook().expr(script) + 2 * Symbol("G") * Symbol("M") / Symbol("r") ** 3) == 0
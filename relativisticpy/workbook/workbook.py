@@ -1,6 +1,8 @@
 import re
 import json
+from typing import Union
 
+from relativisticpy.core.simplification import Simplifier, using
 from relativisticpy.interpreter import RelParser
 from relativisticpy.workbook.ast_visitor import RelPyAstNodeTraverser
 
@@ -9,9 +11,19 @@ class Workbook:
 
 
 
-    def __init__(self, file_path: str = None):
+    def __init__(self, file_path: str = None, simplification: Union[Simplifier, str] = None):
         self.file_path = file_path
         self.interpreter = RelParser( RelPyAstNodeTraverser() )
+        self.simplification = simplification
+
+    @property
+    def simplification(self) -> Simplifier:
+        """ Simplification policy of the tensor computations of this session: i.e. Simplifier('cancel', timeout=5, processes=4). """
+        return self._simplification
+
+    @simplification.setter
+    def simplification(self, value: Union[Simplifier, str, None]) -> None:
+        self._simplification = Simplifier(value) if isinstance(value, str) else value if value != None else Simplifier()
 
     def markdown(self, path: str):
         # Step 1: Read the markdown content
@@ -36,7 +48,8 @@ class Workbook:
         return modified_content
 
     def expr(self, string: str):
-        result = self.interpreter.exe(string)
+        with using(self.simplification):
+            result = self.interpreter.exe(string)
         if isinstance(result, list):
             if len(result) == 1:
                 return result[0].value
@@ -46,7 +59,8 @@ class Workbook:
             return result
 
     def exe(self, string: str):
-        result = self.interpreter.exe(string)
+        with using(self.simplification):
+            result = self.interpreter.exe(string)
         if isinstance(result, list):
             if len(result) == 1:
                 return result[0].value